@@ -91,10 +91,9 @@ class BulkSyncRunner:
     def check_api_health(self) -> bool:
         """Check if OpenF1 API is accessible."""
         try:
-            client = OpenF1Client()
-            # Try to fetch current year meetings as health check
-            client.get_meetings(CURRENT_YEAR)
-            client.close()
+            with OpenF1Client() as client:
+                # Try to fetch current year meetings as health check
+                client.get_meetings(CURRENT_YEAR)
             logger.info("✅ OpenF1 API is accessible")
             return True
         except OpenF1ApiError as e:
@@ -1,13 +1,21 @@
 """OpenF1 API client for fetching F1 data."""
 
+import hashlib
+import importlib.util
+import json
 import logging
+import os
+import re
+import threading
 import time
-from datetime import datetime
+from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
 import httpx  # type: ignore
 import structlog  # type: ignore
-from pydantic import BaseModel  # type: ignore
+from pydantic import BaseModel, TypeAdapter, field_validator, model_validator  # type: ignore
+from pydantic_core import from_json  # type: ignore
 from tenacity import (  # type: ignore
     retry,
     retry_if_exception_type,
@@ -60,6 +68,14 @@ class OpenF1Session(BaseModel):
     circuit_key: int | None = None
     location: str | None = None
 
+    @field_validator("date_start", "date_end")
+    @classmethod
+    def _assume_utc(cls, value: datetime | None) -> datetime | None:
+        """OpenF1 times are UTC; attach the zone to any naive timestamp at parse time."""
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=UTC)
+        return value
+
 
 class OpenF1Meeting(BaseModel):
     """Meeting (race weekend) data from OpenF1 API."""
@@ -146,6 +162,115 @@ class OpenF1SessionResult(BaseModel):
     duration: float | list[float | None] | None = None  # Best lap time or total race time (can be array for quali Q1/Q2/Q3)
     gap_to_leader: float | str | list[float | str | None] | None = None  # Seconds or "+N LAP(S)" (can be array for quali)
     number_of_laps: int | None = None
+    best_time_ms: int | None = None  # Derived from duration at parse time
+
+    @model_validator(mode="after")
+    def _derive_best_time(self) -> "OpenF1SessionResult":
+        """Resolve the duration shape once: the last set Q time for qualifying, else the scalar."""
+        duration = self.duration
+        if isinstance(duration, list):
+            duration = next((t for t in reversed(duration) if t is not None), None)
+        self.best_time_ms = int(duration * 1000) if duration is not None else None
+        return self
+
+
+# List validators: pydantic-core validates a whole response in one call
+# instead of one Python-level model construction per item
+_SESSION_LIST = TypeAdapter(list[OpenF1Session])
+_MEETING_LIST = TypeAdapter(list[OpenF1Meeting])
+_DRIVER_LIST = TypeAdapter(list[OpenF1Driver])
+_POSITION_LIST = TypeAdapter(list[OpenF1Position])
+_LAP_LIST = TypeAdapter(list[OpenF1Lap])
+_STINT_LIST = TypeAdapter(list[OpenF1Stint])
+_SESSION_RESULT_LIST = TypeAdapter(list[OpenF1SessionResult])
+
+
+# HTTP/2 lets concurrent requests share one connection; httpx needs the
+# optional h2 package for it (installed via the httpx[http2] extra)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+# Cache-Control max-age, which overrides the configured TTL for an entry
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+class _ResponseCache:
+    """Cache of OpenF1 JSON responses, on disk or in memory.
+
+    Each entry stores the decoded body with its ETag/Last-Modified
+    validators, so stale entries can be revalidated with a conditional
+    request instead of downloaded again. Without a directory, entries are
+    kept in memory, and only when they can be revalidated or have a max-age
+    (the oldest are dropped past MEMORY_ENTRIES).
+    """
+
+    MEMORY_ENTRIES = 256
+
+    def __init__(self, directory: Path | None, ttl_seconds: int) -> None:
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self._memory: dict[str, dict[str, Any]] = {}
+        # Prefetch workers and the main thread store entries concurrently
+        self._memory_lock = threading.Lock()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key_for(self, endpoint: str, params: dict[str, Any] | None) -> str:
+        """Cache key for an endpoint + query."""
+        key = json.dumps([endpoint, sorted((params or {}).items())], default=str)
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """Read a cache entry, or None if missing or unreadable."""
+        if self.directory is None:
+            with self._memory_lock:
+                return self._memory.get(key)
+        try:
+            with open(self.directory / f"{key}.json", encoding="utf-8") as f:
+                return json.load(f)  # type: ignore[no-any-return]
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, entry: dict[str, Any]) -> bool:
+        """Whether an entry is within its max-age, or the TTL if it had none."""
+        max_age = entry.get("max_age")
+        ttl = self.ttl_seconds if max_age is None else max_age
+        return time.time() - entry.get("stored_at", 0) < ttl
+
+    def store(self, key: str, data: Any, headers: httpx.Headers | None = None) -> None:
+        """Write a cache entry (atomically on disk; concurrent fetches may share a key)."""
+        cache_control = headers.get("Cache-Control") if headers else None
+        max_age = _MAX_AGE_RE.search(cache_control) if isinstance(cache_control, str) else None
+        entry = {
+            "stored_at": time.time(),
+            "etag": headers.get("ETag") if headers else None,
+            "last_modified": headers.get("Last-Modified") if headers else None,
+            "max_age": int(max_age.group(1)) if max_age else None,
+            "data": data,
+        }
+        if self.directory is None:
+            if entry["etag"] or entry["last_modified"] or entry["max_age"]:
+                with self._memory_lock:
+                    self._memory.pop(key, None)
+                    self._memory[key] = entry
+                    if len(self._memory) > self.MEMORY_ENTRIES:
+                        self._memory.pop(next(iter(self._memory)), None)
+            return
+        path = self.directory / f"{key}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.{id(entry)}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def validators(entry: dict[str, Any]) -> dict[str, str]:
+        """Conditional request headers for revalidating an entry."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
 
 
 class OpenF1Client:
@@ -157,12 +282,42 @@ class OpenF1Client:
     Never expose raw results without spoiler protection.
     """
 
-    def __init__(self, base_url: str | None = None) -> None:
+    def __init__(
+        self,
+        base_url: str | None = None,
+        cache_dir: str | Path | None = None,
+    ) -> None:
         self.base_url = base_url or settings.openf1_base_url
+        # One long-lived client per OpenF1Client, so every request reuses a
+        # pooled keep-alive connection instead of a new TCP + TLS handshake.
+        # Idle connections are kept for a minute (httpx defaults to 5s), which
+        # spans the gaps while a meeting's data is written to the database.
+        # The transport retries failed connection attempts; HTTP-level
+        # retries (429/5xx) are handled by _request. With HTTP/2 the parallel
+        # prefetches multiplex over that connection instead of opening more.
         self._client = httpx.Client(
             base_url=self.base_url,
-            timeout=30.0,
+            timeout=httpx.Timeout(30.0, connect=5.0),
             headers={"User-Agent": "ParcFerme-Ingestion/0.1.0"},
+            transport=httpx.HTTPTransport(
+                http2=_HTTP2_AVAILABLE,
+                retries=3,
+                limits=httpx.Limits(
+                    max_connections=16,
+                    max_keepalive_connections=8,
+                    keepalive_expiry=60.0,
+                ),
+            ),
+        )
+
+        # Response cache: on disk when a directory is configured, otherwise in
+        # memory with no TTL, so every repeat request is revalidated with a
+        # conditional GET (unless the response carried a Cache-Control max-age)
+        cache_dir = cache_dir or settings.openf1_cache_dir
+        self._cache = (
+            _ResponseCache(Path(cache_dir), settings.openf1_cache_ttl_seconds)
+            if cache_dir
+            else _ResponseCache(None, ttl_seconds=0)
         )
 
     def close(self) -> None:
@@ -190,7 +345,12 @@ class OpenF1Client:
         before_sleep=before_sleep_log(logger, logging.WARNING),
         reraise=True,
     )
-    def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+    def _request(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
         """Make a GET request with exponential backoff retry logic.
         
         Retries on:
@@ -202,9 +362,15 @@ class OpenF1Client:
         - Connection errors (network issues)
         """
         try:
-            response = self._client.get(endpoint, params=params)
+            if headers:
+                response = self._client.get(endpoint, params=params, headers=headers)
+            else:
+                response = self._client.get(endpoint, params=params)
+            # A 304 answers a conditional request; raise_for_status treats it as an error
+            if response.status_code == 304 and headers:
+                return response
             response.raise_for_status()
-            return response.json()  # type: ignore[no-any-return]
+            return response
         except httpx.HTTPStatusError as e:
             status = e.response.status_code
             if status == 429:
@@ -253,6 +419,38 @@ class OpenF1Client:
                 "OpenF1 API request timed out. The service may be slow or unavailable.",
             ) from e
 
+    @staticmethod
+    def _is_historical(params: dict[str, Any] | None) -> bool:
+        """Whether a query only covers completed seasons (whose data never changes)."""
+        year = (params or {}).get("year")
+        return isinstance(year, int) and year < datetime.now(UTC).year
+
+    def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        """GET a JSON endpoint, going through the response cache.
+
+        Bodies are decoded with pydantic-core's Rust JSON parser, which is
+        roughly twice as fast as the stdlib decoder behind Response.json().
+
+        Past seasons are served from the cache indefinitely. Other queries are
+        served while within their max-age or the TTL, then revalidated with a
+        conditional request (a 304 refreshes the entry without downloading it
+        again).
+        """
+        key = self._cache.key_for(endpoint, params)
+        entry = self._cache.load(key)
+        if entry is not None and (self._is_historical(params) or self._cache.is_fresh(entry)):
+            return entry["data"]  # type: ignore[no-any-return]
+
+        headers = self._cache.validators(entry) if entry is not None else None
+        response = self._request(endpoint, params, headers)
+        if response.status_code == 304 and entry is not None:
+            self._cache.store(key, entry["data"], response.headers)
+            return entry["data"]  # type: ignore[no-any-return]
+
+        data = from_json(response.content)
+        self._cache.store(key, data, response.headers)
+        return data  # type: ignore[no-any-return]
+
     def health_check(self) -> dict[str, Any]:
         """Check if the OpenF1 API is available and responsive.
 
@@ -312,7 +510,7 @@ class OpenF1Client:
             params["session_type"] = session_type
 
         data = self._get("/sessions", params)
-        return [OpenF1Session(**item) for item in data]
+        return _SESSION_LIST.validate_python(data)
 
     def get_meetings(self, year: int) -> list[OpenF1Meeting]:
         """Get all meetings (race weekends) for a year.
@@ -320,7 +518,7 @@ class OpenF1Client:
         Use meeting_key to correlate sessions to a single weekend.
         """
         data = self._get("/meetings", params={"year": year})
-        return [OpenF1Meeting(**item) for item in data]
+        return _MEETING_LIST.validate_python(data)
 
     def get_meeting(self, meeting_key: int) -> OpenF1Meeting | None:
         """Get a specific meeting by its key."""
@@ -343,7 +541,7 @@ class OpenF1Client:
     def get_sessions_for_meeting(self, meeting_key: int) -> list[OpenF1Session]:
         """Get all sessions for a specific meeting."""
         data = self._get("/sessions", params={"meeting_key": meeting_key})
-        return [OpenF1Session(**item) for item in data]
+        return _SESSION_LIST.validate_python(data)
 
     def get_drivers(self, session_key: int) -> list[OpenF1Driver]:
         """Get all drivers participating in a session.
@@ -352,7 +550,7 @@ class OpenF1Client:
         Use this to build the Entrant records linking drivers to teams.
         """
         data = self._get("/drivers", params={"session_key": session_key})
-        return [OpenF1Driver(**item) for item in data]
+        return _DRIVER_LIST.validate_python(data)
 
     def get_drivers_for_meeting(self, meeting_key: int) -> list[OpenF1Driver]:
         """Get all unique drivers for a meeting (race weekend).
@@ -363,8 +561,7 @@ class OpenF1Client:
         # Deduplicate by driver_number (same driver may appear multiple times)
         seen: set[int] = set()
         unique_drivers: list[OpenF1Driver] = []
-        for item in data:
-            driver = OpenF1Driver(**item)
+        for driver in _DRIVER_LIST.validate_python(data):
             if driver.driver_number not in seen:
                 seen.add(driver.driver_number)
                 unique_drivers.append(driver)
@@ -378,7 +575,7 @@ class OpenF1Client:
         can be determined by taking the last entry per driver.
         """
         data = self._get("/position", params={"session_key": session_key})
-        return [OpenF1Position(**item) for item in data]
+        return _POSITION_LIST.validate_python(data)
 
     def get_final_positions(self, session_key: int) -> dict[int, int]:
         """Get the final position for each driver in a session.
@@ -401,7 +598,7 @@ class OpenF1Client:
         if driver_number is not None:
             params["driver_number"] = driver_number
         data = self._get("/laps", params=params)
-        return [OpenF1Lap(**item) for item in data]
+        return _LAP_LIST.validate_python(data)
 
     def get_fastest_lap_driver(self, session_key: int) -> int | None:
         """Get the driver number who set the fastest lap in a session.
@@ -427,7 +624,7 @@ class OpenF1Client:
         if driver_number is not None:
             params["driver_number"] = driver_number
         data = self._get("/stints", params=params)
-        return [OpenF1Stint(**item) for item in data]
+        return _STINT_LIST.validate_python(data)
 
     def get_session_results(self, session_key: int) -> list[OpenF1SessionResult]:
         """Get session results (beta endpoint).
@@ -445,12 +642,27 @@ class OpenF1Client:
         """
         try:
             data = self._get("/session_result", params={"session_key": session_key})
-            return [OpenF1SessionResult(**item) for item in data]
+            return _SESSION_RESULT_LIST.validate_python(data)
         except OpenF1ApiError as e:
             # Beta endpoint may not be available for all sessions
             logger.debug("Session results not available", session_key=session_key, error=e.message)
             return []
 
+    def get_session_results_for_meeting(self, meeting_key: int) -> list[OpenF1SessionResult]:
+        """Get session results for every session of a meeting in one request.
+
+        ⚠️ SPOILER DATA - Contains race results.
+
+        Same beta endpoint as get_session_results, filtered by meeting_key.
+        Returns an empty list if the endpoint is unavailable.
+        """
+        try:
+            data = self._get("/session_result", params={"meeting_key": meeting_key})
+            return _SESSION_RESULT_LIST.validate_python(data)
+        except OpenF1ApiError as e:
+            logger.debug("Session results not available", meeting_key=meeting_key, error=e.message)
+            return []
+
 
 # Example usage
 if __name__ == "__main__":
@@ -36,6 +36,8 @@ class Settings(BaseSettings):
 
     # OpenF1 API
     openf1_base_url: str = "https://api.openf1.org/v1"
+    openf1_cache_dir: str | None = None  # On-disk response cache; disabled when unset
+    openf1_cache_ttl_seconds: int = 3600  # Before current-season responses are revalidated
 
     # Logging
     log_level: str = "INFO"
@@ -26,7 +26,9 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 
 import structlog  # type: ignore
+from rapidfuzz.distance import Levenshtein
 
+from ingestion.matching.normalization import normalize_name
 from ingestion.models import Driver, DriverAlias, Team, TeamAlias, Series, SeriesAlias, Circuit, CircuitAlias, slugify
 
 if TYPE_CHECKING:
@@ -34,6 +36,96 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+
+# Core constructor names shared across sponsorship/branding variations
+_TEAM_CORE_NAMES = (
+    "redbull",
+    "mercedes",
+    "ferrari",
+    "mclaren",
+    "astonmartin",
+    "alpine",
+    "williams",
+    "haas",
+    "sauber",
+    "alphatauri",
+    "tororosso",
+)
+
+
+@lru_cache(maxsize=8192)
+def _compact_slug(slug: str) -> str:
+    """Strip a slug down to [a-z0-9] for fuzzy comparison (cached per slug)."""
+    return _NON_ALNUM_RE.sub("", slug)
+
+
+class _FuzzySlugIndex:
+    """Compact slugs of cached entities, blocked by length for fuzzy matching.
+
+    Two strings can only be within N edits if their lengths differ by at
+    most N, so the edit-distance scorer only sees the matching length
+    buckets instead of every cached slug.
+    """
+
+    __slots__ = ("compact", "slugs", "_by_length")
+
+    def __init__(self) -> None:
+        self.compact: list[str] = []  # compact slugs, in insertion order
+        self.slugs: list[str] = []  # cache slug for each compact slug
+        self._by_length: dict[int, list[int]] = {}  # length -> indexes
+
+    def add(self, slug: str) -> None:
+        """Index a newly cached slug."""
+        compact = _compact_slug(slug)
+        self._by_length.setdefault(len(compact), []).append(len(self.compact))
+        self.compact.append(compact)
+        self.slugs.append(slug)
+
+    def match(
+        self,
+        normalized: str,
+        max_len: int,
+        max_distance: int,
+    ) -> tuple[str, str] | None:
+        """Find the first indexed slug that fuzzily matches ``normalized``.
+
+        A slug matches if one compact form contains the other, or if both
+        are at most ``max_len`` long and within ``max_distance`` edits.
+
+        Returns:
+            Tuple of (matched slug, "containment" or "levenshtein"), or None
+        """
+        best = next(
+            (
+                (i, "containment")
+                for i, existing in enumerate(self.compact)
+                if normalized in existing or existing in normalized
+            ),
+            None,
+        )
+
+        length = len(normalized)
+        if length <= max_len:
+            longest = min(length + max_distance, max_len)
+            candidates = sorted(
+                i
+                for bucket in range(length - max_distance, longest + 1)
+                for i in self._by_length.get(bucket, ())
+            )
+            for i in candidates:
+                if best is not None and i >= best[0]:
+                    break
+                if Levenshtein.distance(
+                    normalized, self.compact[i], score_cutoff=max_distance
+                ) <= max_distance:
+                    best = (i, "levenshtein")
+                    break
+
+        if best is None:
+            return None
+        return self.slugs[best[0]], best[1]
+
 
 @dataclass
 class ResolvedDriver:
@@ -116,6 +208,13 @@ class EntityResolver:
         self._team_alias_cache: dict[str, UUID] = {}  # alias_slug -> team_id
         self._series_alias_cache: dict[str, UUID] = {}  # alias_slug -> series_id
         self._circuit_alias_cache: dict[str, UUID] = {}  # alias_slug -> circuit_id
+        self._driver_by_id: dict[UUID, Driver] = {}  # id -> Driver
+        self._team_by_id: dict[UUID, Team] = {}  # id -> Team
+        self._driver_by_norm: dict[str, UUID] = {}  # normalized name/alias -> driver_id
+        self._team_by_norm: dict[str, UUID] = {}  # normalized name/alias -> team_id
+        self._driver_fuzzy = _FuzzySlugIndex()  # fuzzy-match candidates
+        self._team_fuzzy = _FuzzySlugIndex()
+        self._circuit_fuzzy = _FuzzySlugIndex()
         self._cache_initialized = False
 
     @staticmethod
@@ -129,6 +228,14 @@ class EntityResolver:
         logger.warning("Known aliases file not found", path=str(aliases_file))
         return {"drivers": {}, "teams": {}, "circuits": {}, "series": {}}
 
+    def prime(self) -> None:
+        """Load every entity and alias into memory up front.
+
+        Resolution is then served entirely from in-memory indexes. Safe to
+        call more than once; only the first call hits the database.
+        """
+        self._init_cache()
+
     def _init_cache(self) -> None:
         """Initialize caches from database."""
         if self._cache_initialized:
@@ -137,17 +244,12 @@ class EntityResolver:
         # Load all drivers
         drivers = self.repository.get_all_drivers()
         for driver in drivers:
-            self._driver_cache[driver.slug] = driver
-            if driver.openf1_driver_number is not None:
-                self._driver_by_number[driver.openf1_driver_number] = driver
-            elif driver.driver_number is not None:
-                # Fallback to driver_number if no openf1 number
-                self._driver_by_number[driver.driver_number] = driver
+            self._cache_driver(driver)
 
         # Load all teams
         teams = self.repository.get_all_teams()
         for team in teams:
-            self._team_cache[team.slug] = team
+            self._cache_team(team)
 
         # Load all series
         all_series = self.repository.get_all_series()
@@ -157,17 +259,17 @@ class EntityResolver:
         # Load all circuits
         circuits = self.repository.get_all_circuits()
         for circuit in circuits:
-            self._circuit_cache[circuit.slug] = circuit
+            self._cache_circuit(circuit)
 
         # Load all driver aliases
         driver_aliases = self.repository.get_all_driver_aliases()
         for alias in driver_aliases:
-            self._driver_alias_cache[alias.alias_slug] = alias.driver_id
+            self._cache_driver_alias(alias)
 
         # Load all team aliases
         team_aliases = self.repository.get_all_team_aliases()
         for alias in team_aliases:
-            self._team_alias_cache[alias.alias_slug] = alias.team_id
+            self._cache_team_alias(alias)
 
         # Load all series aliases
         series_aliases = self.repository.get_all_series_aliases()
@@ -192,6 +294,45 @@ class EntityResolver:
             circuit_aliases=len(self._circuit_alias_cache),
         )
 
+    def _cache_driver(self, driver: Driver) -> None:
+        """Add a driver to the slug, number, id and normalized-name indexes."""
+        if driver.slug not in self._driver_cache:
+            self._driver_fuzzy.add(driver.slug)
+        self._driver_cache[driver.slug] = driver
+        self._driver_by_id[driver.id] = driver
+        if driver.openf1_driver_number is not None:
+            self._driver_by_number[driver.openf1_driver_number] = driver
+        elif driver.driver_number is not None:
+            # Fallback to driver_number if no openf1 number
+            self._driver_by_number[driver.driver_number] = driver
+        self._driver_by_norm.setdefault(
+            normalize_name(f"{driver.first_name} {driver.last_name}"), driver.id
+        )
+
+    def _cache_team(self, team: Team) -> None:
+        """Add a team to the slug, id and normalized-name indexes."""
+        if team.slug not in self._team_cache:
+            self._team_fuzzy.add(team.slug)
+        self._team_cache[team.slug] = team
+        self._team_by_id[team.id] = team
+        self._team_by_norm.setdefault(normalize_name(team.name), team.id)
+
+    def _cache_circuit(self, circuit: Circuit) -> None:
+        """Add a circuit to the slug index."""
+        if circuit.slug not in self._circuit_cache:
+            self._circuit_fuzzy.add(circuit.slug)
+        self._circuit_cache[circuit.slug] = circuit
+
+    def _cache_driver_alias(self, alias: DriverAlias) -> None:
+        """Add a driver alias to the slug and normalized-name indexes."""
+        self._driver_alias_cache[alias.alias_slug] = alias.driver_id
+        self._driver_by_norm.setdefault(normalize_name(alias.alias_name), alias.driver_id)
+
+    def _cache_team_alias(self, alias: TeamAlias) -> None:
+        """Add a team alias to the slug and normalized-name indexes."""
+        self._team_alias_cache[alias.alias_slug] = alias.team_id
+        self._team_by_norm.setdefault(normalize_name(alias.alias_name), alias.team_id)
+
     def resolve_driver(
         self,
         full_name: str,
@@ -209,7 +350,8 @@ class EntityResolver:
         2. Exact slug match
         3. Known alias lookup
         4. Database alias lookup
-        5. Fuzzy matching
+        5. Normalized name lookup (accent/case-insensitive, names and aliases)
+        6. Fuzzy matching
 
         Args:
             full_name: Full driver name from source
@@ -310,7 +452,24 @@ class EntityResolver:
                     headshot_url=headshot_url,
                 )
 
-        # Strategy 5: Fuzzy slug match
+        # Strategy 5: Normalized name lookup (catches "Pérez" vs "Perez",
+        # which slugify turns into different slugs)
+        driver_id = self._driver_by_norm.get(normalize_name(full_name))
+        existing = self._find_driver_by_id(driver_id) if driver_id else None
+        if existing:
+            return self._create_driver_resolution(
+                existing=existing,
+                incoming_slug=incoming_slug,
+                full_name=full_name,
+                first_name=canonical_first,
+                last_name=canonical_last,
+                driver_number=driver_number,
+                abbreviation=abbreviation,
+                nationality=nationality,
+                headshot_url=headshot_url,
+            )
+
+        # Strategy 6: Fuzzy slug match
         fuzzy_match = self._fuzzy_match_driver(incoming_slug)
         if fuzzy_match:
             return self._create_driver_resolution(
@@ -470,10 +629,7 @@ class EntityResolver:
 
     def _find_driver_by_id(self, driver_id: UUID) -> Driver | None:
         """Find a driver in cache by ID."""
-        for driver in self._driver_cache.values():
-            if driver.id == driver_id:
-                return driver
-        return None
+        return self._driver_by_id.get(driver_id)
 
     def _fuzzy_match_driver(self, slug: str) -> Driver | None:
         """Attempt fuzzy matching for driver slug.
@@ -484,31 +640,19 @@ class EntityResolver:
         - Minor typos (Levenshtein distance <= 2)
         """
         # Normalize: remove all non-alphanumeric
-        normalized = re.sub(r"[^a-z0-9]", "", slug)
-
-        for existing_slug, driver in self._driver_cache.items():
-            existing_normalized = re.sub(r"[^a-z0-9]", "", existing_slug)
-
-            # Check if one contains the other (truncation)
-            if normalized in existing_normalized or existing_normalized in normalized:
-                logger.debug(
-                    "Fuzzy match (containment)",
-                    incoming=slug,
-                    matched=existing_slug,
-                )
-                return driver
+        normalized = _compact_slug(slug)
 
-            # Simple Levenshtein check for short strings
-            if len(normalized) <= 15 and len(existing_normalized) <= 15:
-                if self._levenshtein_distance(normalized, existing_normalized) <= 2:
-                    logger.debug(
-                        "Fuzzy match (levenshtein)",
-                        incoming=slug,
-                        matched=existing_slug,
-                    )
-                    return driver
+        match = self._driver_fuzzy.match(normalized, max_len=15, max_distance=2)
+        if match is None:
+            return None
 
-        return None
+        existing_slug, method = match
+        logger.debug(
+            f"Fuzzy match ({method})",
+            incoming=slug,
+            matched=existing_slug,
+        )
+        return self._driver_cache[existing_slug]
 
     @staticmethod
     def _levenshtein_distance(s1: str, s2: str) -> int:
@@ -592,7 +736,19 @@ class EntityResolver:
                     logo_url=logo_url,
                 )
 
-        # Strategy 4: Fuzzy slug match
+        # Strategy 4: Normalized name lookup (names and aliases)
+        team_id = self._team_by_norm.get(normalize_name(name))
+        existing = self._find_team_by_id(team_id) if team_id else None
+        if existing:
+            return self._create_team_resolution(
+                existing=existing,
+                incoming_slug=incoming_slug,
+                name=name,
+                primary_color=primary_color,
+                logo_url=logo_url,
+            )
+
+        # Strategy 5: Fuzzy slug match
         fuzzy_match = self._fuzzy_match_team(incoming_slug)
         if fuzzy_match:
             return self._create_team_resolution(
@@ -718,37 +874,26 @@ class EntityResolver:
 
     def _find_team_by_id(self, team_id: UUID) -> Team | None:
         """Find a team in cache by ID."""
-        for team in self._team_cache.values():
-            if team.id == team_id:
-                return team
-        return None
+        return self._team_by_id.get(team_id)
 
     def _fuzzy_match_team(self, slug: str) -> Team | None:
         """Attempt fuzzy matching for team slug.
 
         Teams often have sponsorship variations, so we're more lenient.
         """
-        normalized = re.sub(r"[^a-z0-9]", "", slug)
-
-        for existing_slug, team in self._team_cache.items():
-            existing_normalized = re.sub(r"[^a-z0-9]", "", existing_slug)
-
-            # Check if core name matches (e.g., "redbull" matches in both)
-            core_names = [
-                "redbull",
-                "mercedes",
-                "ferrari",
-                "mclaren",
-                "astonmartin",
-                "alpine",
-                "williams",
-                "haas",
-                "sauber",
-                "alphatauri",
-                "tororosso",
-            ]
-            for core in core_names:
-                if core in normalized and core in existing_normalized:
+        normalized = _compact_slug(slug)
+
+        # Check if core name matches (e.g., "redbull" matches in both)
+        incoming_cores = [core for core in _TEAM_CORE_NAMES if core in normalized]
+        if not incoming_cores:
+            return None
+
+        for existing_normalized, existing_slug in zip(
+            self._team_fuzzy.compact, self._team_fuzzy.slugs, strict=True
+        ):
+            team = self._team_cache[existing_slug]
+            for core in incoming_cores:
+                if core in existing_normalized:
                     logger.debug(
                         "Fuzzy match (core name)",
                         incoming=slug,
@@ -768,20 +913,16 @@ class EntityResolver:
     ) -> None:
         """Update internal cache after upserting an entity."""
         if driver:
-            self._driver_cache[driver.slug] = driver
-            if driver.openf1_driver_number is not None:
-                self._driver_by_number[driver.openf1_driver_number] = driver
-            elif driver.driver_number is not None:
-                self._driver_by_number[driver.driver_number] = driver
+            self._cache_driver(driver)
 
         if team:
-            self._team_cache[team.slug] = team
+            self._cache_team(team)
 
         if series:
             self._series_cache[series.slug] = series
 
         if circuit:
-            self._circuit_cache[circuit.slug] = circuit
+            self._cache_circuit(circuit)
 
     def add_alias_to_cache(
         self,
@@ -792,9 +933,9 @@ class EntityResolver:
     ) -> None:
         """Add an alias to the internal cache."""
         if driver_alias:
-            self._driver_alias_cache[driver_alias.alias_slug] = driver_alias.driver_id
+            self._cache_driver_alias(driver_alias)
         if team_alias:
-            self._team_alias_cache[team_alias.alias_slug] = team_alias.team_id
+            self._cache_team_alias(team_alias)
         if series_alias:
             self._series_alias_cache[series_alias.alias_slug] = series_alias.series_id
         if circuit_alias:
@@ -1214,31 +1355,19 @@ class EntityResolver:
         - Truncated names
         - Title sponsor variations
         """
-        normalized = re.sub(r"[^a-z0-9]", "", slug)
+        normalized = _compact_slug(slug)
 
-        for existing_slug, circuit in self._circuit_cache.items():
-            existing_normalized = re.sub(r"[^a-z0-9]", "", existing_slug)
-
-            # Check if one contains the other (truncation)
-            if normalized in existing_normalized or existing_normalized in normalized:
-                logger.debug(
-                    "Fuzzy match (containment)",
-                    incoming=slug,
-                    matched=existing_slug,
-                )
-                return circuit
-
-            # Simple Levenshtein check for short strings
-            if len(normalized) <= 20 and len(existing_normalized) <= 20:
-                if self._levenshtein_distance(normalized, existing_normalized) <= 3:
-                    logger.debug(
-                        "Fuzzy match (levenshtein)",
-                        incoming=slug,
-                        matched=existing_slug,
-                    )
-                    return circuit
+        match = self._circuit_fuzzy.match(normalized, max_len=20, max_distance=3)
+        if match is None:
+            return None
 
-        return None
+        existing_slug, method = match
+        logger.debug(
+            f"Fuzzy match ({method})",
+            incoming=slug,
+            matched=existing_slug,
+        )
+        return self._circuit_cache[existing_slug]
 
     # =========================
     # Scoring-Based Matching (Phase 3-4 Integration)
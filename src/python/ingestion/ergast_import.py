@@ -483,6 +483,7 @@ def run_verification(ergast_db_url: str, parcferme_db_url: str) -> int:
             user=parsed.username or "parcferme",
             password=parsed.password or "localdev",
             database=parsed.path.lstrip("/") if parsed.path else "ergastf1",
+            unix_socket_dir=urllib.parse.parse_qs(parsed.query).get("host", [None])[0],
         )
         
         # Use context manager for repo to ensure connection
@@ -533,6 +534,7 @@ def run_reference_data_import(
             user=parsed.username or "parcferme",
             password=parsed.password or "localdev",
             database=parsed.path.lstrip("/") if parsed.path else "ergastf1",
+            unix_socket_dir=urllib.parse.parse_qs(parsed.query).get("host", [None])[0],
         )
         
         sync_options = SyncOptions(
@@ -637,6 +639,7 @@ def run_events_import(
             user=parsed.username or "parcferme",
             password=parsed.password or "localdev",
             database=parsed.path.lstrip("/") if parsed.path else "ergastf1",
+            unix_socket_dir=urllib.parse.parse_qs(parsed.query).get("host", [None])[0],
         )
         
         sync_options = SyncOptions(
@@ -663,17 +666,17 @@ def run_events_import(
         print("\n" + "=" * 60)
         print("IMPORT SUMMARY")
         print("=" * 60)
-        print(f"Years processed: {stats['years_processed']}")
-        print(f"Rounds created:  {stats['rounds_created']}")
-        print(f"Sessions created: {stats['sessions_created']}")
-        print(f"Entrants created: {stats['entrants_created']}")
+        print(f"Years processed: {stats.years_processed}")
+        print(f"Rounds created:  {stats.rounds_created}")
+        print(f"Sessions created: {stats.sessions_created}")
+        print(f"Entrants created: {stats.entrants_created}")
         
-        if stats["errors"]:
-            print(f"\n⚠️  {len(stats['errors'])} errors occurred:")
-            for err in stats["errors"][:10]:  # Show first 10
+        if stats.errors:
+            print(f"\n⚠️  {len(stats.errors)} errors occurred:")
+            for err in stats.errors[:10]:  # Show first 10
                 print(f"   - {err}")
-            if len(stats["errors"]) > 10:
-                print(f"   ... and {len(stats['errors']) - 10} more")
+            if len(stats.errors) > 10:
+                print(f"   ... and {len(stats.errors) - 10} more")
             return 1
         
         print("\n✅ Event data import completed successfully!")
@@ -715,6 +718,7 @@ def run_results_import(
             user=parsed.username or "parcferme",
             password=parsed.password or "localdev",
             database=parsed.path.lstrip("/") if parsed.path else "ergastf1",
+            unix_socket_dir=urllib.parse.parse_qs(parsed.query).get("host", [None])[0],
         )
         
         # Use context manager for repository
@@ -41,6 +41,8 @@ from ingestion.matching.core import (
 )
 from ingestion.matching.normalization import (
     normalize_name,
+    normalize_name_variants,
+    normalize_names,
     normalize_team_name,
     normalize_circuit_name,
     strip_sponsor_text,
@@ -50,6 +52,7 @@ from ingestion.matching.distance import (
     jaro_winkler_similarity,
     normalized_levenshtein_similarity,
     geo_distance_km,
+    LevenshteinTrie,
 )
 from ingestion.matching.drivers import DriverMatcher
 from ingestion.matching.teams import TeamMatcher
@@ -64,6 +67,8 @@ __all__ = [
     "EntityMatcher",
     # Normalization
     "normalize_name",
+    "normalize_name_variants",
+    "normalize_names",
     "normalize_team_name",
     "normalize_circuit_name",
     "strip_sponsor_text",
@@ -72,6 +77,7 @@ __all__ = [
     "jaro_winkler_similarity",
     "normalized_levenshtein_similarity",
     "geo_distance_km",
+    "LevenshteinTrie",
     # Entity matchers
     "DriverMatcher",
     "TeamMatcher",
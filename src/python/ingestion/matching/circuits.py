@@ -30,6 +30,30 @@ from ingestion.matching.distance import (
 )
 
 
+# Known circuits with their normalized forms, computed once rather than per
+# candidate comparison: (lowercase name, normalized name, normalized aliases)
+_KNOWN_CIRCUIT_ALIASES: list[tuple[str, str, frozenset[str]]] = [
+    (
+        full_name.lower(),
+        normalize_circuit_name(full_name),
+        frozenset(normalize_name(a) for a in abbreviations),
+    )
+    for full_name, abbreviations in CIRCUIT_ABBREVIATIONS.items()
+]
+
+# Common country variations, normalized (canonical + aliases per group)
+_COUNTRY_ALIAS_GROUPS: list[frozenset[str]] = [
+    frozenset(normalize_name(v) for v in [canonical, *aliases])
+    for canonical, aliases in {
+        "usa": ["united states", "us", "america", "united states of america"],
+        "uk": ["united kingdom", "gb", "gbr", "great britain", "britain", "england"],
+        "uae": ["united arab emirates", "abu dhabi", "dubai"],
+        "netherlands": ["holland", "ned", "nl"],
+        "korea": ["south korea", "kor", "republic of korea"],
+    }.items()
+]
+
+
 @dataclass
 class CircuitData:
     """Incoming circuit data for matching.
@@ -170,11 +194,10 @@ class CircuitMatcher(EntityMatcher[CircuitCandidate, CircuitData]):
                 return (True, 0.9, f"Abbreviation match: {self._incoming_data.name} → {entity.name}")
         
         # Check if candidate has known abbreviation matching incoming
-        for full_name, abbreviations in CIRCUIT_ABBREVIATIONS.items():
-            full_norm = normalize_circuit_name(full_name)
+        for _, full_norm, aliases_norm in _KNOWN_CIRCUIT_ALIASES:
             if candidate_norm == full_norm:
                 # Candidate is a known circuit - check if incoming matches any alias
-                if incoming_norm in [normalize_name(a) for a in abbreviations]:
+                if incoming_norm in aliases_norm:
                     return (True, 0.9, f"Known alias match: {entity.name}")
         
         # Short name match
@@ -219,10 +242,11 @@ class CircuitMatcher(EntityMatcher[CircuitCandidate, CircuitData]):
                     return (True, similarity, f"Similar location ({similarity:.2f})")
         
         # Check if incoming name is a known location alias
-        for full_name, abbreviations in CIRCUIT_ABBREVIATIONS.items():
-            if entity.name.lower() in full_name.lower() or full_name.lower() in entity.name.lower():
+        entity_lower = entity.name.lower()
+        for full_lower, _, aliases_norm in _KNOWN_CIRCUIT_ALIASES:
+            if entity_lower in full_lower or full_lower in entity_lower:
                 # Check if incoming matches a location alias
-                if incoming_norm in [normalize_name(a) for a in abbreviations]:
+                if incoming_norm in aliases_norm:
                     return (True, 0.85, f"Location alias: {self._incoming_data.name}")
         
         return (False, 0.0, "No location match")
@@ -258,18 +282,7 @@ class CircuitMatcher(EntityMatcher[CircuitCandidate, CircuitData]):
                 return (True, 1.0, f"Country code match: {candidate_code}")
         
         # Handle common country variations
-        country_aliases = {
-            "usa": ["united states", "us", "america", "united states of america"],
-            "uk": ["united kingdom", "gb", "gbr", "great britain", "britain", "england"],
-            "uae": ["united arab emirates", "abu dhabi", "dubai"],
-            "netherlands": ["holland", "ned", "nl"],
-            "korea": ["south korea", "kor", "republic of korea"],
-        }
-        
-        for canonical, aliases in country_aliases.items():
-            all_variants = [canonical] + aliases
-            all_norm = [normalize_name(v) for v in all_variants]
-            
+        for all_norm in _COUNTRY_ALIAS_GROUPS:
             candidate_matches = (
                 (candidate_country and normalize_name(candidate_country) in all_norm) or
                 (candidate_code and normalize_name(candidate_code) in all_norm)
@@ -5,12 +5,14 @@ Provides implementations of:
 - Levenshtein distance (edit distance)
 - Jaro-Winkler similarity (good for names)
 - Normalized similarity scores (0.0-1.0)
+- Bounded Levenshtein search over a trie of candidate names
 - Geographic distance calculations
 """
 
 from __future__ import annotations
 
 import math
+from typing import Any
 
 
 def levenshtein_distance(s1: str, s2: str) -> int:
@@ -230,6 +232,82 @@ def damerau_levenshtein_distance(s1: str, s2: str) -> int:
     return d[len1][len2]
 
 
+class LevenshteinTrie:
+    """Character trie supporting bounded Levenshtein search.
+    
+    Searching walks the trie carrying one DP row per node, so the work for
+    a shared prefix is done once for every key under it, and whole subtrees
+    are pruned as soon as the row minimum exceeds the distance bound.
+    
+    Examples:
+        >>> trie = LevenshteinTrie()
+        >>> trie.insert("nico hulkenberg", 1)
+        >>> trie.search("nico hulkenburg", max_distance=2)
+        [('nico hulkenberg', 1, 1)]
+    """
+    
+    _END = "\0"  # Node key marking the end of an inserted word
+    
+    def __init__(self) -> None:
+        self._root: dict[str, Any] = {}
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def insert(self, key: str, value: Any) -> None:
+        """Insert key, replacing the value of an existing identical key."""
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        if self._END not in node:
+            self._size += 1
+        node[self._END] = (key, value)
+    
+    def search(self, query: str, max_distance: int) -> list[tuple[str, Any, int]]:
+        """Find all keys within max_distance edits of query.
+        
+        Args:
+            query: String to search for
+            max_distance: Maximum Levenshtein distance (inclusive)
+            
+        Returns:
+            List of (key, value, distance) tuples, closest first
+        """
+        matches: list[tuple[str, Any, int]] = []
+        first_row = list(range(len(query) + 1))
+        
+        # Iterative DFS: (node, char leading to node, parent DP row)
+        stack = [
+            (child, char, first_row)
+            for char, child in self._root.items()
+            if char != self._END
+        ]
+        while stack:
+            node, char, previous_row = stack.pop()
+            current_row = [previous_row[0] + 1]
+            for j, query_char in enumerate(query):
+                current_row.append(min(
+                    current_row[j] + 1,
+                    previous_row[j + 1] + 1,
+                    previous_row[j] + (query_char != char),
+                ))
+            
+            terminal = node.get(self._END)
+            if terminal is not None and current_row[-1] <= max_distance:
+                matches.append((terminal[0], terminal[1], current_row[-1]))
+            
+            if min(current_row) <= max_distance:
+                stack.extend(
+                    (child, next_char, current_row)
+                    for next_char, child in node.items()
+                    if next_char != self._END
+                )
+        
+        matches.sort(key=lambda match: match[2])
+        return matches
+
+
 def geo_distance_km(
     lat1: float,
     lon1: float,
@@ -11,8 +11,41 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from functools import lru_cache
 
 
+def _build_diacritic_table() -> dict[int, str]:
+    """Build a str.translate table mapping accented Latin letters to ASCII.
+    
+    Covers Latin-1 Supplement and Latin Extended-A (U+00C0–U+017F), which
+    includes every accented character seen in driver/team/circuit names.
+    Letters that NFD does not decompose (ß, ø, æ, ł, đ) are mapped explicitly.
+    """
+    table: dict[int, str] = {}
+    for codepoint in range(0x00C0, 0x0180):
+        char = chr(codepoint)
+        decomposed = unicodedata.normalize("NFD", char)
+        stripped = "".join(c for c in decomposed if unicodedata.category(c) != "Mn")
+        if stripped != char and stripped.isascii():
+            table[codepoint] = stripped
+    table.update({
+        ord("ß"): "ss",
+        ord("ø"): "o",
+        ord("Ø"): "O",
+        ord("æ"): "ae",
+        ord("Æ"): "AE",
+        ord("ł"): "l",
+        ord("Ł"): "L",
+        ord("đ"): "d",
+        ord("Đ"): "D",
+    })
+    return table
+
+
+_DIACRITIC_TABLE = _build_diacritic_table()
+
+
+@lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
     """Normalize a name for comparison.
     
@@ -20,11 +53,15 @@ def normalize_name(name: str) -> str:
     Handles Unicode diacritics and case normalization.
     
     Operations:
-    1. NFD normalization (decomposes characters like é → e + accent)
-    2. Remove combining diacritical marks
+    1. Translate accented Latin letters to ASCII via a precomputed table
+    2. NFD normalization + removal of combining marks, only if any
+       non-ASCII characters remain after step 1
     3. Convert to lowercase
     4. Strip whitespace
     
+    Results are memoized, since the same driver/team/circuit names are
+    normalized repeatedly across rounds and years.
+    
     Args:
         name: Original name with potential diacritics
         
@@ -41,13 +78,90 @@ def normalize_name(name: str) -> str:
         >>> normalize_name("Jean-Éric Vergne")
         'jean-eric vergne'
     """
-    # NFD normalization decomposes characters (é → e + combining accent)
-    normalized = unicodedata.normalize("NFD", name)
-    # Remove combining diacritical marks (Unicode category 'Mn')
-    ascii_name = "".join(c for c in normalized if unicodedata.category(c) != "Mn")
+    if name.isascii():
+        # Fast path for the common case: nothing to strip
+        return name.lower().strip()
+    ascii_name = name.translate(_DIACRITIC_TABLE)
+    if not ascii_name.isascii():
+        # NFD normalization decomposes characters (é → e + combining accent)
+        normalized = unicodedata.normalize("NFD", ascii_name)
+        # Remove combining diacritical marks (Unicode category 'Mn')
+        ascii_name = "".join(c for c in normalized if unicodedata.category(c) != "Mn")
     return ascii_name.lower().strip()
 
 
+_BATCH_SEPARATOR = "\x1f"  # ASCII unit separator; never appears in names
+
+
+def normalize_names(names: list[str]) -> list[str]:
+    """Normalize a batch of names, equivalent to [normalize_name(n) for n in names].
+    
+    Joins the batch into one string so the translate/lower passes run once
+    in C over the whole list instead of once per name.
+    
+    Args:
+        names: Names to normalize
+        
+    Returns:
+        Normalized names, in the same order
+    """
+    if not names:
+        return []
+    joined = _BATCH_SEPARATOR.join(names)
+    if not joined.isascii():
+        joined = joined.translate(_DIACRITIC_TABLE)
+        if not joined.isascii():
+            normalized = unicodedata.normalize("NFD", joined)
+            joined = "".join(c for c in normalized if unicodedata.category(c) != "Mn")
+    return [name.strip() for name in joined.lower().split(_BATCH_SEPARATOR)]
+
+
+# Spelling-variant substitutions applied on top of normalize_name, so that
+# transliteration variants collapse to the same key ("Wladimir Ustinow" and
+# "Vladimir Ustinov" both become "vladimir ustinov"). Order matters: the
+# doubled-consonant rule runs last so it also collapses pairs created above.
+NAME_SUBSTITUTION_RULES: list[tuple[re.Pattern[str], str]] = [
+    (re.compile(r"\bwl"), "vl"),
+    (re.compile(r"tsch"), "ch"),
+    (re.compile(r"sch"), "sh"),
+    (re.compile(r"ph"), "f"),
+    (re.compile(r"ck"), "k"),
+    (re.compile(r"th"), "t"),
+    (re.compile(r"dj"), "j"),
+    (re.compile(r"ou"), "u"),
+    (re.compile(r"([oe])w\b"), r"\1v"),
+    (re.compile(r"([oe])ff\b"), r"\1v"),
+    (re.compile(r"([bcdfghjklmnpqrstvwxz])\1"), r"\1"),
+]
+
+
+@lru_cache(maxsize=4096)
+def normalize_name_variants(name: str) -> str:
+    """Normalize a name and collapse common spelling/transliteration variants.
+    
+    Applies normalize_name, then NAME_SUBSTITUTION_RULES. The result is a
+    matching key only - it is deliberately lossy and should never be stored
+    or displayed.
+    
+    Args:
+        name: Original name
+        
+    Returns:
+        Lowercase ASCII matching key
+        
+    Examples:
+        >>> normalize_name_variants("Wladimir Ustinow")
+        'vladimir ustinov'
+        >>> normalize_name_variants("Ralph Schumacher")
+        'ralf shumacher'
+    """
+    working = normalize_name(name)
+    for pattern, replacement in NAME_SUBSTITUTION_RULES:
+        working = pattern.sub(replacement, working)
+    return working
+
+
+@lru_cache(maxsize=4096)
 def normalize_for_slug(name: str) -> str:
     """Normalize a name to a slug-like format for matching.
     
@@ -159,6 +273,7 @@ def strip_sponsor_text(name: str, sponsors: list[str] | None = None) -> str:
     return working.title() if working else name
 
 
+@lru_cache(maxsize=4096)
 def normalize_grand_prix(name: str) -> str:
     """Normalize Grand Prix name variations.
     
@@ -227,6 +342,7 @@ TEAM_SPONSORS = [
 ]
 
 
+@lru_cache(maxsize=4096)
 def normalize_team_name(name: str, keep_core: bool = True) -> str:
     """Normalize team name for matching.
     
@@ -290,6 +406,7 @@ CIRCUIT_SUFFIXES = [
 ]
 
 
+@lru_cache(maxsize=4096)
 def normalize_circuit_name(name: str) -> str:
     """Normalize circuit name for matching.
     
@@ -340,6 +457,7 @@ CIRCUIT_ABBREVIATIONS: dict[str, list[str]] = {
 }
 
 
+@lru_cache(maxsize=4096)
 def expand_circuit_abbreviation(abbrev: str) -> str | None:
     """Expand a circuit abbreviation to full name.
     
@@ -5,8 +5,10 @@ These Pydantic models represent the racing domain entities that will be
 synced to PostgreSQL. They mirror the C# models in ParcFerme.Api.Models.
 """
 
+import re
 from datetime import date, datetime
 from enum import Enum, IntEnum
+from functools import lru_cache
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
@@ -352,18 +354,25 @@ OPENF1_SESSION_TYPE_MAP: dict[str, SessionType] = {
 }
 
 
+_SLUG_SEPARATOR_RE = re.compile(r"[\s_]+")
+_SLUG_INVALID_RE = re.compile(r"[^a-z0-9-]")
+_SLUG_HYPHENS_RE = re.compile(r"-+")
+
+
+@lru_cache(maxsize=8192)
 def slugify(text: str) -> str:
-    """Convert a string to a URL-friendly slug."""
-    import re
+    """Convert a string to a URL-friendly slug.
 
+    Cached: circuit, driver and team names recur across every season imported.
+    """
     # Convert to lowercase
     slug = text.lower()
     # Replace spaces and underscores with hyphens
-    slug = re.sub(r"[\s_]+", "-", slug)
+    slug = _SLUG_SEPARATOR_RE.sub("-", slug)
     # Remove non-alphanumeric characters except hyphens
-    slug = re.sub(r"[^a-z0-9-]", "", slug)
+    slug = _SLUG_INVALID_RE.sub("", slug)
     # Remove consecutive hyphens
-    slug = re.sub(r"-+", "-", slug)
+    slug = _SLUG_HYPHENS_RE.sub("-", slug)
     # Strip leading/trailing hyphens
     slug = slug.strip("-")
     return slug
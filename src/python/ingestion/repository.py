@@ -5,6 +5,7 @@ Uses psycopg3 for PostgreSQL operations with proper connection pooling
 and upsert semantics (INSERT ... ON CONFLICT DO UPDATE).
 """
 
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
 from typing import Any
@@ -36,6 +37,28 @@ from ingestion.models import (
 
 logger = structlog.get_logger()
 
+# Column order of the raw rows accepted by RacingRepository.bulk_copy_result_rows
+RESULT_ROW_COLUMNS = (
+    "Id",
+    "SessionId",
+    "EntrantId",
+    "Position",
+    "GridPosition",
+    "Status",
+    "StatusDetail",
+    "Points",
+    "TimeMilliseconds",
+    "Laps",
+    "FastestLap",
+    "FastestLapNumber",
+    "FastestLapRank",
+    "FastestLapTime",
+    "FastestLapSpeed",
+    "Q1Time",
+    "Q2Time",
+    "Q3Time",
+)
+
 
 def _to_uuid(value: Any) -> UUID:
     """Convert a value to UUID, handling both string and UUID inputs."""
@@ -44,6 +67,19 @@ def _to_uuid(value: Any) -> UUID:
     return UUID(str(value))
 
 
+def _fetch_returned_ids(
+    cur: psycopg.Cursor[dict[str, Any]], fallback_ids: list[UUID]
+) -> list[UUID]:
+    """Collect the RETURNING "Id" of each statement after executemany(returning=True)."""
+    ids: list[UUID] = []
+    for fallback_id in fallback_ids:
+        row = cur.fetchone()
+        ids.append(_to_uuid(row["Id"]) if row else fallback_id)
+        if not cur.nextset():
+            break
+    return ids
+
+
 class RacingRepository:
     """Repository for racing data operations.
 
@@ -51,19 +87,33 @@ class RacingRepository:
     or updated if they already exist (based on unique constraints).
     """
 
-    def __init__(self, connection_string: str | None = None) -> None:
+    def __init__(
+        self,
+        connection_string: str | None = None,
+        min_size: int = 1,
+        max_size: int = 10,
+    ) -> None:
         self.connection_string = connection_string or settings.database_url
         self._pool: ConnectionPool | None = None
+        # Pool bounds; max_size also caps concurrent writers (e.g. parallel year imports)
+        self._min_size = min_size
+        self._max_size = max_size
+        # Per-thread connection pinned by pinned_connection()
+        self._local = threading.local()
 
     def connect(self) -> None:
         """Initialize the connection pool."""
         self._pool = ConnectionPool(
             self.connection_string,
-            min_size=1,
-            max_size=10,
+            min_size=self._min_size,
+            max_size=self._max_size,
             open=True,
         )
-        logger.info("Database connection pool initialized")
+        logger.info(
+            "Database connection pool initialized",
+            min_size=self._min_size,
+            max_size=self._max_size,
+        )
 
     def close(self) -> None:
         """Close the connection pool."""
@@ -80,12 +130,42 @@ class RacingRepository:
 
     @contextmanager
     def _get_connection(self) -> Generator[psycopg.Connection, None, None]:
-        """Get a connection from the pool."""
+        """Get a connection from the pool, or the thread's pinned connection."""
         if not self._pool:
             raise RuntimeError("Repository not connected. Call connect() first.")
+        pinned = getattr(self._local, "conn", None)
+        if pinned is not None:
+            try:
+                yield pinned
+            except Exception:
+                # Leave the pinned connection usable for the next operation
+                pinned.rollback()
+                raise
+            return
         with self._pool.connection() as conn:
             yield conn
 
+    @contextmanager
+    def pinned_connection(self) -> Generator[None, None, None]:
+        """Run every repository call in this block on one pooled connection.
+
+        Saves a pool checkout/return per statement for call-heavy units of
+        work such as syncing one meeting. Each method still commits its own
+        work. Pinning is per thread, so concurrent workers each hold their own
+        connection; nested blocks reuse the outer one.
+        """
+        if not self._pool:
+            raise RuntimeError("Repository not connected. Call connect() first.")
+        if getattr(self._local, "conn", None) is not None:
+            yield
+            return
+        with self._pool.connection() as conn:
+            self._local.conn = conn
+            try:
+                yield
+            finally:
+                self._local.conn = None
+
     # =========================
     # Series Operations
     # =========================
@@ -165,6 +245,47 @@ class RacingRepository:
                 )
             return None
 
+    def ensure_seasons(
+        self, series_id: UUID, years: list[int]
+    ) -> tuple[dict[int, UUID], list[int]]:
+        """Ensure seasons exist for every year, in two round trips.
+
+        Existing seasons are fetched with one set-based query and the missing
+        ones are inserted in a single pipelined batch.
+
+        Returns:
+            (year -> season ID for every requested year, years that were created)
+        """
+        if not years:
+            return {}, []
+        with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                'SELECT "Id", "Year" FROM "Seasons" WHERE "SeriesId" = %s AND "Year" = ANY(%s)',
+                (str(series_id), list(years)),
+            )
+            season_ids = {row["Year"]: _to_uuid(row["Id"]) for row in cur.fetchall()}
+
+            missing = [Season(series_id=series_id, year=year) for year in years if year not in season_ids]
+            if missing:
+                cur.executemany(
+                    """
+                    INSERT INTO "Seasons" ("Id", "SeriesId", "Year")
+                    VALUES (%s, %s, %s)
+                    ON CONFLICT ("SeriesId", "Year") DO UPDATE SET
+                        "Year" = EXCLUDED."Year"
+                    RETURNING "Id"
+                    """,
+                    [(str(season.id), str(season.series_id), season.year) for season in missing],
+                    returning=True,
+                )
+                ids = _fetch_returned_ids(cur, [season.id for season in missing])
+                season_ids.update(
+                    (season.year, season_id)
+                    for season, season_id in zip(missing, ids, strict=True)
+                )
+            conn.commit()
+        return season_ids, [season.year for season in missing]
+
     # =========================
     # Circuit Operations
     # =========================
@@ -231,6 +352,37 @@ class RacingRepository:
                 )
             return None
 
+    def get_circuits_by_slugs(self, slugs: list[str]) -> dict[str, Circuit]:
+        """Get circuits for a batch of slugs in one query.
+        
+        Returns:
+            Dictionary mapping slug -> Circuit for the slugs that exist
+        """
+        if not slugs:
+            return {}
+        with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                """SELECT "Id", "Name", "Slug", "Location", "Country", "CountryCode",
+                              "LayoutMapUrl", "Latitude", "Longitude", "LengthMeters"
+                       FROM "Circuits" WHERE "Slug" = ANY(%s)""",
+                (list(slugs),),
+            )
+            return {
+                row["Slug"]: Circuit(
+                    id=_to_uuid(row["Id"]),
+                    name=row["Name"],
+                    slug=row["Slug"],
+                    location=row["Location"],
+                    country=row["Country"],
+                    country_code=row["CountryCode"],
+                    layout_map_url=row["LayoutMapUrl"],
+                    latitude=row["Latitude"],
+                    longitude=row["Longitude"],
+                    length_meters=row["LengthMeters"],
+                )
+                for row in cur.fetchall()
+            }
+
     # =========================
     # Round Operations
     # =========================
@@ -270,6 +422,61 @@ class RacingRepository:
             conn.commit()
             return _to_uuid(row["Id"]) if row else round_.id
 
+    def upsert_round_tracked(self, round_: Round) -> tuple[UUID, bool]:
+        """Upsert a round and return its ID and whether the row changed.
+
+        The update only fires when a column actually differs, so an
+        identical re-import reports ``False`` and leaves the row untouched
+        (at the cost of a follow-up SELECT for the ID). Callers that don't
+        need the flag should use upsert_round.
+        """
+        with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(
+                """
+                INSERT INTO "Rounds" ("Id", "SeasonId", "CircuitId", "Name", "Slug",
+                                     "RoundNumber", "DateStart", "DateEnd",
+                                     "OpenF1MeetingKey")
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT ("Slug") DO UPDATE SET
+                        "SeasonId" = EXCLUDED."SeasonId",
+                        "CircuitId" = EXCLUDED."CircuitId",
+                        "Name" = EXCLUDED."Name",
+                        "RoundNumber" = EXCLUDED."RoundNumber",
+                        "DateStart" = EXCLUDED."DateStart",
+                        "DateEnd" = EXCLUDED."DateEnd",
+                        "OpenF1MeetingKey" = EXCLUDED."OpenF1MeetingKey"
+                    WHERE ("Rounds"."SeasonId", "Rounds"."CircuitId", "Rounds"."Name",
+                           "Rounds"."RoundNumber", "Rounds"."DateStart", "Rounds"."DateEnd",
+                           "Rounds"."OpenF1MeetingKey")
+                        IS DISTINCT FROM
+                          (EXCLUDED."SeasonId", EXCLUDED."CircuitId", EXCLUDED."Name",
+                           EXCLUDED."RoundNumber", EXCLUDED."DateStart", EXCLUDED."DateEnd",
+                           EXCLUDED."OpenF1MeetingKey")
+                    RETURNING "Id"
+                    """,
+                (
+                    str(round_.id),
+                    str(round_.season_id),
+                    str(round_.circuit_id),
+                    round_.name,
+                    round_.slug,
+                    round_.round_number,
+                    round_.date_start,
+                    round_.date_end,
+                    round_.openf1_meeting_key,
+                ),
+            )
+            row = cur.fetchone()
+            if row:
+                conn.commit()
+                return _to_uuid(row["Id"]), True
+            
+            # Conflict with an identical row: nothing was written
+            cur.execute('SELECT "Id" FROM "Rounds" WHERE "Slug" = %s', (round_.slug,))
+            row = cur.fetchone()
+            conn.commit()
+            return (_to_uuid(row["Id"]) if row else round_.id), False
+
     def get_round_by_meeting_key(self, meeting_key: int) -> Round | None:
         """Get a round by its OpenF1 meeting key."""
         with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
@@ -1457,15 +1664,18 @@ class RacingRepository:
         return ids
 
     def bulk_upsert_results(self, results: list[Result]) -> list[UUID]:
-        """Upsert multiple results in a single transaction.
+        """Upsert multiple results in a single pipelined batch.
 
         ⚠️ SPOILER DATA - This contains race results.
+
+        Returns:
+            Result IDs in the same order as the input
         """
-        ids: list[UUID] = []
+        if not results:
+            return []
         with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
-            for result in results:
-                cur.execute(
-                    """
+            cur.executemany(
+                """
                     INSERT INTO "Results" ("Id", "SessionId", "EntrantId", "Position",
                                           "GridPosition", "Status", "StatusDetail", "Points", "Time",
                                           "TimeMilliseconds", "Laps", "FastestLap", "FastestLapNumber",
@@ -1491,6 +1701,7 @@ class RacingRepository:
                         "Q3Time" = EXCLUDED."Q3Time"
                     RETURNING "Id"
                     """,
+                [
                     (
                         str(result.id),
                         str(result.session_id),
@@ -1515,13 +1726,348 @@ class RacingRepository:
                         result.q1_time,
                         result.q2_time,
                         result.q3_time,
-                    ),
-                )
-                row = cur.fetchone()
-                ids.append(_to_uuid(row["Id"]) if row else result.id)
+                    )
+                    for result in results
+                ],
+                returning=True,
+            )
+            ids = _fetch_returned_ids(cur, [result.id for result in results])
             conn.commit()
         return ids
 
+    def bulk_copy_results(self, results: list[Result]) -> int:
+        """Upsert results by COPYing them into a staging table.
+
+        Convenience wrapper over bulk_copy_result_rows for Result models.
+
+        ⚠️ SPOILER DATA - This contains race results.
+
+        Returns:
+            Number of rows upserted
+        """
+        return self.bulk_copy_result_rows([
+            (
+                result.id,
+                result.session_id,
+                result.entrant_id,
+                result.position,
+                result.grid_position,
+                result.status.value,
+                result.status_detail,
+                result.points,
+                result.time_milliseconds,
+                result.laps,
+                result.fastest_lap,
+                result.fastest_lap_number,
+                result.fastest_lap_rank,
+                result.fastest_lap_time,
+                result.fastest_lap_speed,
+                result.q1_time,
+                result.q2_time,
+                result.q3_time,
+            )
+            for result in results
+        ])
+
+    def bulk_copy_result_rows(self, rows: list[tuple[Any, ...]]) -> int:
+        """Upsert raw result rows by COPYing them into a staging table.
+
+        Intended for large historical batches (e.g. all sessions of a meeting),
+        where building a validated Result model per row is pure overhead.
+        Rows are streamed with COPY into a temp table that is dropped on
+        commit, then merged into "Results" with a single INSERT ... SELECT
+        ("Time" is derived from "TimeMilliseconds" there). If a (session,
+        entrant) pair appears more than once, the last row wins.
+
+        Each row must follow RESULT_ROW_COLUMNS, with Status as its int value.
+
+        ⚠️ SPOILER DATA - This contains race results.
+
+        Returns:
+            Number of rows upserted
+        """
+        if not rows:
+            return 0
+        # ON CONFLICT can't touch the same row twice in one statement
+        unique_rows = list({(row[1], row[2]): row for row in rows}.values())
+        columns = ", ".join(f'"{column}"' for column in RESULT_ROW_COLUMNS)
+        with self._get_connection() as conn, conn.cursor() as cur:
+            cur.execute(
+                """
+                CREATE TEMP TABLE "ResultsStage" (LIKE "Results" INCLUDING DEFAULTS)
+                ON COMMIT DROP
+                """
+            )
+            with cur.copy(f'COPY "ResultsStage" ({columns}) FROM STDIN') as copy:
+                for row in unique_rows:
+                    copy.write_row(row)
+            cur.execute(
+                f"""
+                INSERT INTO "Results" ({columns}, "Time")
+                SELECT {columns}, NULLIF("TimeMilliseconds", 0) * INTERVAL '1 millisecond'
+                FROM "ResultsStage"
+                ON CONFLICT ("SessionId", "EntrantId") DO UPDATE SET
+                    "Position" = EXCLUDED."Position",
+                    "GridPosition" = EXCLUDED."GridPosition",
+                    "Status" = EXCLUDED."Status",
+                    "StatusDetail" = EXCLUDED."StatusDetail",
+                    "Points" = EXCLUDED."Points",
+                    "Time" = EXCLUDED."Time",
+                    "TimeMilliseconds" = EXCLUDED."TimeMilliseconds",
+                    "Laps" = EXCLUDED."Laps",
+                    "FastestLap" = EXCLUDED."FastestLap",
+                    "FastestLapNumber" = EXCLUDED."FastestLapNumber",
+                    "FastestLapRank" = EXCLUDED."FastestLapRank",
+                    "FastestLapTime" = EXCLUDED."FastestLapTime",
+                    "FastestLapSpeed" = EXCLUDED."FastestLapSpeed",
+                    "Q1Time" = EXCLUDED."Q1Time",
+                    "Q2Time" = EXCLUDED."Q2Time",
+                    "Q3Time" = EXCLUDED."Q3Time"
+                """
+            )
+            conn.commit()
+        return len(unique_rows)
+
+    def bulk_upsert_circuits(self, circuits: list[Circuit]) -> list[UUID]:
+        """Upsert multiple circuits in a single pipelined batch.
+        
+        Returns:
+            Circuit IDs in the same order as the input
+        """
+        if not circuits:
+            return []
+        with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+            cur.executemany(
+                """
+                INSERT INTO "Circuits" ("Id", "Name", "Slug", "Location", "Country",
+                                       "CountryCode", "LayoutMapUrl", "Latitude",
+                                       "Longitude", "LengthMeters")
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT ("Slug") DO UPDATE SET
+                    "Name" = EXCLUDED."Name",
+                    "Location" = EXCLUDED."Location",
+                    "Country" = EXCLUDED."Country",
+                    "CountryCode" = EXCLUDED."CountryCode",
+                    "LayoutMapUrl" = EXCLUDED."LayoutMapUrl",
+                    "Latitude" = EXCLUDED."Latitude",
+                    "Longitude" = EXCLUDED."Longitude",
+                    "LengthMeters" = EXCLUDED."LengthMeters"
+                RETURNING "Id"
+                """,
+                [
+                    (
+                        str(circuit.id),
+                        circuit.name,
+                        circuit.slug,
+                        circuit.location,
+                        circuit.country,
+                        circuit.country_code,
+                        circuit.layout_map_url,
+                        circuit.latitude,
+                        circuit.longitude,
+                        circuit.length_meters,
+                    )
+                    for circuit in circuits
+                ],
+                returning=True,
+            )
+            ids = _fetch_returned_ids(cur, [circuit.id for circuit in circuits])
+            conn.commit()
+        return ids
+
+    def bulk_upsert_entrants(self, entrants: list[Entrant]) -> list[UUID]:
+        """Upsert multiple entrants in a single pipelined batch.
+        
+        Returns:
+            Entrant IDs in the same order as the input
+        """
+        if not entrants:
+            return []
+        with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+            cur.executemany(
+                """
+                    INSERT INTO "Entrants" ("Id", "RoundId", "DriverId", "TeamId", "Role")
+                    VALUES (%s, %s, %s, %s, %s)
+                    ON CONFLICT ("RoundId", "DriverId") DO UPDATE SET
+                        "TeamId" = EXCLUDED."TeamId",
+                        "Role" = EXCLUDED."Role"
+                    RETURNING "Id"
+                    """,
+                [
+                    (
+                        str(entrant.id),
+                        str(entrant.round_id),
+                        str(entrant.driver_id),
+                        str(entrant.team_id),
+                        int(entrant.role),
+                    )
+                    for entrant in entrants
+                ],
+                returning=True,
+            )
+            ids = _fetch_returned_ids(cur, [entrant.id for entrant in entrants])
+            conn.commit()
+        return ids
+
+    def bulk_upsert_drivers(self, drivers: list[Driver]) -> list[UUID]:
+        """Upsert multiple new drivers in a single pipelined batch.
+        
+        Unlike upsert_driver, this does no Id/number lookup; callers should
+        pass drivers already resolved as new. A driver whose slug already
+        exists (stale resolver cache, concurrent import) updates that row
+        instead of failing the batch, keeping its known details.
+        
+        Returns:
+            Driver IDs in the same order as the input
+        """
+        if not drivers:
+            return []
+        with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+            cur.executemany(
+                """
+                INSERT INTO "Drivers" ("Id", "FirstName", "LastName", "Slug",
+                                      "Abbreviation", "Nationality", "HeadshotUrl",
+                                      "DriverNumber", "OpenF1DriverNumber")
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT ("Slug") DO UPDATE SET
+                    "FirstName" = EXCLUDED."FirstName",
+                    "LastName" = EXCLUDED."LastName",
+                    "Abbreviation" = COALESCE(EXCLUDED."Abbreviation", "Drivers"."Abbreviation"),
+                    "Nationality" = COALESCE(EXCLUDED."Nationality", "Drivers"."Nationality"),
+                    "HeadshotUrl" = COALESCE(EXCLUDED."HeadshotUrl", "Drivers"."HeadshotUrl"),
+                    "DriverNumber" = COALESCE(EXCLUDED."DriverNumber", "Drivers"."DriverNumber"),
+                    "OpenF1DriverNumber" = COALESCE(
+                        EXCLUDED."OpenF1DriverNumber", "Drivers"."OpenF1DriverNumber"
+                    )
+                RETURNING "Id"
+                """,
+                [
+                    (
+                        str(driver.id),
+                        driver.first_name,
+                        driver.last_name,
+                        driver.slug,
+                        driver.abbreviation,
+                        driver.nationality,
+                        driver.headshot_url,
+                        driver.driver_number,
+                        driver.openf1_driver_number,
+                    )
+                    for driver in drivers
+                ],
+                returning=True,
+            )
+            ids = _fetch_returned_ids(cur, [driver.id for driver in drivers])
+            conn.commit()
+        return ids
+
+    def bulk_upsert_teams(self, teams: list[Team]) -> list[UUID]:
+        """Upsert multiple teams in a single pipelined batch.
+        
+        Returns:
+            Team IDs in the same order as the input
+        """
+        if not teams:
+            return []
+        with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+            cur.executemany(
+                """
+                INSERT INTO "Teams" ("Id", "Name", "Slug", "ShortName", "LogoUrl",
+                                    "PrimaryColor")
+                VALUES (%s, %s, %s, %s, %s, %s)
+                ON CONFLICT ("Slug") DO UPDATE SET
+                    "Name" = EXCLUDED."Name",
+                    "ShortName" = EXCLUDED."ShortName",
+                    "LogoUrl" = EXCLUDED."LogoUrl",
+                    "PrimaryColor" = EXCLUDED."PrimaryColor"
+                RETURNING "Id"
+                """,
+                [
+                    (
+                        str(team.id),
+                        team.name,
+                        team.slug,
+                        team.short_name,
+                        team.logo_url,
+                        team.primary_color,
+                    )
+                    for team in teams
+                ],
+                returning=True,
+            )
+            ids = _fetch_returned_ids(cur, [team.id for team in teams])
+            conn.commit()
+        return ids
+
+    def bulk_upsert_driver_aliases(self, aliases: list[DriverAlias]) -> None:
+        """Upsert multiple driver aliases in a single pipelined batch."""
+        if not aliases:
+            return
+        with self._get_connection() as conn, conn.cursor() as cur:
+            cur.executemany(
+                """
+                INSERT INTO "DriverAliases" ("Id", "DriverId", "AliasName", "AliasSlug",
+                                            "SeriesId", "DriverNumber", "ValidFrom",
+                                            "ValidUntil", "Source")
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT ("DriverId", "AliasSlug") DO UPDATE SET
+                    "AliasName" = EXCLUDED."AliasName",
+                    "SeriesId" = EXCLUDED."SeriesId",
+                    "DriverNumber" = EXCLUDED."DriverNumber",
+                    "ValidFrom" = EXCLUDED."ValidFrom",
+                    "ValidUntil" = EXCLUDED."ValidUntil",
+                    "Source" = EXCLUDED."Source"
+                """,
+                [
+                    (
+                        str(alias.id),
+                        str(alias.driver_id),
+                        alias.alias_name,
+                        alias.alias_slug,
+                        str(alias.series_id) if alias.series_id else None,
+                        alias.driver_number,
+                        alias.valid_from,
+                        alias.valid_until,
+                        alias.source,
+                    )
+                    for alias in aliases
+                ],
+            )
+            conn.commit()
+
+    def bulk_upsert_team_aliases(self, aliases: list[TeamAlias]) -> None:
+        """Upsert multiple team aliases in a single pipelined batch."""
+        if not aliases:
+            return
+        with self._get_connection() as conn, conn.cursor() as cur:
+            cur.executemany(
+                """
+                INSERT INTO "TeamAliases" ("Id", "TeamId", "AliasName", "AliasSlug",
+                                          "SeriesId", "ValidFrom", "ValidUntil", "Source")
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT ("TeamId", "AliasSlug") DO UPDATE SET
+                    "AliasName" = EXCLUDED."AliasName",
+                    "SeriesId" = EXCLUDED."SeriesId",
+                    "ValidFrom" = EXCLUDED."ValidFrom",
+                    "ValidUntil" = EXCLUDED."ValidUntil",
+                    "Source" = EXCLUDED."Source"
+                """,
+                [
+                    (
+                        str(alias.id),
+                        str(alias.team_id),
+                        alias.alias_name,
+                        alias.alias_slug,
+                        str(alias.series_id) if alias.series_id else None,
+                        alias.valid_from,
+                        alias.valid_until,
+                        alias.source,
+                    )
+                    for alias in aliases
+                ],
+            )
+            conn.commit()
+
     def delete_results_for_year(self, year: int, series_slug: str = "formula-1") -> int:
         """Delete all results for a specific year.
         
@@ -6,10 +6,11 @@ from various sources (OpenF1, Ergast) into the ParcFerme database.
 """
 
 from ingestion.services.base import BaseSyncService, SyncStats
-from ingestion.services.ergast import ErgastSyncService
+from ingestion.services.ergast import ErgastSyncService, EventsImportStats
 
 __all__ = [
     "BaseSyncService",
     "SyncStats",
     "ErgastSyncService",
+    "EventsImportStats",
 ]
@@ -13,6 +13,7 @@ Specific sync services (OpenF1, Ergast) extend this base to add
 source-specific logic and optimizations.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import date, timedelta
@@ -57,6 +58,40 @@ from ingestion.sync import SyncOptions
 
 logger = structlog.get_logger()
 
+# Source -> domain enum mappings
+_SESSION_TYPE_MAP: dict[SourceSessionType, SessionType] = {
+    SourceSessionType.PRACTICE_1: SessionType.FP1,
+    SourceSessionType.PRACTICE_2: SessionType.FP2,
+    SourceSessionType.PRACTICE_3: SessionType.FP3,
+    SourceSessionType.QUALIFYING: SessionType.QUALIFYING,
+    SourceSessionType.SPRINT_QUALIFYING: SessionType.SPRINT_QUALIFYING,
+    SourceSessionType.SPRINT: SessionType.SPRINT,
+    SourceSessionType.RACE: SessionType.RACE,
+    SourceSessionType.WARMUP: SessionType.WARMUP,
+}
+
+_SESSION_STATUS_MAP: dict[SourceSessionStatus, SessionStatus] = {
+    SourceSessionStatus.SCHEDULED: SessionStatus.SCHEDULED,
+    SourceSessionStatus.IN_PROGRESS: SessionStatus.IN_PROGRESS,
+    SourceSessionStatus.COMPLETED: SessionStatus.COMPLETED,
+    SourceSessionStatus.CANCELLED: SessionStatus.CANCELLED,
+}
+
+_RESULT_STATUS_MAP: dict[SourceResultStatus, ResultStatus] = {
+    SourceResultStatus.FINISHED: ResultStatus.FINISHED,
+    SourceResultStatus.DNF: ResultStatus.DNF,
+    SourceResultStatus.DNS: ResultStatus.DNS,
+    SourceResultStatus.DSQ: ResultStatus.DSQ,
+    SourceResultStatus.NC: ResultStatus.NC,
+}
+
+# Result status as raw ints, for the per-row COPY path: a plain-int dict
+# lookup skips the enum member access and .value property on every row
+RESULT_STATUS_VALUES: dict[int, int] = {
+    int(source): int(domain) for source, domain in _RESULT_STATUS_MAP.items()
+}
+
+
 # Type variable for the data source
 TDataSource = TypeVar("TDataSource", bound=BaseDataSource)
 
@@ -152,6 +187,7 @@ class BaseSyncService(ABC, Generic[TDataSource]):
                 repository=self._repository,
                 series_id=self._series_id,
             )
+            self._entity_resolver.prime()
         return self._data_source, self._repository
     
     def close(self) -> None:
@@ -219,6 +255,23 @@ class BaseSyncService(ABC, Generic[TDataSource]):
         logger.info("Created season", year=year, season_id=str(season_id))
         return season_id
     
+    def _ensure_seasons(self, repo: RacingRepository, years: list[int]) -> int:
+        """Ensure seasons exist for all years with one batched repository call.
+        
+        Returns:
+            Number of seasons created.
+        """
+        missing = [year for year in years if year not in self._season_cache]
+        if not missing:
+            return 0
+        
+        series_id = self._ensure_series(repo)
+        season_ids, created_years = repo.ensure_seasons(series_id, missing)
+        self._season_cache.update(season_ids)
+        if created_years:
+            logger.info("Created seasons", years=created_years)
+        return len(created_years)
+    
     def _get_or_create_circuit(
         self,
         repo: RacingRepository,
@@ -242,7 +295,16 @@ class BaseSyncService(ABC, Generic[TDataSource]):
             logger.warning("Circuit not found but skip mode enabled", slug=slug)
             raise ValueError(f"Circuit not found: {slug}")
         
-        circuit = Circuit(
+        circuit = self._circuit_from_source(source_circuit, slug)
+        circuit_id = repo.upsert_circuit(circuit)
+        self._circuit_cache[slug] = circuit_id
+        logger.info("Created circuit", name=circuit.name, circuit_id=str(circuit_id))
+        return circuit_id
+    
+    @staticmethod
+    def _circuit_from_source(source_circuit: SourceCircuit, slug: str) -> Circuit:
+        """Build a domain Circuit from source data."""
+        return Circuit(
             name=source_circuit.name,
             slug=slug,
             location=source_circuit.location or source_circuit.name,
@@ -252,23 +314,38 @@ class BaseSyncService(ABC, Generic[TDataSource]):
             longitude=source_circuit.longitude,
             length_meters=source_circuit.length_meters,
         )
-        circuit_id = repo.upsert_circuit(circuit)
-        self._circuit_cache[slug] = circuit_id
-        logger.info("Created circuit", name=circuit.name, circuit_id=str(circuit_id))
-        return circuit_id
+    
+    @staticmethod
+    def _driver_cache_key(source_driver: SourceDriver) -> str:
+        """Key for the driver cache: racing number if known, otherwise name slug.
+        
+        Keys are interned since the same drivers recur across every meeting.
+        """
+        if source_driver.driver_number:
+            return sys.intern(str(source_driver.driver_number))
+        return sys.intern(slugify(source_driver.full_name))
+    
+    @staticmethod
+    def _team_cache_key(source_team: SourceTeam) -> str:
+        """Key for the team cache: the interned name slug."""
+        return sys.intern(slugify(source_team.name))
     
     def _get_or_create_driver(
         self,
         repo: RacingRepository,
         source_driver: SourceDriver,
         options: SyncOptions,
-    ) -> UUID:
+    ) -> UUID | None:
         """Get or create a driver from source data.
         
         Uses EntityResolver for intelligent matching and alias tracking.
+        
+        Returns:
+            The driver ID, or None if the driver is new and skip mode is enabled
+            (the skip is logged here so callers can simply `continue`).
         """
         # Check cache first
-        cache_key = str(source_driver.driver_number) if source_driver.driver_number else slugify(source_driver.full_name)
+        cache_key = self._driver_cache_key(source_driver)
         if cache_key in self._driver_cache:
             return self._driver_cache[cache_key]
         
@@ -287,7 +364,7 @@ class BaseSyncService(ABC, Generic[TDataSource]):
         if resolved.is_new:
             if options.driver_mode == "skip":
                 logger.warning("New driver found but skip mode enabled", name=source_driver.full_name)
-                raise ValueError(f"Driver not found: {source_driver.full_name}")
+                return None
             
             logger.info(
                 "Creating new driver",
@@ -379,9 +456,13 @@ class BaseSyncService(ABC, Generic[TDataSource]):
         repo: RacingRepository,
         source_team: SourceTeam,
         options: SyncOptions,
-    ) -> UUID:
-        """Get or create a team from source data."""
-        slug = slugify(source_team.name)
+    ) -> UUID | None:
+        """Get or create a team from source data.
+        
+        Returns:
+            The team ID, or None if the team is new and skip mode is enabled.
+        """
+        slug = self._team_cache_key(source_team)
         
         if slug in self._team_cache:
             return self._team_cache[slug]
@@ -396,7 +477,7 @@ class BaseSyncService(ABC, Generic[TDataSource]):
         if resolved.is_new:
             if options.team_mode == "skip":
                 logger.warning("New team found but skip mode enabled", name=source_team.name)
-                raise ValueError(f"Team not found: {source_team.name}")
+                return None
             
             logger.info("Creating new team", name=resolved.team.name)
             team_id = repo.upsert_team(resolved.team)
@@ -470,38 +551,15 @@ class BaseSyncService(ABC, Generic[TDataSource]):
     
     def _map_session_type(self, source_type: SourceSessionType) -> SessionType:
         """Map source session type to domain session type."""
-        mapping = {
-            SourceSessionType.PRACTICE_1: SessionType.FP1,
-            SourceSessionType.PRACTICE_2: SessionType.FP2,
-            SourceSessionType.PRACTICE_3: SessionType.FP3,
-            SourceSessionType.QUALIFYING: SessionType.QUALIFYING,
-            SourceSessionType.SPRINT_QUALIFYING: SessionType.SPRINT_QUALIFYING,
-            SourceSessionType.SPRINT: SessionType.SPRINT,
-            SourceSessionType.RACE: SessionType.RACE,
-            SourceSessionType.WARMUP: SessionType.WARMUP,
-        }
-        return mapping.get(source_type, SessionType.RACE)
+        return _SESSION_TYPE_MAP.get(source_type, SessionType.RACE)
     
     def _map_session_status(self, source_status: SourceSessionStatus) -> SessionStatus:
         """Map source session status to domain session status."""
-        mapping = {
-            SourceSessionStatus.SCHEDULED: SessionStatus.SCHEDULED,
-            SourceSessionStatus.IN_PROGRESS: SessionStatus.IN_PROGRESS,
-            SourceSessionStatus.COMPLETED: SessionStatus.COMPLETED,
-            SourceSessionStatus.CANCELLED: SessionStatus.CANCELLED,
-        }
-        return mapping.get(source_status, SessionStatus.SCHEDULED)
+        return _SESSION_STATUS_MAP.get(source_status, SessionStatus.SCHEDULED)
     
     def _map_result_status(self, source_status: SourceResultStatus) -> ResultStatus:
         """Map source result status to domain result status."""
-        mapping = {
-            SourceResultStatus.FINISHED: ResultStatus.FINISHED,
-            SourceResultStatus.DNF: ResultStatus.DNF,
-            SourceResultStatus.DNS: ResultStatus.DNS,
-            SourceResultStatus.DSQ: ResultStatus.DSQ,
-            SourceResultStatus.NC: ResultStatus.NC,
-        }
-        return mapping.get(source_status, ResultStatus.FINISHED)
+        return _RESULT_STATUS_MAP.get(source_status, ResultStatus.FINISHED)
     
     # =========================================================================
     # High-Level Sync Operations
@@ -556,9 +614,11 @@ class BaseSyncService(ABC, Generic[TDataSource]):
             print(f"\n  🏎️  [{i}/{len(sorted_meetings)}] {meeting.name} ({meeting_type})")
             
             try:
-                self._sync_meeting(
-                    data_source, repo, meeting, season_id, include_results, stats, round_number, options
-                )
+                # One connection serves all of the meeting's writes
+                with repo.pinned_connection():
+                    self._sync_meeting(
+                        data_source, repo, meeting, season_id, include_results, stats, round_number, options
+                    )
                 stats.meetings_synced += 1
             except Exception as e:
                 print(f"      ❌ Error: {e}")
@@ -660,15 +720,14 @@ class BaseSyncService(ABC, Generic[TDataSource]):
         
         for source_driver in drivers:
             try:
-                slug = slugify(source_driver.full_name)
-                # Use entity resolver to check if driver exists
-                # For simplicity, just track counts here
-                self._get_or_create_driver(repo, source_driver, options)
-                counts["created"] += 1  # Simplified counting
-            except ValueError:
-                counts["skipped"] += 1
+                driver_id = self._get_or_create_driver(repo, source_driver, options)
             except Exception as e:
                 logger.warning("Failed to import driver", name=source_driver.full_name, error=str(e))
+                continue
+            if driver_id is None:
+                counts["skipped"] += 1
+                continue
+            counts["created"] += 1  # Simplified counting
         
         return counts
     
@@ -687,11 +746,13 @@ class BaseSyncService(ABC, Generic[TDataSource]):
         
         for source_team in teams:
             try:
-                self._get_or_create_team(repo, source_team, options)
-                counts["created"] += 1  # Simplified counting
-            except ValueError:
-                counts["skipped"] += 1
+                team_id = self._get_or_create_team(repo, source_team, options)
             except Exception as e:
                 logger.warning("Failed to import team", name=source_team.name, error=str(e))
+                continue
+            if team_id is None:
+                counts["skipped"] += 1
+                continue
+            counts["created"] += 1  # Simplified counting
         
         return counts
@@ -5,25 +5,26 @@ Imports historical F1 data (1950-2017) from the Ergast PostgreSQL database
 into the ParcFerme database.
 """
 
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import timedelta
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import structlog  # type: ignore
 
-from ingestion.entity_resolver import EntityResolver
-from ingestion.matching.normalization import normalize_name
+from ingestion.entity_resolver import EntityResolver, ResolvedDriver, ResolvedTeam
+from ingestion.matching.distance import LevenshteinTrie
+from ingestion.matching.normalization import normalize_name_variants, normalize_names
 from ingestion.models import (
     Circuit,
     Driver,
     DriverAlias,
     Entrant,
-    Result,
     ResultStatus,
     Round,
-    Season,
     Session,
-    SessionStatus,
     SessionType,
     Team,
     TeamAlias,
@@ -31,6 +32,7 @@ from ingestion.models import (
 )
 from ingestion.repository import RacingRepository
 from ingestion.services import BaseSyncService, SyncStats
+from ingestion.services.base import RESULT_STATUS_VALUES
 from ingestion.sources import (
     ErgastConfig,
     ErgastDataSource,
@@ -50,7 +52,35 @@ from ingestion.sync import SyncOptions
 logger = structlog.get_logger()
 
 
-# Use normalize_name from matching module (imported above) instead of local function
+@dataclass(slots=True)
+class EventsImportStats:
+    """Statistics from importing Ergast events (rounds, sessions, entrants).
+    
+    Per-year stats are summed into a range total with `+=`.
+    """
+    years_processed: int = 0
+    rounds_created: int = 0
+    sessions_created: int = 0
+    entrants_created: int = 0
+    errors: list[str] = field(default_factory=list)
+    
+    def __iadd__(self, other: "EventsImportStats") -> "EventsImportStats":
+        self.years_processed += other.years_processed
+        self.rounds_created += other.rounds_created
+        self.sessions_created += other.sessions_created
+        self.entrants_created += other.entrants_created
+        self.errors.extend(other.errors)
+        return self
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "years_processed": self.years_processed,
+            "rounds_created": self.rounds_created,
+            "sessions_created": self.sessions_created,
+            "entrants_created": self.entrants_created,
+            "errors": self.errors,
+        }
 
 
 class ErgastSyncService(BaseSyncService[ErgastDataSource]):
@@ -89,6 +119,11 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
     ) -> None:
         super().__init__(data_source, repository)
         self._config = config
+        # Serializes circuit/driver/team get-or-create when years import concurrently,
+        # so two workers never create the same entity
+        self._entity_lock = threading.RLock()
+        # Overlaps independent Ergast reads (sessions, entrants, results) for a meeting
+        self._fetch_pool: ThreadPoolExecutor | None = None
     
     @property
     def data_source_class(self) -> type[ErgastDataSource]:
@@ -109,8 +144,23 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
                 repository=self._repository,
                 series_id=self._series_id,
             )
+            self._entity_resolver.prime()
+        self._get_fetch_pool()
         return self._data_source, self._repository
     
+    def _get_fetch_pool(self) -> ThreadPoolExecutor:
+        """Get the thread pool used to overlap Ergast reads, creating it on first use."""
+        if self._fetch_pool is None:
+            self._fetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ergast-fetch")
+        return self._fetch_pool
+    
+    def close(self) -> None:
+        """Shut down the fetch pool and close owned clients."""
+        if self._fetch_pool is not None:
+            self._fetch_pool.shutdown(wait=True)
+            self._fetch_pool = None
+        super().close()
+    
     # =========================================================================
     # Ergast-Specific Sync Methods
     # =========================================================================
@@ -127,18 +177,24 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
         options: SyncOptions,
     ) -> None:
         """Sync a single meeting (race weekend) from Ergast."""
+        teams_before = len(self._team_cache)
+        
+        # Sessions and entrants don't depend on the round, so fetch them while
+        # the circuit and round are written
+        pool = self._get_fetch_pool()
+        sessions_future = pool.submit(data_source.get_sessions, meeting.source_id)
+        entrants_future = pool.submit(data_source.get_entrants, meeting.source_id)
         
         # Get or create circuit
         if meeting.circuit:
-            circuit_name = meeting.circuit.short_name or meeting.circuit.name
-            print(f"      📍 Circuit: {circuit_name}")
             circuit_id = self._get_or_create_circuit(repo, meeting.circuit, options)
             stats.circuits_synced += 1
         else:
             raise ValueError(f"Meeting {meeting.name} has no circuit data")
         
         # Create/update round
-        round_slug = slugify(f"{meeting.year}-{meeting.name}")
+        # Slugify only the name so the cached slug is reused across seasons
+        round_slug = f"{meeting.year}-{slugify(meeting.name)}"
         round_ = Round(
             season_id=season_id,
             circuit_id=circuit_id,
@@ -149,54 +205,91 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
             date_end=meeting.date_end or meeting.date_start,
             # Store Ergast race_id for reference
         )
-        round_id = repo.upsert_round(round_)
-        
-        # Get sessions for this meeting
-        sessions = data_source.get_sessions(meeting.source_id)
-        print(f"      📅 Sessions: {len(sessions)}")
+        # An identical round on a re-import means its sessions and entrants
+        # were already written; results can still change, so only skip
+        # when they aren't being synced
+        if options.skip_unchanged and not include_results:
+            round_id, round_changed = repo.upsert_round_tracked(round_)
+        else:
+            round_id, round_changed = repo.upsert_round(round_), True
+        if not round_changed:
+            sessions_future.cancel()
+            entrants_future.cancel()
+            return
+        
+        # Get sessions for this meeting, and start fetching results for the
+        # completed ones (in one batch) so they arrive while entrants are resolved
+        sessions = sessions_future.result()
+        results_future: Future[dict[str, list[SourceResult]]] | None = None
+        if include_results:
+            completed_sessions = [
+                (source_session.source_id, source_session.session_type)
+                for source_session in sessions
+                if source_session.status == SourceSessionStatus.COMPLETED
+            ]
+            if completed_sessions:
+                results_future = pool.submit(data_source.get_results_batch, completed_sessions)
         
         # Get entrants (drivers + teams)
-        entrants = data_source.get_entrants(meeting.source_id)
-        entrant_map: dict[str, UUID] = {}  # driver_source_id -> entrant_id
-        driver_number_map: dict[int, UUID] = {}  # driver_number -> entrant_id
+        entrants = entrants_future.result()
         
-        # Sync entrants
-        driver_count = 0
+        # Resolve drivers/teams (served from in-memory caches after the first
+        # sighting), then write all of the meeting's entrants in one batch
+        entrants_to_upsert: list[Entrant] = []
+        entrant_sources: list[SourceEntrant] = []
         for source_entrant in entrants:
-            try:
-                if not source_entrant.driver or not source_entrant.team:
-                    continue
-                
-                driver_id = self._get_or_create_driver(repo, source_entrant.driver, options)
-                team_id = self._get_or_create_team(repo, source_entrant.team, options)
-                
-                # Create entrant
-                entrant = Entrant(
-                    round_id=round_id,
-                    driver_id=driver_id,
-                    team_id=team_id,
-                )
-                entrant_id = repo.upsert_entrant(entrant)
-                
-                # Store in maps for result matching
-                if source_entrant.driver_source_id:
-                    entrant_map[source_entrant.driver_source_id] = entrant_id
-                if source_entrant.car_number:
-                    driver_number_map[source_entrant.car_number] = entrant_id
-                
-                stats.entrants_synced += 1
-                driver_count += 1
-                
-            except ValueError as e:
-                logger.warning("Failed to create entrant", error=str(e))
+            if not source_entrant.driver or not source_entrant.team:
+                continue
+            
+            driver_id = self._get_or_create_driver(repo, source_entrant.driver, options)
+            if driver_id is None:
+                continue
+            team_id = self._get_or_create_team(repo, source_entrant.team, options)
+            if team_id is None:
+                continue
+            
+            entrants_to_upsert.append(Entrant(
+                round_id=round_id,
+                driver_id=driver_id,
+                team_id=team_id,
+            ))
+            entrant_sources.append(source_entrant)
+        
+        entrant_ids = repo.bulk_upsert_entrants(entrants_to_upsert)
+        
+        # Maps for result matching
+        entrant_rows = list(zip(entrant_sources, entrant_ids, strict=True))
+        entrant_map: dict[str, UUID] = {  # driver_source_id -> entrant_id
+            se.driver_source_id: entrant_id
+            for se, entrant_id in entrant_rows
+            if se.driver_source_id
+        }
+        driver_number_map: dict[int, UUID] = {  # driver_number -> entrant_id
+            se.car_number: entrant_id
+            for se, entrant_id in entrant_rows
+            if se.car_number
+        }
+        
+        driver_count = len(entrant_ids)
+        stats.entrants_synced += driver_count
         
         stats.drivers_synced += driver_count
-        stats.teams_synced = len(self._team_cache)
-        print(f"      👥 Drivers: {driver_count}")
+        stats.teams_synced += len(self._team_cache) - teams_before
         
-        # Sync sessions and results
+        results_by_session: dict[str, list[SourceResult]] = {}
+        if results_future is not None:
+            try:
+                results_by_session = results_future.result()
+            except Exception as e:
+                logger.warning(
+                    "Failed to fetch results",
+                    meeting=meeting.source_id,
+                    error=str(e),
+                )
+        
+        # Sync sessions, collecting results for one write per meeting
         session_names = []
-        results_count = 0
+        meeting_results: list[tuple[Any, ...]] = []
         
         for source_session in sessions:
             session_type = self._map_session_type(source_session.session_type)
@@ -212,22 +305,13 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
             stats.sessions_synced += 1
             session_names.append(session_type.name)
             
-            # Sync results if requested and session is completed
-            if include_results and session_status == SessionStatus.COMPLETED:
+            # Sync results if requested and session is completed (prefetched above)
+            source_results = results_by_session.get(source_session.source_id)
+            if source_results:
                 try:
-                    source_results = data_source.get_results(
-                        source_session.source_id,
-                        source_session.session_type,
-                    )
-                    
-                    if source_results:
-                        results = self._process_results(
-                            source_results, session_id, entrant_map, driver_number_map
-                        )
-                        if results:
-                            repo.bulk_upsert_results(results)
-                            stats.results_synced += len(results)
-                            results_count += len(results)
+                    meeting_results.extend(self._process_result_rows(
+                        source_results, session_id, entrant_map, driver_number_map
+                    ))
                 except Exception as e:
                     logger.warning(
                         "Failed to sync results",
@@ -235,60 +319,79 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
                         error=str(e),
                     )
         
-        print(f"      🏁 Sessions synced: {', '.join(session_names)}")
-        if include_results and results_count > 0:
-            print(f"      📊 Results: {results_count}")
+        results_count = 0
+        if meeting_results:
+            try:
+                results_count = repo.bulk_copy_result_rows(meeting_results)
+                stats.results_synced += results_count
+            except Exception as e:
+                logger.warning(
+                    "Failed to sync results",
+                    meeting=meeting.source_id,
+                    error=str(e),
+                )
+        
+        if options.verbose:
+            logger.info(
+                "Meeting synced",
+                meeting=meeting.name,
+                circuit=meeting.circuit.short_name or meeting.circuit.name,
+                sessions=session_names,
+                drivers=driver_count,
+                results=results_count,
+            )
     
-    def _process_results(
+    def _process_result_rows(
         self,
         source_results: list[SourceResult],
         session_id: UUID,
         entrant_map: dict[str, UUID],
         driver_number_map: dict[int, UUID],
-    ) -> list[Result]:
-        """Process source results into domain Result objects."""
-        results = []
-        
-        for sr in source_results:
-            # Find entrant by driver_source_id or driver_number
-            entrant_id = None
-            if sr.driver_source_id and sr.driver_source_id in entrant_map:
-                entrant_id = entrant_map[sr.driver_source_id]
-            elif sr.driver_number and sr.driver_number in driver_number_map:
-                entrant_id = driver_number_map[sr.driver_number]
-            
-            if not entrant_id:
-                logger.debug(
-                    "No entrant found for result",
-                    driver_source_id=sr.driver_source_id,
-                    driver_number=sr.driver_number,
-                )
-                continue
-            
-            result = Result(
-                session_id=session_id,
-                entrant_id=entrant_id,
-                position=sr.position,
-                grid_position=sr.grid_position,
-                status=self._map_result_status(sr.status),
-                status_detail=sr.status_detail,
-                points=sr.points,
-                time_milliseconds=sr.time_milliseconds,
-                laps=sr.laps,
-                fastest_lap=sr.fastest_lap,
-                fastest_lap_number=sr.fastest_lap_number,
-                fastest_lap_rank=sr.fastest_lap_rank,
-                fastest_lap_time=sr.fastest_lap_time,
-                fastest_lap_speed=sr.fastest_lap_speed,
-                q1_time=sr.q1_time,
-                q2_time=sr.q2_time,
-                q3_time=sr.q3_time,
-                laps_led=sr.laps_led,
-                car_number=sr.car_number,
+    ) -> list[tuple[Any, ...]]:
+        """Process source results into raw rows for repo.bulk_copy_result_rows.
+        
+        Rows follow RESULT_ROW_COLUMNS; skipping a Result model per row avoids
+        pydantic validation on tens of thousands of historical results.
+        Entrants are matched by driver_source_id first, then driver_number.
+        """
+        entrant_get = entrant_map.get
+        number_get = driver_number_map.get
+        status_get = RESULT_STATUS_VALUES.get
+        finished = int(ResultStatus.FINISHED)
+        
+        rows = [
+            (
+                uuid4(),
+                session_id,
+                entrant_id,
+                sr.position,
+                sr.grid_position,
+                status_get(sr.status, finished),
+                sr.status_detail,
+                sr.points,
+                sr.time_milliseconds,
+                sr.laps,
+                sr.fastest_lap,
+                sr.fastest_lap_number,
+                sr.fastest_lap_rank,
+                sr.fastest_lap_time,
+                sr.fastest_lap_speed,
+                sr.q1_time,
+                sr.q2_time,
+                sr.q3_time,
             )
-            results.append(result)
+            for sr in source_results
+            if (entrant_id := entrant_get(sr.driver_source_id) or number_get(sr.driver_number))
+        ]
         
-        return results
+        if len(rows) < len(source_results):
+            logger.debug(
+                "No entrant found for results",
+                session_id=str(session_id),
+                dropped=len(source_results) - len(rows),
+            )
+        
+        return rows
     
     # =========================================================================
     # Bulk Import Methods (Ergast-specific)
@@ -311,41 +414,86 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
             "errors": [],
         }
         
-        print("\n🏎️  Importing circuits from Ergast...")
+        logger.info("Importing circuits from Ergast")
         source_circuits = data_source.get_all_circuits()
         stats["source_count"] = len(source_circuits)
-        print(f"   Found {len(source_circuits)} circuits in Ergast database")
-        
-        for circuit in source_circuits:
-            try:
-                slug = slugify(circuit.short_name or circuit.name)
-                existing = repo.get_circuit_by_slug(slug)
-                
-                if existing:
-                    stats["matched"] += 1
-                    # Create alias if name differs
-                    if circuit.name != existing.name:
-                        # TODO: Create CircuitAlias
-                        stats["aliases_created"] += 1
-                        logger.debug(
-                            "Circuit name variation",
-                            existing=existing.name,
-                            ergast=circuit.name,
-                        )
-                else:
-                    self._get_or_create_circuit(repo, circuit, options)
-                    stats["created"] += 1
-                    
-            except Exception as e:
-                stats["errors"].append(f"Circuit {circuit.name}: {e}")
-                logger.warning("Failed to import circuit", name=circuit.name, error=str(e))
+        logger.info("Found Ergast circuits", count=len(source_circuits))
+        
+        # Classify the whole batch against one prefetch of existing circuits
+        slugs = [slugify(circuit.short_name or circuit.name) for circuit in source_circuits]
+        existing_by_slug = repo.get_circuits_by_slugs(slugs)
+        new_circuits: dict[str, Circuit] = {}  # slug -> circuit to create
+        
+        for circuit, slug in zip(source_circuits, slugs, strict=True):
+            existing = existing_by_slug.get(slug)
+            if existing:
+                self._circuit_cache[slug] = existing.id
+                stats["matched"] += 1
+                # Create alias if name differs
+                if circuit.name != existing.name:
+                    # TODO: Create CircuitAlias
+                    stats["aliases_created"] += 1
+                    logger.debug(
+                        "Circuit name variation",
+                        existing=existing.name,
+                        ergast=circuit.name,
+                    )
+            elif options.circuit_mode == "skip":
+                stats["errors"].append(f"Circuit {circuit.name}: not found (skip mode)")
+                logger.warning("Circuit not found but skip mode enabled", slug=slug)
+            elif slug not in new_circuits:
+                new_circuits[slug] = self._circuit_from_source(circuit, slug)
         
-        print(f"   ✅ Created: {stats['created']}, Matched: {stats['matched']}")
-        if stats["errors"]:
-            print(f"   ⚠️  Errors: {len(stats['errors'])}")
+        try:
+            circuit_ids = repo.bulk_upsert_circuits(list(new_circuits.values()))
+        except Exception as e:
+            stats["errors"].append(f"Circuit bulk upsert: {e}")
+            logger.warning("Failed to import circuits", count=len(new_circuits), error=str(e))
+        else:
+            for slug, circuit_id in zip(new_circuits, circuit_ids, strict=True):
+                self._circuit_cache[slug] = circuit_id
+            stats["created"] += len(circuit_ids)
+        
+        logger.info(
+            "Imported circuits",
+            created=stats["created"],
+            matched=stats["matched"],
+            errors=len(stats["errors"]),
+        )
         
         return stats
     
+    def _resolve_source_driver(
+        self, driver: SourceDriver, stats: dict[str, Any]
+    ) -> ResolvedDriver | None:
+        """Resolve one source driver; on failure record the error and return None."""
+        assert self._entity_resolver is not None
+        try:
+            return self._entity_resolver.resolve_driver(
+                full_name=driver.full_name,
+                first_name=driver.first_name,
+                last_name=driver.last_name,
+                driver_number=driver.driver_number,
+                abbreviation=driver.abbreviation,
+                nationality=driver.nationality,
+            )
+        except Exception as e:
+            stats["errors"].append(f"Driver {driver.full_name}: {e}")
+            logger.warning("Failed to resolve driver", name=driver.full_name, error=str(e))
+            return None
+    
+    def _resolve_source_team(
+        self, team: SourceTeam, stats: dict[str, Any]
+    ) -> ResolvedTeam | None:
+        """Resolve one source team; on failure record the error and return None."""
+        assert self._entity_resolver is not None
+        try:
+            return self._entity_resolver.resolve_team(name=team.name)
+        except Exception as e:
+            stats["errors"].append(f"Team {team.name}: {e}")
+            logger.warning("Failed to resolve team", name=team.name, error=str(e))
+            return None
+    
     def import_drivers_with_stats(self, options: SyncOptions | None = None) -> dict[str, Any]:
         """Import all Ergast drivers with detailed statistics."""
         data_source, repo = self._ensure_clients()
@@ -362,47 +510,77 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
             "errors": [],
         }
         
-        print("\n👤 Importing drivers from Ergast...")
+        logger.info("Importing drivers from Ergast")
         source_drivers = data_source.get_all_drivers()
         stats["source_count"] = len(source_drivers)
-        print(f"   Found {len(source_drivers)} drivers in Ergast database")
-        
-        for i, driver in enumerate(source_drivers, 1):
-            if i % 100 == 0:
-                print(f"   Processing... {i}/{len(source_drivers)}")
-            
-            try:
-                # Use entity resolver to check for existing
-                assert self._entity_resolver is not None
-                resolved = self._entity_resolver.resolve_driver(
-                    full_name=driver.full_name,
-                    first_name=driver.first_name,
-                    last_name=driver.last_name,
-                    driver_number=driver.driver_number,
-                    abbreviation=driver.abbreviation,
-                    nationality=driver.nationality,
-                )
-                
-                if resolved.is_new:
-                    # Create new driver
-                    self._get_or_create_driver(repo, driver, options)
-                    stats["created"] += 1
-                else:
-                    stats["matched"] += 1
-                    # Create aliases if needed
-                    if resolved.aliases_to_add:
-                        for alias in resolved.aliases_to_add:
-                            alias.driver_id = resolved.existing_id
-                            repo.upsert_driver_alias(alias)
-                            stats["aliases_created"] += 1
-                            
-            except Exception as e:
-                stats["errors"].append(f"Driver {driver.full_name}: {e}")
-                logger.warning("Failed to import driver", name=driver.full_name, error=str(e))
+        logger.info("Found Ergast drivers", count=len(source_drivers))
+        
+        assert self._entity_resolver is not None
+        
+        # Resolve and classify each driver (a failing row is recorded and
+        # skipped), then write new drivers and all aliases in bulk
+        new_drivers: dict[str, tuple[SourceDriver, ResolvedDriver]] = {}  # slug -> resolution
+        repeated: list[tuple[SourceDriver, ResolvedDriver]] = []
+        aliases: list[DriverAlias] = []
+        for driver in source_drivers:
+            resolved = self._resolve_source_driver(driver, stats)
+            if resolved is None:
+                continue
+            if not resolved.is_new:
+                stats["matched"] += 1
+                for alias in resolved.aliases_to_add:
+                    alias.driver_id = resolved.existing_id
+                    aliases.append(alias)
+            elif options.driver_mode == "skip":
+                logger.warning("New driver found but skip mode enabled", name=driver.full_name)
+            elif resolved.driver.slug in new_drivers:
+                # Same new driver appears twice in the source; it takes the
+                # id of the first occurrence once that has been written
+                repeated.append((driver, resolved))
+                stats["matched"] += 1
+            else:
+                new_drivers[resolved.driver.slug] = (driver, resolved)
         
-        print(f"   ✅ Created: {stats['created']}, Matched: {stats['matched']}, Aliases: {stats['aliases_created']}")
-        if stats["errors"]:
-            print(f"   ⚠️  Errors: {len(stats['errors'])}")
+        ids_by_slug: dict[str, UUID] = {}
+        try:
+            driver_ids = repo.bulk_upsert_drivers([r.driver for _, r in new_drivers.values()])
+        except Exception as e:
+            stats["errors"].append(f"Driver bulk import: {e}")
+            logger.warning("Failed to import drivers", error=str(e))
+        else:
+            for (_, resolved), driver_id in zip(new_drivers.values(), driver_ids, strict=True):
+                resolved.driver.id = driver_id
+                self._entity_resolver.update_cache_after_upsert(driver=resolved.driver)
+                ids_by_slug[resolved.driver.slug] = driver_id
+            stats["created"] += len(driver_ids)
+        
+        for driver, resolved in [*new_drivers.values(), *repeated]:
+            driver_id = ids_by_slug.get(resolved.driver.slug)
+            if driver_id is None:
+                continue
+            for alias in resolved.aliases_to_add:
+                alias.driver_id = driver_id
+                aliases.append(alias)
+                self._entity_resolver.add_alias_to_cache(driver_alias=alias)
+            self._driver_cache[self._driver_cache_key(driver)] = driver_id
+        
+        # Aliases are written on their own, so matched drivers keep theirs
+        # even if the new-driver write failed
+        try:
+            repo.bulk_upsert_driver_aliases(aliases)
+        except Exception as e:
+            stats["errors"].append(f"Driver aliases: {e}")
+            logger.warning("Failed to import driver aliases", error=str(e))
+        else:
+            stats["aliases_created"] += len(aliases)
+        
+        logger.info(
+            "Imported drivers",
+            created=stats["created"],
+            matched=stats["matched"],
+            aliases=stats["aliases_created"],
+            errors=len(stats["errors"]),
+        )
         
         return stats
     
@@ -422,37 +600,72 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
             "errors": [],
         }
         
-        print("\n🏢 Importing teams from Ergast...")
+        logger.info("Importing teams from Ergast")
         source_teams = data_source.get_all_teams()
         stats["source_count"] = len(source_teams)
-        print(f"   Found {len(source_teams)} teams/constructors in Ergast database")
+        logger.info("Found Ergast constructors", count=len(source_teams))
+        
+        assert self._entity_resolver is not None
         
+        new_teams: dict[str, tuple[SourceTeam, ResolvedTeam]] = {}  # slug -> resolution
+        repeated: list[tuple[SourceTeam, ResolvedTeam]] = []
+        aliases: list[TeamAlias] = []
         for team in source_teams:
-            try:
-                # Use entity resolver
-                assert self._entity_resolver is not None
-                resolved = self._entity_resolver.resolve_team(
-                    name=team.name,
-                )
-                
-                if resolved.is_new:
-                    self._get_or_create_team(repo, team, options)
-                    stats["created"] += 1
-                else:
-                    stats["matched"] += 1
-                    if resolved.aliases_to_add:
-                        for alias in resolved.aliases_to_add:
-                            alias.team_id = resolved.existing_id
-                            repo.upsert_team_alias(alias)
-                            stats["aliases_created"] += 1
-                            
-            except Exception as e:
-                stats["errors"].append(f"Team {team.name}: {e}")
-                logger.warning("Failed to import team", name=team.name, error=str(e))
+            resolved = self._resolve_source_team(team, stats)
+            if resolved is None:
+                continue
+            if not resolved.is_new:
+                stats["matched"] += 1
+                for alias in resolved.aliases_to_add:
+                    alias.team_id = resolved.existing_id
+                    aliases.append(alias)
+            elif options.team_mode == "skip":
+                logger.warning("New team found but skip mode enabled", name=team.name)
+            elif resolved.team.slug in new_teams:
+                repeated.append((team, resolved))
+                stats["matched"] += 1
+            else:
+                new_teams[resolved.team.slug] = (team, resolved)
         
-        print(f"   ✅ Created: {stats['created']}, Matched: {stats['matched']}, Aliases: {stats['aliases_created']}")
-        if stats["errors"]:
-            print(f"   ⚠️  Errors: {len(stats['errors'])}")
+        ids_by_slug: dict[str, UUID] = {}
+        try:
+            team_ids = repo.bulk_upsert_teams([r.team for _, r in new_teams.values()])
+        except Exception as e:
+            stats["errors"].append(f"Team bulk import: {e}")
+            logger.warning("Failed to import teams", error=str(e))
+        else:
+            for (_, resolved), team_id in zip(new_teams.values(), team_ids, strict=True):
+                resolved.team.id = team_id
+                self._entity_resolver.update_cache_after_upsert(team=resolved.team)
+                ids_by_slug[resolved.team.slug] = team_id
+                self._team_cache[resolved.team.slug] = team_id
+            stats["created"] += len(team_ids)
+        
+        for team, resolved in [*new_teams.values(), *repeated]:
+            team_id = ids_by_slug.get(resolved.team.slug)
+            if team_id is None:
+                continue
+            for alias in resolved.aliases_to_add:
+                alias.team_id = team_id
+                aliases.append(alias)
+                self._entity_resolver.add_alias_to_cache(team_alias=alias)
+            self._team_cache[self._team_cache_key(team)] = team_id
+        
+        try:
+            repo.bulk_upsert_team_aliases(aliases)
+        except Exception as e:
+            stats["errors"].append(f"Team aliases: {e}")
+            logger.warning("Failed to import team aliases", error=str(e))
+        else:
+            stats["aliases_created"] += len(aliases)
+        
+        logger.info(
+            "Imported teams",
+            created=stats["created"],
+            matched=stats["matched"],
+            aliases=stats["aliases_created"],
+            errors=len(stats["errors"]),
+        )
         
         return stats
     
@@ -470,15 +683,7 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
         
         print(f"\n📅 Creating F1 seasons {start_year}-{end_year}...")
         
-        series_id = self._ensure_series(repo)
-        created = 0
-        
-        for year in range(start_year, end_year + 1):
-            existing = repo.get_season(series_id, year)
-            if not existing:
-                season = Season(series_id=series_id, year=year)
-                repo.upsert_season(season)
-                created += 1
+        created = self._ensure_seasons(repo, list(range(start_year, end_year + 1)))
         
         print(f"   ✅ Created {created} seasons")
         return created
@@ -487,7 +692,7 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
         self,
         year: int,
         options: SyncOptions | None = None,
-    ) -> dict[str, Any]:
+    ) -> EventsImportStats:
         """Import all rounds and sessions for a single year.
         
         This imports the race weekend structure without results.
@@ -497,84 +702,93 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
             options: Sync options controlling entity behavior
             
         Returns:
-            Dict with import statistics.
+            Import statistics for the year.
         """
         data_source, repo = self._ensure_clients()
         options = options or SyncOptions.safe_historical()
         
-        stats = {
-            "year": year,
-            "rounds_created": 0,
-            "sessions_created": 0,
-            "entrants_created": 0,
-            "errors": [],
-        }
+        stats = EventsImportStats(years_processed=1)
         
         # Ensure series and season exist
         season_id = self._ensure_season(repo, year)
         
         # Get meetings for the year
         meetings = data_source.get_meetings(year)
+        pool = self._get_fetch_pool()
         
-        for meeting in meetings:
-            try:
-                # Get or create circuit
-                if not meeting.circuit:
-                    raise ValueError(f"Meeting {meeting.name} has no circuit data")
-                
-                circuit_id = self._get_or_create_circuit(repo, meeting.circuit, options)
-                
-                # Create/update round (upsert handles existing detection)
-                round_slug = slugify(f"{year}-{meeting.name}")
-                round_ = Round(
-                    season_id=season_id,
-                    circuit_id=circuit_id,
-                    name=meeting.official_name or meeting.name,
-                    slug=round_slug,
-                    round_number=meeting.round_number or 0,
-                    date_start=meeting.date_start,
-                    date_end=meeting.date_end or meeting.date_start,
-                )
-                
-                round_id = repo.upsert_round(round_)
-                stats["rounds_created"] += 1
-                
-                # Get and create sessions
-                sessions = data_source.get_sessions(meeting.source_id)
-                for source_session in sessions:
-                    session_type = self._map_session_type(source_session.session_type)
-                    session_status = self._map_session_status(source_session.status)
+        # Pin one connection for the whole year so each write skips the pool checkout
+        with repo.pinned_connection():
+            for meeting in meetings:
+                try:
+                    # Get or create circuit
+                    if not meeting.circuit:
+                        raise ValueError(f"Meeting {meeting.name} has no circuit data")
                     
-                    session = Session(
-                        round_id=round_id,
-                        type=session_type,
-                        start_time_utc=source_session.start_time,
-                        status=session_status,
-                    )
-                    # Use upsert_session_by_round_type for Ergast (no OpenF1 key)
-                    repo.upsert_session_by_round_type(session)
-                    stats["sessions_created"] += 1
-                
-                # Get and create entrants
-                entrants = data_source.get_entrants(meeting.source_id)
-                for source_entrant in entrants:
-                    if not source_entrant.driver or not source_entrant.team:
-                        continue
+                    # Fetch sessions and entrants while the circuit and round are written
+                    sessions_future = pool.submit(data_source.get_sessions, meeting.source_id)
+                    entrants_future = pool.submit(data_source.get_entrants, meeting.source_id)
                     
-                    driver_id = self._get_or_create_driver(repo, source_entrant.driver, options)
-                    team_id = self._get_or_create_team(repo, source_entrant.team, options)
+                    with self._entity_lock:
+                        circuit_id = self._get_or_create_circuit(repo, meeting.circuit, options)
                     
-                    entrant = Entrant(
-                        round_id=round_id,
-                        driver_id=driver_id,
-                        team_id=team_id,
+                    # Create/update round (upsert handles existing detection)
+                    round_slug = f"{year}-{slugify(meeting.name)}"
+                    round_ = Round(
+                        season_id=season_id,
+                        circuit_id=circuit_id,
+                        name=meeting.official_name or meeting.name,
+                        slug=round_slug,
+                        round_number=meeting.round_number or 0,
+                        date_start=meeting.date_start,
+                        date_end=meeting.date_end or meeting.date_start,
                     )
-                    repo.upsert_entrant(entrant)
-                    stats["entrants_created"] += 1
                     
-            except Exception as e:
-                stats["errors"].append(f"Meeting {meeting.name}: {e}")
-                logger.warning("Failed to import meeting", name=meeting.name, error=str(e))
+                    round_id = repo.upsert_round(round_)
+                    stats.rounds_created += 1
+                    
+                    # Get and create sessions
+                    sessions = sessions_future.result()
+                    for source_session in sessions:
+                        session_type = self._map_session_type(source_session.session_type)
+                        session_status = self._map_session_status(source_session.status)
+                        
+                        session = Session(
+                            round_id=round_id,
+                            type=session_type,
+                            start_time_utc=source_session.start_time,
+                            status=session_status,
+                        )
+                        # Use upsert_session_by_round_type for Ergast (no OpenF1 key)
+                        repo.upsert_session_by_round_type(session)
+                        stats.sessions_created += 1
+                    
+                    # Get and create entrants, written in one batch per meeting
+                    entrants = entrants_future.result()
+                    entrants_to_upsert: list[Entrant] = []
+                    with self._entity_lock:
+                        for source_entrant in entrants:
+                            if not source_entrant.driver or not source_entrant.team:
+                                continue
+                            
+                            driver_id = self._get_or_create_driver(repo, source_entrant.driver, options)
+                            if driver_id is None:
+                                continue
+                            team_id = self._get_or_create_team(repo, source_entrant.team, options)
+                            if team_id is None:
+                                continue
+                            
+                            entrants_to_upsert.append(Entrant(
+                                round_id=round_id,
+                                driver_id=driver_id,
+                                team_id=team_id,
+                            ))
+                    
+                    repo.bulk_upsert_entrants(entrants_to_upsert)
+                    stats.entrants_created += len(entrants_to_upsert)
+                        
+                except Exception as e:
+                    stats.errors.append(f"Meeting {meeting.name}: {e}")
+                    logger.warning("Failed to import meeting", name=meeting.name, error=str(e))
         
         return stats
     
@@ -583,48 +797,58 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
         start_year: int,
         end_year: int,
         options: SyncOptions | None = None,
-    ) -> dict[str, Any]:
+        max_workers: int = 4,
+    ) -> EventsImportStats:
         """Import all rounds, sessions, and entrants for a year range.
         
+        Seasons are created up-front, then years are imported concurrently on
+        a small thread pool. Entity get-or-create is serialized by a lock;
+        Ergast reads and round/session/entrant writes run in parallel.
+        
         Args:
             start_year: First year to import
             end_year: Last year to import (inclusive)
             options: Sync options
+            max_workers: Maximum number of years imported at once
             
         Returns:
             Combined statistics for all years.
         """
         options = options or SyncOptions.safe_historical()
+        _, repo = self._ensure_clients()
         
-        total_stats = {
-            "years_processed": 0,
-            "rounds_created": 0,
-            "sessions_created": 0,
-            "entrants_created": 0,
-            "errors": [],
-        }
+        total_stats = EventsImportStats()
         
-        print(f"\n📅 Importing events for years {start_year}-{end_year}...")
+        logger.info("Importing events", start_year=start_year, end_year=end_year)
         
-        for year in range(start_year, end_year + 1):
-            print(f"\n   🏎️  Year {year}...")
+        # Seasons are the only shared dependency between years; create them
+        # before fanning out so workers only read the season cache
+        self._ensure_seasons(repo, list(range(start_year, end_year + 1)))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.import_events_for_year, year, options): year
+                for year in range(start_year, end_year + 1)
+            }
             
-            try:
-                year_stats = self.import_events_for_year(year, options)
-                
-                total_stats["years_processed"] += 1
-                total_stats["rounds_created"] += year_stats["rounds_created"]
-                total_stats["sessions_created"] += year_stats["sessions_created"]
-                total_stats["entrants_created"] += year_stats["entrants_created"]
-                total_stats["errors"].extend(year_stats["errors"])
+            for future in as_completed(futures):
+                year = futures[future]
                 
-                print(f"      ✅ Rounds: {year_stats['rounds_created']} | "
-                      f"Sessions: {year_stats['sessions_created']} | "
-                      f"Entrants: {year_stats['entrants_created']}")
-                
-            except Exception as e:
-                total_stats["errors"].append(f"Year {year}: {e}")
-                logger.error("Failed to import year", year=year, error=str(e))
+                try:
+                    year_stats = future.result()
+                    total_stats += year_stats
+                    
+                    logger.info(
+                        "Imported events for year",
+                        year=year,
+                        rounds=year_stats.rounds_created,
+                        sessions=year_stats.sessions_created,
+                        entrants=year_stats.entrants_created,
+                    )
+                    
+                except Exception as e:
+                    total_stats.errors.append(f"Year {year}: {e}")
+                    logger.error("Failed to import year", year=year, error=str(e))
         
         return total_stats
     
@@ -666,67 +890,89 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
         # Get meetings from Ergast to map round_number -> race_id
         meetings = data_source.get_meetings(year)
         meeting_by_round_number = {m.round_number: m for m in meetings}
+        match_stats: dict[str, Any] = {"matched": 0, "unmatched_rounds": []}
         
-        for round_ in rounds:
-            try:
-                # Find corresponding Ergast meeting
-                meeting = meeting_by_round_number.get(round_.round_number)
-                if not meeting:
-                    logger.debug(
-                        "No Ergast meeting found for round",
-                        round_number=round_.round_number,
-                        round_name=round_.name,
-                    )
-                    continue
-                
-                # Get sessions for this round
-                sessions = repo.get_sessions_by_round(round_.id)
-                session_by_type = {s.type: s for s in sessions}
-                
-                # Build entrant map from Ergast entrant data
-                # This maps driverRef -> entrant_id
-                entrant_map, driver_number_map = self._build_entrant_maps_for_meeting(
-                    data_source, repo, round_.id, meeting.source_id
+        # Fetch the whole year's results up front (one query per results
+        # table) rather than two queries per round
+        result_sessions: list[tuple[str, SourceSessionType]] = []
+        for meeting in meetings:
+            result_sessions.append((f"{meeting.source_id}_race", SourceSessionType.RACE))
+            if include_qualifying:
+                result_sessions.append(
+                    (f"{meeting.source_id}_qualifying", SourceSessionType.QUALIFYING)
                 )
-                
-                # Import race results
-                race_session = session_by_type.get(SessionType.RACE)
-                if race_session:
-                    race_results = data_source.get_results(
-                        f"{meeting.source_id}_race",
-                        SourceSessionType.RACE,
+        year_results = data_source.get_results_batch(result_sessions)
+        
+        with repo.pinned_connection():
+            for round_ in rounds:
+                try:
+                    # Find corresponding Ergast meeting
+                    meeting = meeting_by_round_number.get(round_.round_number)
+                    if not meeting:
+                        logger.debug(
+                            "No Ergast meeting found for round",
+                            round_number=round_.round_number,
+                            round_name=round_.name,
+                        )
+                        continue
+                    
+                    # Get sessions for this round
+                    sessions = repo.get_sessions_by_round(round_.id)
+                    session_by_type = {s.type: s for s in sessions}
+                    
+                    # Build entrant map from Ergast entrant data
+                    # This maps driverRef -> entrant_id
+                    entrant_map, driver_number_map = self._build_entrant_maps_for_meeting(
+                        data_source, repo, round_.id, meeting.source_id, match_stats
                     )
                     
-                    if race_results:
-                        results = self._process_results(
-                            race_results, race_session.id, entrant_map, driver_number_map
-                        )
-                        if results:
-                            repo.bulk_upsert_results(results)
-                            stats["race_results"] += len(results)
-                
-                # Import qualifying results
-                if include_qualifying:
-                    quali_session = session_by_type.get(SessionType.QUALIFYING)
-                    if quali_session:
-                        quali_results = data_source.get_results(
-                            f"{meeting.source_id}_qualifying",
-                            SourceSessionType.QUALIFYING,
-                        )
+                    # Race and qualifying results are written in one batch per round
+                    round_results: list[tuple[Any, ...]] = []
+                    race_count = 0
+                    quali_count = 0
+                    
+                    # Import race results
+                    race_session = session_by_type.get(SessionType.RACE)
+                    if race_session:
+                        race_results = year_results.get(f"{meeting.source_id}_race")
                         
-                        if quali_results:
-                            results = self._process_results(
-                                quali_results, quali_session.id, entrant_map, driver_number_map
+                        if race_results:
+                            results = self._process_result_rows(
+                                race_results, race_session.id, entrant_map, driver_number_map
                             )
-                            if results:
-                                repo.bulk_upsert_results(results)
-                                stats["qualifying_results"] += len(results)
-                
-                stats["rounds_processed"] += 1
-                
-            except Exception as e:
-                stats["errors"].append(f"Round {round_.name}: {e}")
-                logger.warning("Failed to import results for round", name=round_.name, error=str(e))
+                            round_results.extend(results)
+                            race_count = len(results)
+                    
+                    # Import qualifying results
+                    if include_qualifying:
+                        quali_session = session_by_type.get(SessionType.QUALIFYING)
+                        if quali_session:
+                            quali_results = year_results.get(f"{meeting.source_id}_qualifying")
+                            
+                            if quali_results:
+                                results = self._process_result_rows(
+                                    quali_results, quali_session.id, entrant_map, driver_number_map
+                                )
+                                round_results.extend(results)
+                                quali_count = len(results)
+                    
+                    if round_results:
+                        repo.bulk_copy_result_rows(round_results)
+                        stats["race_results"] += race_count
+                        stats["qualifying_results"] += quali_count
+                    
+                    stats["rounds_processed"] += 1
+                    
+                except Exception as e:
+                    stats["errors"].append(f"Round {round_.name}: {e}")
+                    logger.warning("Failed to import results for round", name=round_.name, error=str(e))
+        
+        logger.info(
+            "Year matched",
+            year=year,
+            total_matched=match_stats["matched"],
+            unmatched_rounds=match_stats["unmatched_rounds"],
+        )
         
         return stats
     
@@ -736,12 +982,17 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
         repo: RacingRepository,
         round_id: UUID,
         meeting_source_id: str,
+        match_stats: dict[str, Any] | None = None,
     ) -> tuple[dict[str, UUID], dict[int, UUID]]:
         """Build entrant maps for a meeting by matching Ergast drivers to our entrants.
         
         Uses normalized name matching to handle special characters in driver names
         (e.g., Hülkenberg vs Hulkenberg, Pérez vs Perez, Räikkönen vs Raikkonen).
         
+        If match_stats is given, "matched" is incremented and rounds with
+        unmatched drivers are appended to "unmatched_rounds", so the caller
+        can log one summary instead of one event per round.
+        
         Returns:
             Tuple of (driver_source_id -> entrant_id, driver_number -> entrant_id)
         """
@@ -754,35 +1005,69 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
         # Get our entrants for this round with driver info
         our_entrants = repo.get_entrants_with_drivers_by_round(round_id)
         
-        # Build BOTH normalized and exact name lookups for our entrants
-        # This handles cases where names have special characters
-        our_entrants_by_normalized_name: dict[str, dict] = {}
-        our_entrants_by_exact_name: dict[str, dict] = {}
+        # Build a single name lookup for our entrants, keyed by the exact
+        # lowercase name, the normalized name and the spelling-variant key.
+        # Exact keys are inserted unconditionally; the looser keys never
+        # override an existing key, so exact matches keep priority.
+        our_entrants_by_name: dict[str, dict] = {}
         
-        for e in our_entrants:
-            full_name = f"{e['first_name']} {e['last_name']}"
+        our_full_names = [f"{e['first_name']} {e['last_name']}" for e in our_entrants]
+        our_normalized_names = normalize_names(our_full_names)
+        
+        for e, full_name, normalized_key in zip(
+            our_entrants, our_full_names, our_normalized_names, strict=True
+        ):
             exact_key = full_name.lower()
-            normalized_key = normalize_name(full_name)
             
-            our_entrants_by_exact_name[exact_key] = e
-            our_entrants_by_normalized_name[normalized_key] = e
+            our_entrants_by_name[exact_key] = e
+            if exact_key != normalized_key:
+                shadowed = our_entrants_by_name.setdefault(normalized_key, e)
+                if shadowed is not e:
+                    logger.warning(
+                        "Ambiguous normalized driver name for round",
+                        round_id=str(round_id),
+                        normalized_name=normalized_key,
+                        kept=f"{shadowed['first_name']} {shadowed['last_name']}",
+                        ignored=full_name,
+                    )
+            our_entrants_by_name.setdefault(normalize_name_variants(full_name), e)
         
         matched_count = 0
         unmatched_drivers = []
-        
-        for ergast_entrant in ergast_entrants:
-            if not ergast_entrant.driver:
-                continue
-            
-            ergast_full_name = ergast_entrant.driver.full_name
-            
-            # Try exact match first (preserves special characters)
-            our_entrant = our_entrants_by_exact_name.get(ergast_full_name.lower())
-            
-            # Fall back to normalized match (handles Hülkenberg→Hulkenberg, etc.)
+        fuzzy_trie: LevenshteinTrie | None = None  # Built on the first miss
+        
+        # Pull the driver name off each entrant once, up-front, and normalize
+        # the whole list in a single batch
+        matchable_entrants = [e for e in ergast_entrants if e.driver]
+        ergast_full_names = [e.driver.full_name for e in matchable_entrants]
+        normalized_ergast_names = normalize_names(ergast_full_names)
+        
+        for ergast_entrant, ergast_full_name, normalized_ergast_name in zip(
+            matchable_entrants, ergast_full_names, normalized_ergast_names, strict=True
+        ):
+            # Exact match first (preserves special characters), then normalized
+            # (handles Hülkenberg→Hulkenberg, etc.), then spelling variants
+            # (Wladimir→Vladimir) against the same dict. For pure-ASCII names
+            # the normalized key is the exact key, so that probe is skipped.
+            our_entrant = our_entrants_by_name.get(ergast_full_name.lower())
+            if not our_entrant and not ergast_full_name.isascii():
+                our_entrant = our_entrants_by_name.get(normalized_ergast_name)
             if not our_entrant:
-                normalized_ergast_name = normalize_name(ergast_full_name)
-                our_entrant = our_entrants_by_normalized_name.get(normalized_ergast_name)
+                our_entrant = our_entrants_by_name.get(normalize_name_variants(ergast_full_name))
+            
+            # Last resort: unique nearest name within a small edit distance
+            if not our_entrant and our_entrants:
+                if fuzzy_trie is None:
+                    fuzzy_trie = LevenshteinTrie()
+                    for e, normalized_key in zip(our_entrants, our_normalized_names, strict=True):
+                        fuzzy_trie.insert(normalized_key, e)
+                our_entrant = self._fuzzy_match_entrant(fuzzy_trie, normalized_ergast_name)
+                if our_entrant:
+                    logger.debug(
+                        "Fuzzy-matched Ergast driver",
+                        ergast_name=ergast_full_name,
+                        matched=f"{our_entrant['first_name']} {our_entrant['last_name']}",
+                    )
             
             if our_entrant:
                 entrant_id = our_entrant['entrant_id']
@@ -805,31 +1090,58 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
                 unmatched_count=len(unmatched_drivers),
                 unmatched_drivers=unmatched_drivers[:5],  # Log first 5
             )
-        else:
-            logger.debug(
-                "All Ergast drivers matched",
-                round_id=str(round_id),
-                matched_count=matched_count,
-            )
+        
+        if match_stats is not None:
+            match_stats["matched"] += matched_count
+            if unmatched_drivers:
+                match_stats["unmatched_rounds"].append(str(round_id))
         
         return entrant_map, driver_number_map
     
+    @staticmethod
+    def _fuzzy_match_entrant(
+        trie: LevenshteinTrie,
+        normalized_name: str,
+        max_distance: int = 2,
+    ) -> dict | None:
+        """Find the unique closest entrant to a normalized name within max_distance edits.
+        
+        Returns None when nothing is close enough, or when the best match
+        is not at least one edit closer than the runner-up (ambiguous).
+        """
+        matches = trie.search(normalized_name, max_distance)
+        if not matches:
+            return None
+        _, best, best_distance = matches[0]
+        if len(matches) > 1 and matches[1][2] - best_distance < 1:
+            return None
+        return best
+    
     def import_results_for_year_range(
         self,
         start_year: int,
         end_year: int,
         include_qualifying: bool = True,
+        max_workers: int = 4,
     ) -> dict[str, Any]:
         """Import race and qualifying results for a year range.
         
+        Years are independent of each other, so they are imported concurrently
+        on a small thread pool. Database concurrency is bounded by the Ergast
+        and repository connection pools.
+        
         Args:
             start_year: First year to import
             end_year: Last year to import (inclusive)
             include_qualifying: Whether to import qualifying results
+            max_workers: Maximum number of years imported at once
             
         Returns:
             Combined statistics for all years.
         """
+        # Make sure clients exist before workers start, so they share them
+        self._ensure_clients()
+        
         total_stats = {
             "years_processed": 0,
             "race_results": 0,
@@ -838,27 +1150,38 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
             "errors": [],
         }
         
-        print(f"\n📊 Importing results for years {start_year}-{end_year}...")
+        logger.info("Importing results", start_year=start_year, end_year=end_year)
         
-        for year in range(start_year, end_year + 1):
-            print(f"\n   🏎️  Year {year}...")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.import_results_for_year, year, include_qualifying): year
+                for year in range(start_year, end_year + 1)
+            }
             
-            try:
-                year_stats = self.import_results_for_year(year, include_qualifying)
-                
-                total_stats["years_processed"] += 1
-                total_stats["race_results"] += year_stats["race_results"]
-                total_stats["qualifying_results"] += year_stats["qualifying_results"]
-                total_stats["rounds_processed"] += year_stats["rounds_processed"]
-                total_stats["errors"].extend(year_stats["errors"])
-                
-                print(f"      ✅ Race results: {year_stats['race_results']} | "
-                      f"Qualifying results: {year_stats['qualifying_results']} | "
-                      f"Rounds: {year_stats['rounds_processed']}")
+            # Stats are aggregated here on the calling thread, so no locking is needed
+            for future in as_completed(futures):
+                year = futures[future]
                 
-            except Exception as e:
-                total_stats["errors"].append(f"Year {year}: {e}")
-                logger.error("Failed to import year", year=year, error=str(e))
+                try:
+                    year_stats = future.result()
+                    
+                    total_stats["years_processed"] += 1
+                    total_stats["race_results"] += year_stats["race_results"]
+                    total_stats["qualifying_results"] += year_stats["qualifying_results"]
+                    total_stats["rounds_processed"] += year_stats["rounds_processed"]
+                    total_stats["errors"].extend(year_stats["errors"])
+                    
+                    logger.info(
+                        "Imported results for year",
+                        year=year,
+                        race_results=year_stats["race_results"],
+                        qualifying_results=year_stats["qualifying_results"],
+                        rounds=year_stats["rounds_processed"],
+                    )
+                    
+                except Exception as e:
+                    total_stats["errors"].append(f"Year {year}: {e}")
+                    logger.error("Failed to import year", year=year, error=str(e))
         
         return total_stats
     
@@ -891,19 +1214,22 @@ class ErgastSyncService(BaseSyncService[ErgastDataSource]):
             results["years_available"] = data_source.get_available_years()
             print(f"   Years: {results['years_available'][0]} - {results['years_available'][-1]}")
             
-            # Get counts by year
-            results["counts_by_year"] = data_source.count_by_year()
-            
-            # Sum totals
-            for year_counts in results["counts_by_year"].values():
-                results["totals"]["races"] += year_counts["races"]
-                results["totals"]["results"] += year_counts["results"]
-                results["totals"]["qualifying"] += year_counts["qualifying_results"]
+            # Get counts by year; the totals are sums over the few years
+            counts_by_year = data_source.count_by_year()
+            results["counts_by_year"] = counts_by_year
+            year_counts = counts_by_year.values()
+            results["totals"]["races"] = sum(y["races"] for y in year_counts)
+            results["totals"]["results"] = sum(y["results"] for y in year_counts)
+            results["totals"]["qualifying"] = sum(
+                y["qualifying_results"] for y in year_counts
+            )
             
-            # Get reference data counts
-            results["totals"]["circuits"] = len(data_source.get_all_circuits())
-            results["totals"]["drivers"] = len(data_source.get_all_drivers())
-            results["totals"]["teams"] = len(data_source.get_all_teams())
+            # Get reference data counts (counted in SQL, no rows transferred)
+            (
+                results["totals"]["circuits"],
+                results["totals"]["drivers"],
+                results["totals"]["teams"],
+            ) = data_source.get_reference_counts()
             
             print(f"   Circuits: {results['totals']['circuits']}")
             print(f"   Drivers: {results['totals']['drivers']}")
@@ -10,11 +10,19 @@ The source models are intentionally flat and simple - they represent what
 the source provides, not our internal domain model complexity.
 """
 
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import date, datetime
 from enum import IntEnum
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar, cast, overload
+
+if TYPE_CHECKING:
+    from _typeshed import DataclassInstance
+
+_T = TypeVar("_T", bound="DataclassInstance")
 
 
 class DataSourceError(Exception):
@@ -42,12 +50,64 @@ class DataSourceRateLimited(DataSourceError):
         self.retry_after = retry_after
 
 
+@overload
+def intern_str(value: str) -> str: ...
+@overload
+def intern_str(value: str | None) -> str | None: ...
+def intern_str(value: str | None) -> str | None:
+    """Intern a string that recurs across many source rows.
+    
+    Adapters pass identifiers and labels (refs, codes, nationalities, team
+    names) through this so a whole import shares one object per value.
+    """
+    return sys.intern(value) if value else value
+
+
+def fast_constructor(cls: type[_T]) -> Callable[..., _T]:
+    """Generate a keyword-only constructor for a frozen, slotted source model.
+    
+    The generated function has the same signature and defaults as the
+    dataclass __init__, but stores each value through the slot descriptor
+    directly instead of going through the frozen object.__setattr__ path.
+    Meant for per-row converters that build thousands of instances.
+    """
+    if hasattr(cls, "__post_init__"):
+        raise TypeError(f"{cls.__name__} defines __post_init__; use the regular constructor")
+    
+    namespace: dict[str, Any] = {"_new": object.__new__, "_cls": cls}
+    params: list[str] = []
+    body: list[str] = []
+    for f in fields(cls):
+        if f.default is MISSING:
+            raise TypeError(f"{cls.__name__}.{f.name} has no plain default")
+        namespace[f"_default_{f.name}"] = f.default
+        namespace[f"_set_{f.name}"] = cls.__dict__[f.name].__set__
+        params.append(f"{f.name}=_default_{f.name}")
+        body.append(f"    _set_{f.name}(self, {f.name})")
+    
+    source = (
+        f"def build(*, {', '.join(params)}):\n"
+        "    self = _new(_cls)\n"
+        + "\n".join(body)
+        + "\n    return self\n"
+    )
+    exec(source, namespace)
+    build = namespace["build"]
+    build.__qualname__ = build.__name__ = f"build_{cls.__name__}"
+    build.__doc__ = f"Build a {cls.__name__} without the frozen __init__ overhead."
+    return cast("Callable[..., _T]", build)
+
+
 # =============================================================================
 # Source Models - Generic representations from external data sources
 # =============================================================================
 
+# Source models are built once per source row and never mutated afterwards,
+# so they are frozen and slotted: no per-instance __dict__, and hashable.
+# SourceMeetingData is a mutable container and is only slotted.
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SourceCircuit:
     """Circuit data from an external source.
     
@@ -69,7 +129,7 @@ class SourceCircuit:
     source_id: str | None = None  # e.g., "albert_park" for Ergast, circuit_key for OpenF1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SourceDriver:
     """Driver data from an external source."""
     first_name: str
@@ -85,13 +145,17 @@ class SourceDriver:
     # Source-specific identifiers
     source_id: str | None = None  # e.g., "hamilton" for Ergast, driver_number for OpenF1
     
-    @property
-    def full_name(self) -> str:
-        """Full name for display and matching."""
-        return f"{self.first_name} {self.last_name}"
+    # Full name for display and matching, built once (see __post_init__)
+    full_name: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Interned so repeated slug/cache lookups hash and compare one object
+        object.__setattr__(
+            self, "full_name", sys.intern(f"{self.first_name} {self.last_name}")
+        )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SourceTeam:
     """Team/constructor data from an external source."""
     name: str
@@ -105,7 +169,7 @@ class SourceTeam:
     source_id: str | None = None  # e.g., "mclaren" for Ergast
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SourceMeeting:
     """Meeting (race weekend) data from an external source.
     
@@ -150,7 +214,7 @@ class SourceSessionStatus(IntEnum):
     CANCELLED = 3
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SourceSession:
     """Session data from an external source."""
     session_type: SourceSessionType
@@ -171,7 +235,7 @@ class SourceResultStatus(IntEnum):
     NC = 4  # Not Classified
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SourceResult:
     """Result data from an external source.
     
@@ -205,7 +269,11 @@ class SourceResult:
     car_number: str | None = None  # Entry's car number (string for #6T, #00, etc.)
 
 
-@dataclass
+# Results are the highest-volume source rows; adapters build them through this.
+build_source_result = fast_constructor(SourceResult)
+
+
+@dataclass(slots=True, frozen=True)
 class SourceEntrant:
     """Entrant (driver-team pairing for a round) from an external source."""
     driver: SourceDriver | None = None
@@ -215,7 +283,7 @@ class SourceEntrant:
     car_number: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceMeetingData:
     """Complete meeting data including sessions, entrants, and results.
     
@@ -260,6 +328,10 @@ class BaseDataSource(ABC):
     default_series_slug: str = "formula-1"
     default_series_name: str = "Formula 1"
     
+    # Upper bound on in-flight get_* calls when a meeting's data is fetched
+    # concurrently; sources with strict rate limits should lower it
+    max_concurrent_requests: int = 4
+    
     @abstractmethod
     def get_available_years(self) -> list[int]:
         """Get list of years for which data is available.
@@ -337,37 +409,77 @@ class BaseDataSource(ABC):
         """
         pass
     
-    def get_meeting_data(self, meeting_source_id: str, include_results: bool = True) -> SourceMeetingData | None:
+    def get_results_batch(
+        self,
+        sessions: list[tuple[str, SourceSessionType]],
+    ) -> dict[str, list[SourceResult]]:
+        """Get results for several sessions at once.
+        
+        The default calls get_results for each session, at most
+        ``max_concurrent_requests`` at a time. Data sources that can filter on
+        many sessions in one request should override this.
+        
+        Args:
+            sessions: (session_source_id, session_type) pairs
+            
+        Returns:
+            Results keyed by session source ID (sessions without results are omitted)
+        """
+        if not sessions:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as pool:
+            fetched = pool.map(lambda session: self.get_results(*session), sessions)
+            return {
+                session_source_id: results
+                for (session_source_id, _), results in zip(sessions, fetched, strict=True)
+                if results
+            }
+    
+    def get_meeting_data(self, meeting: SourceMeeting, include_results: bool = True) -> SourceMeetingData | None:
         """Get complete data for a meeting including sessions, entrants, and results.
         
         This is a convenience method that fetches all related data for a meeting.
+        Entrants are fetched concurrently with the sessions and the completed
+        sessions' results (via get_results_batch).
         Data sources may override this for more efficient fetching.
         
         Args:
-            meeting_source_id: The source-specific meeting identifier
+            meeting: The meeting to fetch data for
             include_results: Whether to fetch result data
             
         Returns:
             Complete meeting data or None if meeting not found
         """
-        # Get meeting details
-        sessions = self.get_sessions(meeting_source_id)
-        if not sessions:
+        if not meeting.source_id:
             return None
         
-        entrants = self.get_entrants(meeting_source_id)
-        
-        results_by_session: dict[str, list[SourceResult]] = {}
-        if include_results:
-            for session in sessions:
-                if session.source_id and session.status == SourceSessionStatus.COMPLETED:
-                    results = self.get_results(session.source_id, session.session_type)
-                    if results:
-                        results_by_session[session.source_id] = results
+        # Entrants only need the meeting id, so they are fetched alongside
+        # the sessions and then the results, rather than after them
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            entrants_future = pool.submit(self.get_entrants, meeting.source_id)
+            
+            sessions = self.get_sessions(meeting.source_id)
+            if not sessions:
+                entrants_future.cancel()
+                return None
+            
+            completed = [
+                (session.source_id, session.session_type)
+                for session in sessions
+                if include_results
+                and session.source_id
+                and session.status == SourceSessionStatus.COMPLETED
+            ]
+            results_by_session = self.get_results_batch(completed)
+            entrants = entrants_future.result()
         
-        # Note: Meeting info would need to be passed in or fetched separately
-        # This method is mostly meant to be overridden by subclasses
-        raise NotImplementedError("Subclasses should override get_meeting_data")
+        return SourceMeetingData(
+            meeting=meeting,
+            sessions=sessions,
+            entrants=entrants,
+            results_by_session=results_by_session,
+        )
     
     def get_all_circuits(self) -> list[SourceCircuit]:
         """Get all circuits from this source.
@@ -5,8 +5,11 @@ Reads historical F1 data (1950-2017) from the Ergast PostgreSQL database
 and transforms it to our generic SourceXxx models.
 """
 
+import os
+import re
+import sys
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta, timezone
 from typing import Any, Generator
 
@@ -29,6 +32,8 @@ from ingestion.sources.base import (
     SourceSessionStatus,
     SourceSessionType,
     SourceTeam,
+    build_source_result,
+    intern_str,
 )
 
 logger = structlog.get_logger()
@@ -47,6 +52,36 @@ ERGAST_STATUS_MAP: dict[int, tuple[SourceResultStatus, str | None]] = {
 # Status IDs that indicate DNS
 DNS_STATUS_IDS = {54, 77, 81, 97}  # Withdrew, 107% Rule, Did not qualify, Did not prequalify
 
+# Lap time as "[M:]SS[.fff]"; parsed in integer arithmetic to avoid float rounding
+_LAP_TIME_RE = re.compile(r"(?:(\d+):)?(\d+)(?:\.(\d{1,3}))?")
+
+# The Ergast dump ships without primary keys or indexes (see docs/ERGAST_DDL.md),
+# so every per-race query would scan its table. These cover the hot lookups:
+# results/qualifying by race (ordered), entrants (DISTINCT ON driverId), races
+# by year, and the by-ref point lookups.
+ERGAST_INDEXES = (
+    'CREATE INDEX IF NOT EXISTS races_raceid_idx ON races ("raceId")',
+    'CREATE INDEX IF NOT EXISTS races_year_round_idx ON races (year, round)',
+    'CREATE INDEX IF NOT EXISTS results_race_positionorder_idx ON results ("raceId", "positionOrder")',
+    'CREATE INDEX IF NOT EXISTS results_race_driver_idx ON results ("raceId", "driverId", "resultId")',
+    'CREATE INDEX IF NOT EXISTS qualifying_race_position_idx ON qualifying ("raceId", position)',
+    'CREATE INDEX IF NOT EXISTS drivers_driverid_idx ON drivers ("driverId")',
+    'CREATE INDEX IF NOT EXISTS drivers_driverref_idx ON drivers ("driverRef")',
+    'CREATE INDEX IF NOT EXISTS constructors_constructorid_idx ON constructors ("constructorId")',
+    'CREATE INDEX IF NOT EXISTS constructors_constructorref_idx ON constructors ("constructorRef")',
+    'CREATE INDEX IF NOT EXISTS circuits_circuitref_idx ON circuits ("circuitRef")',
+)
+
+
+
+def _race_id_of(session_source_id: str) -> int:
+    """Extract the raceId from a session source_id ("{raceId}_race" / "{raceId}_qualifying").
+    
+    The suffix stays in the id because session ids key results_by_session, where
+    a race and its qualifying must not collide; session_type drives dispatch.
+    """
+    return int(session_source_id.partition("_")[0])
+
 
 @dataclass
 class ErgastConfig:
@@ -56,9 +91,29 @@ class ErgastConfig:
     user: str = "parcferme"
     password: str = "localdev"
     database: str = "ergastf1"  # Separate database from main parcferme DB
+    # Directory holding the Postgres Unix socket (e.g. /var/run/postgresql).
+    # When the Ergast DB runs on the same machine - or in a docker-compose
+    # service with the socket directory mounted - this skips the TCP loopback
+    # on every query. host/port are ignored when it is set.
+    unix_socket_dir: str | None = None
+    # Create ERGAST_INDEXES on connect (idempotent; needs table ownership)
+    create_indexes: bool = True
+    
+    # Pool sizing. Callers fanning out over a ThreadPoolExecutor (e.g. the
+    # parallel year imports) should keep pool_max_size >= their worker count,
+    # otherwise workers queue for a connection and the import runs serially.
+    pool_min_size: int = 2
+    pool_max_size: int = field(default_factory=lambda: max(5, (os.cpu_count() or 1) * 2))
+    pool_max_idle: float = 300.0  # seconds before an idle connection above min is closed
+    pool_max_lifetime: float = 3600.0  # seconds before a connection is recycled
     
     @property
     def connection_string(self) -> str:
+        if self.unix_socket_dir:
+            return (
+                f"postgresql://{self.user}:{self.password}@/{self.database}"
+                f"?host={self.unix_socket_dir}"
+            )
         return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
 
 
@@ -86,18 +141,40 @@ class ErgastDataSource(BaseDataSource):
         self._config = config or ErgastConfig()
         self._pool: ConnectionPool | None = None
         self._status_cache: dict[int, str] = {}  # statusId -> status text
+        # statusId -> (status, detail), resolved once per id from the status table
+        self._status_resolution: dict[int, tuple[SourceResultStatus, str | None]] = {}
+        self._quali_race_ids: set[int] = set()  # raceIds with qualifying rows (static)
+        # circuitRef -> circuit (frozen, so one instance is shared by every
+        # meeting at that circuit; None caches a miss)
+        self._circuit_cache: dict[str, SourceCircuit | None] = {}
+        # driverRef / constructorRef -> point-lookup result (None caches a miss)
+        self._driver_cache: dict[str, SourceDriver | None] = {}
+        self._team_cache: dict[str, SourceTeam | None] = {}
+        # raceId (as str) -> sessions, filled by get_meetings so get_sessions
+        # needs no round-trip for meetings it has already seen
+        self._session_cache: dict[str, list[SourceSession]] = {}
     
     def connect(self) -> None:
         """Initialize the database connection pool."""
         try:
             self._pool = ConnectionPool(
                 self._config.connection_string,
-                min_size=1,
-                max_size=5,
+                min_size=self._config.pool_min_size,
+                max_size=self._config.pool_max_size,
+                max_idle=self._config.pool_max_idle,
+                max_lifetime=self._config.pool_max_lifetime,
+                check=ConnectionPool.check_connection,
+                # Prepare every parameterized query on first use. The same few
+                # statements run once per race, and pooled connections keep
+                # their prepared statements (the pool has no reset hook), so
+                # the parse/plan step is paid once per connection.
+                kwargs={"prepare_threshold": 0},
                 open=True,
             )
             logger.info("Connected to Ergast database", database=self._config.database)
-            self._load_status_cache()
+            if self._config.create_indexes:
+                self._ensure_indexes()
+            self._load_lookup_caches()
         except Exception as e:
             raise DataSourceUnavailable(f"Failed to connect to Ergast database: {e}", self.source_name) from e
     
@@ -107,6 +184,10 @@ class ErgastDataSource(BaseDataSource):
             self._pool.close()
             self._pool = None
             logger.info("Closed Ergast database connection")
+        self._circuit_cache.clear()
+        self._driver_cache.clear()
+        self._team_cache.clear()
+        self._session_cache.clear()
     
     def __enter__(self) -> "ErgastDataSource":
         self.connect()
@@ -123,12 +204,35 @@ class ErgastDataSource(BaseDataSource):
         with self._pool.connection() as conn:
             yield conn
     
-    def _load_status_cache(self) -> None:
-        """Load status codes from the status table."""
-        with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
-            cur.execute('SELECT "statusId", status FROM status')
-            for row in cur.fetchall():
-                self._status_cache[row["statusId"]] = row["status"]
+    def _ensure_indexes(self) -> None:
+        """Create the indexes the per-race queries rely on, if missing."""
+        try:
+            with self._get_connection() as conn, conn.cursor() as cur:
+                for ddl in ERGAST_INDEXES:
+                    cur.execute(ddl)
+        except psycopg.Error as e:
+            # Read-only or non-owner roles can still query, just more slowly
+            logger.warning("Could not create Ergast indexes", error=str(e))
+    
+    def _load_lookup_caches(self) -> None:
+        """Load status codes and the raceIds that have qualifying data.
+        
+        Both queries are sent in one pipeline so connecting costs a single
+        round-trip for the two lookups.
+        """
+        with (
+            self._get_connection() as conn,
+            conn.pipeline(),
+            conn.cursor() as status_cur,
+            conn.cursor() as quali_cur,
+        ):
+            status_cur.execute('SELECT "statusId", status FROM status')
+            quali_cur.execute('SELECT DISTINCT "raceId" FROM qualifying')
+            self._status_cache = dict(status_cur.fetchall())
+            self._status_resolution = {
+                status_id: self._resolve_status(status_id) for status_id in self._status_cache
+            }
+            self._quali_race_ids = {race_id for (race_id,) in quali_cur.fetchall()}
     
     def _get_status_text(self, status_id: int) -> str:
         """Get status text for a status ID."""
@@ -136,6 +240,13 @@ class ErgastDataSource(BaseDataSource):
     
     def _convert_result_status(self, status_id: int) -> tuple[SourceResultStatus, str | None]:
         """Convert Ergast statusId to our result status enum and detail text."""
+        resolved = self._status_resolution.get(status_id)
+        if resolved is None:
+            resolved = self._status_resolution[status_id] = self._resolve_status(status_id)
+        return resolved
+    
+    def _resolve_status(self, status_id: int) -> tuple[SourceResultStatus, str | None]:
+        """Classify a statusId (see _convert_result_status, which memoizes this)."""
         status_text = self._get_status_text(status_id)
         
         if status_id == 1:
@@ -164,7 +275,12 @@ class ErgastDataSource(BaseDataSource):
             return [row["year"] for row in cur.fetchall()]
     
     def get_meetings(self, year: int) -> list[SourceMeeting]:
-        """Get all race weekends (rounds) for a year."""
+        """Get all race weekends (rounds) for a year.
+        
+        Sessions for every returned meeting are built from the same rows and
+        cached, so a following get_sessions() call is answered without
+        touching the database.
+        """
         with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
             cur.execute('''
                 SELECT 
@@ -180,8 +296,9 @@ class ErgastDataSource(BaseDataSource):
                     c.name as circuit_name,
                     c.location,
                     c.country,
-                    c.lat,
-                    c.lng,
+                    c.lat::float8 AS lat,
+                    c.lng::float8 AS lng,
+                    initcap(replace(c."circuitRef", '_', ' ')) AS short_name,
                     c.alt,
                     c.url as circuit_url
                 FROM races r
@@ -192,18 +309,22 @@ class ErgastDataSource(BaseDataSource):
             
             meetings = []
             for row in cur.fetchall():
-                # Build circuit from joined data
-                circuit = SourceCircuit(
-                    name=row["circuit_name"],
-                    short_name=row["circuitRef"].replace("_", " ").title() if row["circuitRef"] else None,
-                    location=row["location"],
-                    country=row["country"],
-                    latitude=float(row["lat"]) if row["lat"] else None,
-                    longitude=float(row["lng"]) if row["lng"] else None,
-                    altitude=row["alt"],
-                    wikipedia_url=row["circuit_url"],
-                    source_id=row["circuitRef"],
-                )
+                # Build circuit from joined data (reused across years)
+                circuit = self._circuit_cache.get(row["circuitRef"])
+                if circuit is None:
+                    circuit = SourceCircuit(
+                        name=row["circuit_name"],
+                        short_name=row["short_name"],
+                        location=row["location"],
+                        country=intern_str(row["country"]),
+                        latitude=row["lat"],
+                        longitude=row["lng"],
+                        altitude=row["alt"],
+                        wikipedia_url=row["circuit_url"],
+                        source_id=intern_str(row["circuitRef"]),
+                    )
+                    if circuit.source_id:
+                        self._circuit_cache[circuit.source_id] = circuit
                 
                 meetings.append(SourceMeeting(
                     name=row["name"],
@@ -216,11 +337,22 @@ class ErgastDataSource(BaseDataSource):
                     circuit=circuit,
                     source_id=str(row["raceId"]),
                 ))
+                self._session_cache[str(row["raceId"])] = self._build_sessions(
+                    row["raceId"], row["date"], row["time"]
+                )
             
             return meetings
     
     def get_circuit(self, source_id: str) -> SourceCircuit | None:
-        """Get circuit by circuitRef (slug)."""
+        """Get circuit by circuitRef (slug), memoized per source instance."""
+        if source_id in self._circuit_cache:
+            return self._circuit_cache[source_id]
+        circuit = self._fetch_circuit(source_id)
+        self._circuit_cache[source_id] = circuit
+        return circuit
+    
+    def _fetch_circuit(self, source_id: str) -> SourceCircuit | None:
+        """Query a circuit by circuitRef."""
         with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
             cur.execute('''
                 SELECT 
@@ -229,8 +361,9 @@ class ErgastDataSource(BaseDataSource):
                     name,
                     location,
                     country,
-                    lat,
-                    lng,
+                    lat::float8 AS lat,
+                    lng::float8 AS lng,
+                    initcap(replace("circuitRef", '_', ' ')) AS short_name,
                     alt,
                     url
                 FROM circuits
@@ -243,11 +376,11 @@ class ErgastDataSource(BaseDataSource):
             
             return SourceCircuit(
                 name=row["name"],
-                short_name=row["circuitRef"].replace("_", " ").title(),
+                short_name=row["short_name"],
                 location=row["location"],
                 country=row["country"],
-                latitude=float(row["lat"]) if row["lat"] else None,
-                longitude=float(row["lng"]) if row["lng"] else None,
+                latitude=row["lat"],
+                longitude=row["lng"],
                 altitude=row["alt"],
                 wikipedia_url=row["url"],
                 source_id=row["circuitRef"],
@@ -260,59 +393,59 @@ class ErgastDataSource(BaseDataSource):
         We create a Race session for all races, and a Qualifying session
         if qualifying data exists (1994+).
         """
+        cached = self._session_cache.get(meeting_source_id)
+        if cached is not None:
+            return list(cached)
+        
         race_id = int(meeting_source_id)
-        sessions = []
         
         with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
-            # Get race info
             cur.execute('''
-                SELECT date, time, year
+                SELECT date, time
                 FROM races
                 WHERE "raceId" = %s
             ''', (race_id,))
             race_row = cur.fetchone()
+        
+        if not race_row:
+            return []
+        
+        sessions = self._build_sessions(race_id, race_row["date"], race_row["time"])
+        self._session_cache[meeting_source_id] = sessions
+        return list(sessions)
+    
+    def _build_sessions(
+        self,
+        race_id: int,
+        race_date: date,
+        race_time: time | None,
+    ) -> list[SourceSession]:
+        """Build the Race (and, if present, Qualifying) sessions for a race."""
+        # Combine date and time for race start
+        if race_time:
+            race_start = datetime.combine(race_date, race_time, tzinfo=timezone.utc)
+        else:
+            race_start = datetime.combine(race_date, time(14, 0), tzinfo=timezone.utc)  # Default 14:00 UTC
+        
+        sessions = [SourceSession(
+            session_type=SourceSessionType.RACE,
+            start_time=race_start,
+            status=SourceSessionStatus.COMPLETED,
+            source_id=f"{race_id}_race",
+        )]
+        
+        if race_id in self._quali_race_ids:
+            # Qualifying is typically the day before the race
+            # Use day before race at 14:00 UTC to ensure proper session ordering
+            quali_date = race_date - timedelta(days=1)
+            quali_start = datetime.combine(quali_date, time(14, 0), tzinfo=timezone.utc)
             
-            if not race_row:
-                return []
-            
-            race_date = race_row["date"]
-            race_time = race_row["time"]
-            year = race_row["year"]
-            
-            # Combine date and time for race start
-            if race_time:
-                race_start = datetime.combine(race_date, race_time, tzinfo=timezone.utc)
-            else:
-                race_start = datetime.combine(race_date, time(14, 0), tzinfo=timezone.utc)  # Default 14:00 UTC
-            
-            # Create Race session
             sessions.append(SourceSession(
-                session_type=SourceSessionType.RACE,
-                start_time=race_start,
+                session_type=SourceSessionType.QUALIFYING,
+                start_time=quali_start,
                 status=SourceSessionStatus.COMPLETED,
-                source_id=f"{race_id}_race",
+                source_id=f"{race_id}_qualifying",
             ))
-            
-            # Check if qualifying data exists for this race
-            cur.execute('''
-                SELECT COUNT(*) as count
-                FROM qualifying
-                WHERE "raceId" = %s
-            ''', (race_id,))
-            quali_count = cur.fetchone()["count"]
-            
-            if quali_count > 0:
-                # Qualifying is typically the day before the race
-                # Use day before race at 14:00 UTC to ensure proper session ordering
-                quali_date = race_date - timedelta(days=1)
-                quali_start = datetime.combine(quali_date, time(14, 0), tzinfo=timezone.utc)
-                
-                sessions.append(SourceSession(
-                    session_type=SourceSessionType.QUALIFYING,
-                    start_time=quali_start,
-                    status=SourceSessionStatus.COMPLETED,
-                    source_id=f"{race_id}_qualifying",
-                ))
         
         return sessions
     
@@ -323,13 +456,22 @@ class ErgastDataSource(BaseDataSource):
         driver + constructor for each race.
         """
         race_id = int(meeting_source_id)
+        return self._get_entrants_by_race([race_id]).get(race_id, [])
+    
+    def _get_entrants_by_race(self, race_ids: list[int]) -> dict[int, list[SourceEntrant]]:
+        """Get entrants for several races, keyed by raceId.
         
+        A driver's first result row in a race (lowest resultId) defines the
+        entrant; ROW_NUMBER() picks it per (race, driver) in a single pass
+        over the indexed rows instead of a sort + DISTINCT ON per race.
+        """
         with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
             cur.execute('''
-                SELECT DISTINCT ON (r."driverId")
+                SELECT 
+                    r."raceId",
                     r."driverId",
                     r."constructorId",
-                    r.number as car_number,
+                    r.car_number,
                     d."driverRef",
                     d.forename,
                     d.surname,
@@ -342,70 +484,119 @@ class ErgastDataSource(BaseDataSource):
                     c.name as team_name,
                     c.nationality as team_nationality,
                     c.url as team_url
-                FROM results r
+                FROM (
+                    SELECT 
+                        "raceId",
+                        "driverId",
+                        "constructorId",
+                        number as car_number,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY "raceId", "driverId" ORDER BY "resultId"
+                        ) as rn
+                    FROM results
+                    WHERE "raceId" = ANY(%s)
+                ) r
                 JOIN drivers d ON r."driverId" = d."driverId"
                 JOIN constructors c ON r."constructorId" = c."constructorId"
-                WHERE r."raceId" = %s
-                ORDER BY r."driverId", r."resultId"
-            ''', (race_id,))
-            
-            entrants = []
-            for row in cur.fetchall():
-                # IMPORTANT: Do NOT use driver_permanent_number for entrant creation.
-                # The 'number' column in Ergast drivers table stores the driver's
-                # permanent number from 2014+, NOT the number they raced under
-                # in historical seasons. Using it causes false matches with modern
-                # drivers (e.g., Nico Rosberg's permanent #6 matches Isack Hadjar).
-                # Instead, rely on name-based matching for historical driver resolution.
-                driver = SourceDriver(
-                    first_name=row["forename"],
-                    last_name=row["surname"],
-                    abbreviation=row["code"],
-                    nationality=row["driver_nationality"],
-                    driver_number=None,  # Don't use permanent numbers for historical matching
-                    date_of_birth=row["dob"],
-                    wikipedia_url=row["driver_url"],
-                    source_id=row["driverRef"],
-                )
-                
-                team = SourceTeam(
-                    name=row["team_name"],
-                    nationality=row["team_nationality"],
-                    wikipedia_url=row["team_url"],
-                    source_id=row["constructorRef"],
-                )
-                
-                entrants.append(SourceEntrant(
-                    driver=driver,
-                    team=team,
-                    driver_source_id=row["driverRef"],
-                    team_source_id=row["constructorRef"],
-                    car_number=row["car_number"],
-                ))
+                WHERE r.rn = 1
+                ORDER BY r."raceId", r."driverId"
+            ''', (race_ids,))
             
+            entrants: dict[int, list[SourceEntrant]] = {}
+            for row in cur:
+                entrants.setdefault(row["raceId"], []).append(self._entrant_from_row(row))
             return entrants
     
+    def _entrant_from_row(self, row: dict[str, Any]) -> SourceEntrant:
+        """Convert an entrants row (result joined with driver and constructor)."""
+        # Refs are used as dict keys for every result row; interning
+        # lets those lookups compare by identity
+        driver_ref = sys.intern(row["driverRef"])
+        constructor_ref = sys.intern(row["constructorRef"])
+        
+        # IMPORTANT: Do NOT use driver_permanent_number for entrant creation.
+        # The 'number' column in Ergast drivers table stores the driver's
+        # permanent number from 2014+, NOT the number they raced under
+        # in historical seasons. Using it causes false matches with modern
+        # drivers (e.g., Nico Rosberg's permanent #6 matches Isack Hadjar).
+        # Instead, rely on name-based matching for historical driver resolution.
+        driver = SourceDriver(
+            first_name=intern_str(row["forename"]),
+            last_name=intern_str(row["surname"]),
+            abbreviation=intern_str(row["code"]),
+            nationality=intern_str(row["driver_nationality"]),
+            driver_number=None,  # Don't use permanent numbers for historical matching
+            date_of_birth=row["dob"],
+            wikipedia_url=row["driver_url"],
+            source_id=driver_ref,
+        )
+        
+        team = SourceTeam(
+            name=intern_str(row["team_name"]),
+            nationality=intern_str(row["team_nationality"]),
+            wikipedia_url=row["team_url"],
+            source_id=constructor_ref,
+        )
+        
+        return SourceEntrant(
+            driver=driver,
+            team=team,
+            driver_source_id=driver_ref,
+            team_source_id=constructor_ref,
+            car_number=row["car_number"],
+        )
+    
     def get_results(
         self,
         session_source_id: str,
         session_type: SourceSessionType,
     ) -> list[SourceResult]:
         """Get results for a session."""
-        # Parse the session source_id (format: "{raceId}_race" or "{raceId}_qualifying")
-        parts = session_source_id.rsplit("_", 1)
-        race_id = int(parts[0])
+        race_id = _race_id_of(session_source_id)
         
         if session_type == SourceSessionType.QUALIFYING:
             return self._get_qualifying_results(race_id)
         else:
             return self._get_race_results(race_id)
     
+    def get_results_batch(
+        self,
+        sessions: list[tuple[str, SourceSessionType]],
+    ) -> dict[str, list[SourceResult]]:
+        """Get results for many sessions with one query per results table."""
+        race_sessions: dict[int, str] = {}
+        quali_sessions: dict[int, str] = {}
+        for session_source_id, session_type in sessions:
+            race_id = _race_id_of(session_source_id)
+            if session_type == SourceSessionType.QUALIFYING:
+                quali_sessions[race_id] = session_source_id
+            else:
+                race_sessions[race_id] = session_source_id
+        
+        results: dict[str, list[SourceResult]] = {}
+        if race_sessions:
+            for race_id, race_results in self._get_race_results_by_race(
+                list(race_sessions)
+            ).items():
+                results[race_sessions[race_id]] = race_results
+        if quali_sessions:
+            for race_id, quali_results in self._get_qualifying_results_by_race(
+                list(quali_sessions)
+            ).items():
+                results[quali_sessions[race_id]] = quali_results
+        return results
+    
     def _get_race_results(self, race_id: int) -> list[SourceResult]:
         """Get race results."""
+        return self._get_race_results_by_race([race_id]).get(race_id, [])
+    
+    def _get_race_results_by_race(self, race_ids: list[int]) -> dict[int, list[SourceResult]]:
+        """Get race results for several races, keyed by raceId."""
         with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
             cur.execute('''
                 SELECT 
                     r."resultId",
+                    r."raceId",
                     r."driverId",
                     r."constructorId",
                     r.number,
@@ -424,44 +615,57 @@ class ErgastDataSource(BaseDataSource):
                     d."driverRef"
                 FROM results r
                 JOIN drivers d ON r."driverId" = d."driverId"
-                WHERE r."raceId" = %s
-                ORDER BY r."positionOrder"
-            ''', (race_id,))
-            
-            results = []
-            for row in cur.fetchall():
-                status, status_detail = self._convert_result_status(row["statusId"])
-                
-                # Determine if this driver set fastest lap
-                # rank=1 means they set the fastest lap
-                has_fastest_lap = row["fastest_lap_rank"] == 1
-                
-                results.append(SourceResult(
-                    position=row["position"],
-                    grid_position=row["grid"],
-                    status=status,
-                    status_detail=status_detail,
-                    points=float(row["points"]) if row["points"] else None,
-                    laps=row["laps"],
-                    time_milliseconds=row["milliseconds"],
-                    fastest_lap=has_fastest_lap,
-                    fastest_lap_number=row["fastestLap"],
-                    fastest_lap_rank=row["fastest_lap_rank"],
-                    fastest_lap_time=row["fastestLapTime"],
-                    fastest_lap_speed=row["fastestLapSpeed"],
-                    driver_source_id=row["driverRef"],
-                    driver_number=row["number"],
-                    car_number=str(row["number"]) if row["number"] else None,
-                ))
+                WHERE r."raceId" = ANY(%s)
+                ORDER BY r."raceId", r."positionOrder"
+            ''', (race_ids,))
             
+            # Iterate the cursor rather than fetchall(): rows become dicts one at a
+            # time instead of all being materialized next to the result list
+            results: dict[int, list[SourceResult]] = {}
+            for row in cur:
+                results.setdefault(row["raceId"], []).append(self._race_result_from_row(row))
             return results
     
+    def _race_result_from_row(self, row: dict[str, Any]) -> SourceResult:
+        """Convert a results row to a SourceResult."""
+        status, status_detail = self._convert_result_status(row["statusId"])
+        
+        # Determine if this driver set fastest lap
+        # rank=1 means they set the fastest lap
+        has_fastest_lap = row["fastest_lap_rank"] == 1
+        
+        return build_source_result(
+            position=row["position"],
+            grid_position=row["grid"],
+            status=status,
+            status_detail=status_detail,
+            points=float(row["points"]) if row["points"] else None,
+            laps=row["laps"],
+            time_milliseconds=row["milliseconds"],
+            fastest_lap=has_fastest_lap,
+            fastest_lap_number=row["fastestLap"],
+            fastest_lap_rank=row["fastest_lap_rank"],
+            fastest_lap_time=row["fastestLapTime"],
+            fastest_lap_speed=row["fastestLapSpeed"],
+            driver_source_id=sys.intern(row["driverRef"]),
+            driver_number=row["number"],
+            car_number=str(row["number"]) if row["number"] else None,
+        )
+    
     def _get_qualifying_results(self, race_id: int) -> list[SourceResult]:
         """Get qualifying results."""
+        return self._get_qualifying_results_by_race([race_id]).get(race_id, [])
+    
+    def _get_qualifying_results_by_race(
+        self,
+        race_ids: list[int],
+    ) -> dict[int, list[SourceResult]]:
+        """Get qualifying results for several races, keyed by raceId."""
         with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
             cur.execute('''
                 SELECT 
                     q."qualifyId",
+                    q."raceId",
                     q."driverId",
                     q."constructorId",
                     q.number,
@@ -469,38 +673,51 @@ class ErgastDataSource(BaseDataSource):
                     q.q1,
                     q.q2,
                     q.q3,
+                    COALESCE(
+                        NULLIF(btrim(q.q3), ''),
+                        NULLIF(btrim(q.q2), ''),
+                        NULLIF(btrim(q.q1), '')
+                    ) AS best_q,
                     d."driverRef"
                 FROM qualifying q
                 JOIN drivers d ON q."driverId" = d."driverId"
-                WHERE q."raceId" = %s
-                ORDER BY q.position
-            ''', (race_id,))
-            
-            results = []
-            for row in cur.fetchall():
-                # Convert Q times to milliseconds (best qualifying time)
-                best_time_ms = None
-                for q_time in [row["q3"], row["q2"], row["q1"]]:
-                    if q_time and q_time.strip():
-                        ms = self._parse_lap_time_to_ms(q_time)
-                        if ms:
-                            best_time_ms = ms
-                            break
-                
-                results.append(SourceResult(
-                    position=row["position"],
-                    status=SourceResultStatus.FINISHED if row["position"] else SourceResultStatus.DNS,
-                    time_milliseconds=best_time_ms,
-                    q1_time=row["q1"],
-                    q2_time=row["q2"],
-                    q3_time=row["q3"],
-                    driver_source_id=row["driverRef"],
-                    driver_number=row["number"],
-                    car_number=str(row["number"]) if row["number"] else None,
-                ))
+                WHERE q."raceId" = ANY(%s)
+                ORDER BY q."raceId", q.position
+            ''', (race_ids,))
             
+            results: dict[int, list[SourceResult]] = {}
+            for row in cur:
+                results.setdefault(row["raceId"], []).append(
+                    self._qualifying_result_from_row(row)
+                )
             return results
     
+    def _qualifying_result_from_row(self, row: dict[str, Any]) -> SourceResult:
+        """Convert a qualifying row to a SourceResult."""
+        # Convert Q times to milliseconds (best qualifying time). The query
+        # picks the latest non-blank session time; only if that one does not
+        # parse do we fall back to trying each session in turn.
+        best_time_ms = self._parse_lap_time_to_ms(row["best_q"])
+        if not best_time_ms:
+            for q_time in [row["q3"], row["q2"], row["q1"]]:
+                if q_time and q_time.strip():
+                    ms = self._parse_lap_time_to_ms(q_time)
+                    if ms:
+                        best_time_ms = ms
+                        break
+        
+        return build_source_result(
+            position=row["position"],
+            status=SourceResultStatus.FINISHED if row["position"] else SourceResultStatus.DNS,
+            time_milliseconds=best_time_ms,
+            q1_time=row["q1"],
+            q2_time=row["q2"],
+            q3_time=row["q3"],
+            driver_source_id=sys.intern(row["driverRef"]),
+            driver_number=row["number"],
+            car_number=str(row["number"]) if row["number"] else None,
+        )
+    
     def _parse_lap_time_to_ms(self, time_str: str) -> int | None:
         """Parse a lap time string to milliseconds.
         
@@ -508,21 +725,17 @@ class ErgastDataSource(BaseDataSource):
         - "1:27.452" -> 87452 ms
         - "27.452" -> 27452 ms (unlikely but possible)
         """
-        if not time_str or not time_str.strip():
+        if not time_str or not (time_str := time_str.strip()):
             return None
         
-        try:
-            time_str = time_str.strip()
-            if ":" in time_str:
-                parts = time_str.split(":")
-                minutes = int(parts[0])
-                seconds_and_ms = float(parts[1])
-                return int((minutes * 60 + seconds_and_ms) * 1000)
-            else:
-                return int(float(time_str) * 1000)
-        except (ValueError, IndexError):
+        match = _LAP_TIME_RE.fullmatch(time_str)
+        if match is None:
             logger.debug("Failed to parse lap time", time_str=time_str)
             return None
+        
+        minutes, seconds, fraction = match.groups()
+        millis = int(fraction.ljust(3, "0")) if fraction else 0
+        return (int(minutes or 0) * 60 + int(seconds)) * 1000 + millis
     
     # =========================================================================
     # Bulk Import Methods
@@ -538,8 +751,9 @@ class ErgastDataSource(BaseDataSource):
                     name,
                     location,
                     country,
-                    lat,
-                    lng,
+                    lat::float8 AS lat,
+                    lng::float8 AS lng,
+                    initcap(replace("circuitRef", '_', ' ')) AS short_name,
                     alt,
                     url
                 FROM circuits
@@ -547,17 +761,17 @@ class ErgastDataSource(BaseDataSource):
             ''')
             
             circuits = []
-            for row in cur.fetchall():
+            for row in cur:
                 circuits.append(SourceCircuit(
                     name=row["name"],
-                    short_name=row["circuitRef"].replace("_", " ").title() if row["circuitRef"] else None,
+                    short_name=row["short_name"],
                     location=row["location"],
-                    country=row["country"],
-                    latitude=float(row["lat"]) if row["lat"] else None,
-                    longitude=float(row["lng"]) if row["lng"] else None,
+                    country=intern_str(row["country"]),
+                    latitude=row["lat"],
+                    longitude=row["lng"],
                     altitude=row["alt"],
                     wikipedia_url=row["url"],
-                    source_id=row["circuitRef"],
+                    source_id=intern_str(row["circuitRef"]),
                 ))
             
             logger.info("Loaded circuits from Ergast", count=len(circuits))
@@ -582,16 +796,16 @@ class ErgastDataSource(BaseDataSource):
             ''')
             
             drivers = []
-            for row in cur.fetchall():
+            for row in cur:
                 drivers.append(SourceDriver(
                     first_name=row["forename"],
                     last_name=row["surname"],
-                    abbreviation=row["code"],
-                    nationality=row["nationality"],
+                    abbreviation=intern_str(row["code"]),
+                    nationality=intern_str(row["nationality"]),
                     driver_number=row["number"],
                     date_of_birth=row["dob"],
                     wikipedia_url=row["url"],
-                    source_id=row["driverRef"],
+                    source_id=intern_str(row["driverRef"]),
                 ))
             
             logger.info("Loaded drivers from Ergast", count=len(drivers))
@@ -612,13 +826,13 @@ class ErgastDataSource(BaseDataSource):
             ''')
             
             teams = []
-            for row in cur.fetchall():
+            for row in cur:
                 teams.append(SourceTeam(
                     name=row["name"],
                     short_name=row["constructorRef"].replace("_", " ").title() if row["constructorRef"] else None,
-                    nationality=row["nationality"],
+                    nationality=intern_str(row["nationality"]),
                     wikipedia_url=row["url"],
-                    source_id=row["constructorRef"],
+                    source_id=intern_str(row["constructorRef"]),
                 ))
             
             logger.info("Loaded teams from Ergast", count=len(teams))
@@ -629,7 +843,15 @@ class ErgastDataSource(BaseDataSource):
     # =========================================================================
     
     def get_driver_by_ref(self, driver_ref: str) -> SourceDriver | None:
-        """Get a driver by their Ergast driverRef."""
+        """Get a driver by their Ergast driverRef, memoized per source instance."""
+        if driver_ref in self._driver_cache:
+            return self._driver_cache[driver_ref]
+        driver = self._fetch_driver(driver_ref)
+        self._driver_cache[driver_ref] = driver
+        return driver
+    
+    def _fetch_driver(self, driver_ref: str) -> SourceDriver | None:
+        """Query a driver by driverRef."""
         with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
             cur.execute('''
                 SELECT 
@@ -662,7 +884,15 @@ class ErgastDataSource(BaseDataSource):
             )
     
     def get_team_by_ref(self, team_ref: str) -> SourceTeam | None:
-        """Get a team by their Ergast constructorRef."""
+        """Get a team by their Ergast constructorRef, memoized per source instance."""
+        if team_ref in self._team_cache:
+            return self._team_cache[team_ref]
+        team = self._fetch_team(team_ref)
+        self._team_cache[team_ref] = team
+        return team
+    
+    def _fetch_team(self, team_ref: str) -> SourceTeam | None:
+        """Query a team by constructorRef."""
         with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
             cur.execute('''
                 SELECT 
@@ -691,17 +921,25 @@ class ErgastDataSource(BaseDataSource):
         return self.get_available_years()
     
     def count_by_year(self) -> dict[int, dict[str, int]]:
-        """Get counts of races and results by year for verification."""
+        """Get counts of races and results by year for verification.
+        
+        Results and qualifying rows are counted per race before joining, so
+        the join stays one row per race instead of results x qualifying.
+        """
         with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
             cur.execute('''
                 SELECT 
                     r.year,
-                    COUNT(DISTINCT r."raceId") as races,
-                    COUNT(DISTINCT res."resultId") as results,
-                    COUNT(DISTINCT q."qualifyId") as qualifying_results
+                    COUNT(*) as races,
+                    COALESCE(SUM(res.n), 0)::int as results,
+                    COALESCE(SUM(q.n), 0)::int as qualifying_results
                 FROM races r
-                LEFT JOIN results res ON r."raceId" = res."raceId"
-                LEFT JOIN qualifying q ON r."raceId" = q."raceId"
+                LEFT JOIN (
+                    SELECT "raceId", COUNT(*) as n FROM results GROUP BY "raceId"
+                ) res ON r."raceId" = res."raceId"
+                LEFT JOIN (
+                    SELECT "raceId", COUNT(*) as n FROM qualifying GROUP BY "raceId"
+                ) q ON r."raceId" = q."raceId"
                 GROUP BY r.year
                 ORDER BY r.year
             ''')
@@ -714,3 +952,19 @@ class ErgastDataSource(BaseDataSource):
                 }
                 for row in cur.fetchall()
             }
+    
+    def get_reference_counts(self) -> tuple[int, int, int]:
+        """Get total circuits, drivers and constructors in one query.
+        
+        Returns:
+            Tuple of (circuits, drivers, teams)
+        """
+        with self._get_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+            cur.execute('''
+                SELECT 
+                    (SELECT COUNT(*) FROM circuits) as circuits,
+                    (SELECT COUNT(*) FROM drivers) as drivers,
+                    (SELECT COUNT(*) FROM constructors) as teams
+            ''')
+            row = cur.fetchone()
+            return row["circuits"], row["drivers"], row["teams"]
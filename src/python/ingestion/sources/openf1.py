@@ -5,7 +5,12 @@ Adapts the OpenF1 API client to the BaseDataSource interface,
 transforming OpenF1-specific data models to our generic SourceXxx models.
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timezone
+from functools import lru_cache
+from typing import Any
 
 import structlog  # type: ignore
 
@@ -32,6 +37,8 @@ from ingestion.sources.base import (
     SourceSessionStatus,
     SourceSessionType,
     SourceTeam,
+    build_source_result,
+    intern_str,
 )
 
 logger = structlog.get_logger()
@@ -49,6 +56,31 @@ OPENF1_SESSION_TYPE_MAP: dict[str, SourceSessionType] = {
     "Race": SourceSessionType.RACE,
 }
 
+# OpenF1 status codes with a dedicated data source error (5xx -> DataSourceUnavailable)
+_ERROR_CLASSES: dict[int, type[DataSourceError]] = {429: DataSourceRateLimited}
+
+# Result status indexed by (dsq << 2) | (dns << 1) | dnf: DSQ outranks DNS outranks DNF
+_STATUS_BY_FLAGS: tuple[SourceResultStatus, ...] = (
+    SourceResultStatus.FINISHED,
+    SourceResultStatus.DNF,
+    SourceResultStatus.DNS,
+    SourceResultStatus.DNS,
+    SourceResultStatus.DSQ,
+    SourceResultStatus.DSQ,
+    SourceResultStatus.DSQ,
+    SourceResultStatus.DSQ,
+)
+
+
+@lru_cache(maxsize=256)
+def _build_team(team_name: str | None, team_colour: str | None) -> SourceTeam:
+    """Build a SourceTeam once per (name, colour); teammates share the instance."""
+    return SourceTeam(
+        name=intern_str(team_name) or "",
+        primary_color=f"#{team_colour}" if team_colour else None,
+        source_id=None,  # OpenF1 doesn't have team IDs
+    )
+
 
 class OpenF1DataSource(BaseDataSource):
     """OpenF1 API data source adapter.
@@ -60,12 +92,28 @@ class OpenF1DataSource(BaseDataSource):
     default_series_slug = "formula-1"
     default_series_name = "Formula 1"
     
+    # OpenF1 rate limits anonymous clients; the client retries 429s with backoff
+    max_concurrent_requests = 2
+    
     # OpenF1 has reliable data from 2023 onwards
     RELIABLE_START_YEAR = 2023
     
+    # Meetings, sessions and entrants are memoized for this long; past seasons
+    # and fully completed meetings no longer change and never expire
+    CACHE_TTL_SECONDS = 300
+    
     def __init__(self, client: OpenF1Client | None = None) -> None:
         self._client = client
         self._owns_client = False
+        # (kind, key) -> (monotonic expiry or None for permanent, converted items)
+        self._cache: dict[tuple[str, Any], tuple[float | None, list[Any]]] = {}
+        # session_key -> meeting_key (both as source ids), learned from get_sessions
+        self._session_meetings: dict[str, str] = {}
+        # Runs the fastest-lap request of the results fallback alongside the
+        # positions request; created on first use (get_results may be called
+        # from several threads, hence the lock)
+        self._fallback_pool: ThreadPoolExecutor | None = None
+        self._fallback_pool_lock = threading.Lock()
     
     def _ensure_client(self) -> OpenF1Client:
         """Ensure the API client is available."""
@@ -75,10 +123,48 @@ class OpenF1DataSource(BaseDataSource):
         return self._client
     
     def close(self) -> None:
-        """Close the API client if we own it."""
+        """Close the API client if we own it and drop memoized responses."""
+        if self._fallback_pool is not None:
+            self._fallback_pool.shutdown(wait=True)
+            self._fallback_pool = None
         if self._owns_client and self._client:
             self._client.close()
             self._client = None
+        self._cache.clear()
+    
+    def _get_fallback_pool(self) -> ThreadPoolExecutor:
+        """Get the thread pool used by the results fallback, creating it on first use."""
+        with self._fallback_pool_lock:
+            if self._fallback_pool is None:
+                self._fallback_pool = ThreadPoolExecutor(
+                    max_workers=self.max_concurrent_requests,
+                    thread_name_prefix="openf1-fallback",
+                )
+            return self._fallback_pool
+    
+    def _translate_error(self, error: OpenF1ApiError) -> DataSourceError:
+        """Map an OpenF1 client error to the matching data source error."""
+        status = error.status_code or 0
+        error_class = _ERROR_CLASSES.get(status) or (
+            DataSourceUnavailable if status >= 500 else DataSourceError
+        )
+        return error_class(error.message, self.source_name)
+    
+    def _cache_get(self, key: tuple[str, Any]) -> list[Any] | None:
+        """Return a copy of a memoized list, or None if missing or expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, items = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self._cache.pop(key, None)
+            return None
+        return list(items)
+    
+    def _cache_put(self, key: tuple[str, Any], items: list[Any], permanent: bool) -> None:
+        """Memoize a converted list, with the default TTL unless permanent."""
+        expires_at = None if permanent else time.monotonic() + self.CACHE_TTL_SECONDS
+        self._cache[key] = (expires_at, list(items))
     
     def get_available_years(self) -> list[int]:
         """Get years for which OpenF1 has data.
@@ -90,19 +176,25 @@ class OpenF1DataSource(BaseDataSource):
         return list(range(self.RELIABLE_START_YEAR, current_year + 1))
     
     def get_meetings(self, year: int) -> list[SourceMeeting]:
-        """Get all meetings for a year from OpenF1."""
+        """Get all meetings for a year from OpenF1 (memoized)."""
+        cached = self._cache_get(("meetings", year))
+        if cached is not None:
+            return cached
+        
+        meetings = self._fetch_meetings(year)
+        self._cache_put(("meetings", year), meetings, permanent=year < datetime.now(UTC).year)
+        return meetings
+    
+    def _fetch_meetings(self, year: int) -> list[SourceMeeting]:
+        """Fetch and convert the meetings for a year."""
         client = self._ensure_client()
         
         try:
             openf1_meetings = client.get_meetings(year)
         except OpenF1ApiError as e:
-            if e.status_code == 429:
-                raise DataSourceRateLimited(e.message, self.source_name) from e
-            if e.status_code and e.status_code >= 500:
-                raise DataSourceUnavailable(e.message, self.source_name) from e
-            raise DataSourceError(e.message, self.source_name) from e
+            raise self._translate_error(e) from e
         
-        return [self._convert_meeting(m) for m in openf1_meetings]
+        return list(map(self._convert_meeting, openf1_meetings))
     
     def _convert_meeting(self, meeting: OpenF1Meeting) -> SourceMeeting:
         """Convert OpenF1Meeting to SourceMeeting."""
@@ -136,33 +228,47 @@ class OpenF1DataSource(BaseDataSource):
         return None
     
     def get_sessions(self, meeting_source_id: str) -> list[SourceSession]:
-        """Get all sessions for a meeting."""
+        """Get all sessions for a meeting (memoized)."""
+        cached = self._cache_get(("sessions", meeting_source_id))
+        if cached is not None:
+            return cached
+        
+        sessions = self._fetch_sessions(meeting_source_id)
+        completed = bool(sessions) and all(
+            s.status == SourceSessionStatus.COMPLETED for s in sessions
+        )
+        self._cache_put(("sessions", meeting_source_id), sessions, permanent=completed)
+        return sessions
+    
+    def _fetch_sessions(self, meeting_source_id: str) -> list[SourceSession]:
+        """Fetch and convert the sessions for a meeting."""
         client = self._ensure_client()
         meeting_key = int(meeting_source_id)
         
         try:
             openf1_sessions = client.get_sessions_for_meeting(meeting_key)
         except OpenF1ApiError as e:
-            raise DataSourceError(e.message, self.source_name) from e
+            raise self._translate_error(e) from e
         
-        return [self._convert_session(s) for s in openf1_sessions]
+        for s in openf1_sessions:
+            self._session_meetings[str(s.session_key)] = meeting_source_id
+        now = datetime.now(UTC)
+        return [self._convert_session(s, now) for s in openf1_sessions]
     
-    def _convert_session(self, session: OpenF1SessionResponse) -> SourceSession:
-        """Convert OpenF1Session to SourceSession."""
+    def _convert_session(self, session: OpenF1SessionResponse, now: datetime) -> SourceSession:
+        """Convert OpenF1Session to SourceSession.
+        
+        ``now`` is taken once per batch by the caller; the client model has
+        already made the session times timezone-aware (UTC).
+        """
         session_type = OPENF1_SESSION_TYPE_MAP.get(
             session.session_name, SourceSessionType.RACE
         )
         
         # Determine status based on dates
-        now = datetime.now(UTC)
         date_start = session.date_start
-        if date_start.tzinfo is None:
-            date_start = date_start.replace(tzinfo=UTC)
-        
-        if session.date_end:
-            date_end = session.date_end
-            if date_end.tzinfo is None:
-                date_end = date_end.replace(tzinfo=UTC)
+        date_end = session.date_end
+        if date_end:
             if date_end < now:
                 status = SourceSessionStatus.COMPLETED
             elif date_start <= now:
@@ -175,57 +281,60 @@ class OpenF1DataSource(BaseDataSource):
         return SourceSession(
             session_type=session_type,
             start_time=date_start,
-            end_time=session.date_end,
+            end_time=date_end,
             status=status,
             source_id=str(session.session_key),
         )
     
     def get_entrants(self, meeting_source_id: str) -> list[SourceEntrant]:
-        """Get all entrants for a meeting."""
+        """Get all entrants for a meeting (memoized)."""
+        cached = self._cache_get(("entrants", meeting_source_id))
+        if cached is not None:
+            return cached
+        
+        entrants = self._fetch_entrants(meeting_source_id)
+        # The entry list is final once every session of the meeting has run
+        sessions_entry = self._cache.get(("sessions", meeting_source_id))
+        completed = sessions_entry is not None and sessions_entry[0] is None
+        self._cache_put(("entrants", meeting_source_id), entrants, permanent=completed)
+        return entrants
+    
+    def _fetch_entrants(self, meeting_source_id: str) -> list[SourceEntrant]:
+        """Fetch the drivers for a meeting and convert them to entrants."""
         client = self._ensure_client()
         meeting_key = int(meeting_source_id)
         
         try:
             openf1_drivers = client.get_drivers_for_meeting(meeting_key)
         except OpenF1ApiError as e:
-            raise DataSourceError(e.message, self.source_name) from e
+            raise self._translate_error(e) from e
         
-        entrants = []
-        for driver in openf1_drivers:
-            if not driver.team_name:
-                # Skip drivers without teams (reserve/test drivers)
-                continue
-            
-            source_driver = self._convert_driver(driver)
-            source_team = self._convert_team(driver)
-            
-            entrants.append(SourceEntrant(
-                driver=source_driver,
-                team=source_team,
+        # Drivers without teams (reserve/test drivers) are not entrants
+        return [
+            SourceEntrant(
+                driver=self._convert_driver(driver),
+                team=self._convert_team(driver),
                 car_number=driver.driver_number,
-            ))
-        
-        return entrants
+            )
+            for driver in openf1_drivers
+            if driver.team_name
+        ]
     
     def _convert_driver(self, driver: OpenF1Driver) -> SourceDriver:
         """Convert OpenF1Driver to SourceDriver."""
         return SourceDriver(
-            first_name=driver.first_name or "",
-            last_name=driver.last_name or "",
-            abbreviation=driver.name_acronym,
-            country_code=driver.country_code,
+            first_name=intern_str(driver.first_name) or "",
+            last_name=intern_str(driver.last_name) or "",
+            abbreviation=intern_str(driver.name_acronym),
+            country_code=intern_str(driver.country_code),
             driver_number=driver.driver_number,
             headshot_url=driver.headshot_url,
-            source_id=str(driver.driver_number),  # OpenF1 uses driver_number as ID
+            source_id=intern_str(str(driver.driver_number)),  # OpenF1 uses driver_number as ID
         )
     
     def _convert_team(self, driver: OpenF1Driver) -> SourceTeam:
         """Convert team info from OpenF1Driver to SourceTeam."""
-        return SourceTeam(
-            name=driver.team_name or "",
-            primary_color=f"#{driver.team_colour}" if driver.team_colour else None,
-            source_id=None,  # OpenF1 doesn't have team IDs
-        )
+        return _build_team(driver.team_name, driver.team_colour)
     
     def get_results(
         self,
@@ -240,18 +349,21 @@ class OpenF1DataSource(BaseDataSource):
         try:
             session_results = client.get_session_results(session_key)
             if session_results:
-                return [self._convert_session_result(r) for r in session_results]
+                return list(map(self._convert_session_result, session_results))
         except OpenF1ApiError:
             pass
         
-        # Fall back to positions endpoint
+        # Fall back to positions endpoint (fastest lap fetched concurrently)
+        fastest_lap_future = self._get_fallback_pool().submit(
+            client.get_fastest_lap_driver, session_key
+        )
         try:
             positions = client.get_final_positions(session_key)
-            fastest_lap_driver = client.get_fastest_lap_driver(session_key)
+            fastest_lap_driver = fastest_lap_future.result()
             
             results = []
             for driver_number, position in positions.items():
-                results.append(SourceResult(
+                results.append(build_source_result(
                     position=position,
                     status=SourceResultStatus.FINISHED,
                     driver_number=driver_number,
@@ -263,35 +375,55 @@ class OpenF1DataSource(BaseDataSource):
             logger.warning("Failed to get results", session_key=session_key, error=e.message)
             return []
     
-    def _convert_session_result(self, result: OpenF1SessionResult) -> SourceResult:
-        """Convert OpenF1SessionResult to SourceResult."""
-        # Determine status
-        if result.dsq:
-            status = SourceResultStatus.DSQ
-        elif result.dns:
-            status = SourceResultStatus.DNS
-        elif result.dnf:
-            status = SourceResultStatus.DNF
-        else:
-            status = SourceResultStatus.FINISHED
+    def get_results_for_meeting(self, meeting_source_id: str) -> dict[str, list[SourceResult]]:
+        """Get results for every session of a meeting with a single request.
         
-        # Handle duration (can be single value or array for qualifying)
-        time_ms = None
-        if result.duration is not None:
-            if isinstance(result.duration, list):
-                # For qualifying, take the best time (last non-None Q time)
-                for t in reversed(result.duration):
-                    if t is not None:
-                        time_ms = int(t * 1000)
-                        break
-            else:
-                time_ms = int(result.duration * 1000)
+        Returns:
+            Results keyed by session source ID (sessions without results are omitted)
+        """
+        client = self._ensure_client()
+        
+        results: dict[str, list[SourceResult]] = {}
+        for result in client.get_session_results_for_meeting(int(meeting_source_id)):
+            results.setdefault(str(result.session_key), []).append(
+                self._convert_session_result(result)
+            )
+        return results
+    
+    def get_results_batch(
+        self,
+        sessions: list[tuple[str, SourceSessionType]],
+    ) -> dict[str, list[SourceResult]]:
+        """Get results for many sessions with one request per meeting.
+        
+        Sessions whose meeting is known (from get_sessions) are fetched with
+        get_results_for_meeting; any session missing from that response, or
+        whose meeting is unknown, goes through get_results and its fallbacks.
+        """
+        by_meeting: dict[str, list[str]] = {}
+        for session_source_id, _ in sessions:
+            meeting_source_id = self._session_meetings.get(session_source_id)
+            if meeting_source_id is not None:
+                by_meeting.setdefault(meeting_source_id, []).append(session_source_id)
         
-        return SourceResult(
+        results: dict[str, list[SourceResult]] = {}
+        for meeting_source_id, session_ids in by_meeting.items():
+            meeting_results = self.get_results_for_meeting(meeting_source_id)
+            for session_source_id in session_ids:
+                if session_results := meeting_results.get(session_source_id):
+                    results[session_source_id] = session_results
+        
+        remaining = [session for session in sessions if session[0] not in results]
+        results.update(super().get_results_batch(remaining))
+        return results
+    
+    def _convert_session_result(self, result: OpenF1SessionResult) -> SourceResult:
+        """Convert OpenF1SessionResult to SourceResult."""
+        return build_source_result(
             position=result.position,
-            status=status,
+            status=_STATUS_BY_FLAGS[(result.dsq << 2) | (result.dns << 1) | result.dnf],
             laps=result.number_of_laps,
-            time_milliseconds=time_ms,
+            time_milliseconds=result.best_time_ms,
             driver_number=result.driver_number,
             car_number=str(result.driver_number) if result.driver_number else None,
         )
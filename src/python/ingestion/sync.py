@@ -5,7 +5,7 @@ Orchestrates fetching data from OpenF1 API and storing it in the database.
 This is the core of the data ingestion pipeline.
 """
 
-import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -99,12 +99,14 @@ class SyncOptions:
     
     # What to sync
     include_results: bool = True
+    skip_unchanged: bool = False  # Skip sessions/entrants for meetings whose round is unchanged
     
     # Role detection
     detect_roles: bool = True  # Run role detection after sync
     
     # Logging verbosity
     log_skipped_updates: bool = True  # Log when updates are skipped
+    verbose: bool = False             # Log per-meeting circuit/session/result detail
     
     def __post_init__(self):
         """Validate options."""
@@ -192,6 +194,11 @@ class OpenF1SyncService:
     - Tracks historical aliases for name/number changes
     """
 
+    # Concurrent meeting prefetches in sync_year; kept low for OpenF1's rate limit
+    PREFETCH_WORKERS = 2
+    # Queued results are written early once this many have accumulated
+    RESULTS_FLUSH_SIZE = 1000
+
     def __init__(
         self,
         api_client: OpenF1Client | None = None,
@@ -209,6 +216,9 @@ class OpenF1SyncService:
         self._driver_cache: dict[int, UUID] = {}  # driver_number -> driver_id
         self._team_cache: dict[str, UUID] = {}  # slug -> team_id
 
+        # Results queued across sessions and written in one bulk upsert
+        self._pending_results: list[Result] = []
+
     def _ensure_clients(self) -> tuple[OpenF1Client, RacingRepository]:
         """Ensure API client and repository are available."""
         if self._api_client is None:
@@ -226,7 +236,9 @@ class OpenF1SyncService:
         return self._api_client, self._repository
 
     def close(self) -> None:
-        """Close owned clients."""
+        """Write any queued results and close owned clients."""
+        if self._pending_results and self._repository:
+            self._flush_results(self._repository)
         if self._owns_clients:
             if self._api_client:
                 self._api_client.close()
@@ -717,39 +729,53 @@ class OpenF1SyncService:
         # Calculate round numbers: 0 for pre-season testing, 1-N for races
         round_number_map = self._calculate_round_numbers(sorted_meetings)
 
-        for i, meeting in enumerate(sorted_meetings, 1):
-            meeting_name = meeting.meeting_name
-            round_number = round_number_map.get(meeting.meeting_key, i)
-            
-            # Determine if this is testing or a race weekend
-            meeting_type = "Testing" if round_number == 0 else f"Round {round_number}"
-            print(f"\n  🏎️  [{i}/{len(sorted_meetings)}] {meeting_name} ({meeting_type})")
-            
-            try:
-                self._sync_meeting(
-                    api, repo, meeting, season_id, include_results, stats, round_number, options
-                )
-                stats["meetings_synced"] += 1
-                logger.info(
-                    "Synced meeting",
-                    meeting=meeting.meeting_name,
-                    round_number=round_number,
-                    progress=f"{i}/{len(sorted_meetings)}",
-                )
+        # Fetch every meeting's sessions, drivers and (if requested) results
+        # ahead of time, a couple of meetings at a time, so the requests for
+        # the next meetings run while the current one is written to the database.
+        # PREFETCH_WORKERS also bounds the request rate; the client retries 429s.
+        prefetch_pool = ThreadPoolExecutor(
+            max_workers=self.PREFETCH_WORKERS, thread_name_prefix="openf1-prefetch"
+        )
+        prefetched = {
+            meeting.meeting_key: prefetch_pool.submit(
+                self._fetch_meeting_entities, api, meeting.meeting_key, include_results
+            )
+            for meeting in sorted_meetings
+        }
+
+        try:
+            for i, meeting in enumerate(sorted_meetings, 1):
+                meeting_name = meeting.meeting_name
+                round_number = round_number_map.get(meeting.meeting_key, i)
                 
-                # Rate limiting: small pause between meetings to avoid hammering the API
-                # Skip pause after the last meeting
-                if i < len(sorted_meetings):
-                    time.sleep(1.0)
-                    
-            except Exception as e:
-                print(f"      ❌ Error: {e}")
-                logger.error(
-                    "Failed to sync meeting",
-                    meeting=meeting.meeting_name,
-                    error=str(e),
-                )
-                stats["errors"].append(f"Meeting {meeting.meeting_name}: {e}")
+                # Determine if this is testing or a race weekend
+                meeting_type = "Testing" if round_number == 0 else f"Round {round_number}"
+                print(f"\n  🏎️  [{i}/{len(sorted_meetings)}] {meeting_name} ({meeting_type})")
+                
+                try:
+                    self._sync_meeting(
+                        api, repo, meeting, season_id, include_results, stats, round_number,
+                        options, prefetched=prefetched[meeting.meeting_key],
+                    )
+                    stats["meetings_synced"] += 1
+                    logger.info(
+                        "Synced meeting",
+                        meeting=meeting.meeting_name,
+                        round_number=round_number,
+                        progress=f"{i}/{len(sorted_meetings)}",
+                    )
+
+                except Exception as e:
+                    print(f"      ❌ Error: {e}")
+                    logger.error(
+                        "Failed to sync meeting",
+                        meeting=meeting.meeting_name,
+                        error=str(e),
+                    )
+                    stats["errors"].append(f"Meeting {meeting.meeting_name}: {e}")
+        finally:
+            # Drop the queued prefetches if the loop is interrupted
+            prefetch_pool.shutdown(wait=True, cancel_futures=True)
 
         # Run role detection if enabled and results were synced
         if options.detect_roles and include_results:
@@ -797,6 +823,25 @@ class OpenF1SyncService:
         
         return changed_count
 
+    def _fetch_meeting_entities(
+        self, api: OpenF1Client, meeting_key: int, include_results: bool = False
+    ) -> tuple[list[OpenF1Session], list[OpenF1Driver], dict[int, list[OpenF1SessionResult]]]:
+        """Fetch a meeting's sessions and (if it has any) its drivers.
+
+        With include_results, the session results of the whole meeting are
+        fetched in one request as well, grouped by session_key. Sessions
+        missing from that response fall back to a per-session request.
+        """
+        sessions = api.get_sessions_for_meeting(meeting_key)
+        drivers = api.get_drivers_for_meeting(meeting_key) if sessions else []
+        results_by_session: dict[int, list[OpenF1SessionResult]] = {}
+        if include_results and any(
+            self._determine_session_status(s) == SessionStatus.COMPLETED for s in sessions
+        ):
+            for result in api.get_session_results_for_meeting(meeting_key):
+                results_by_session.setdefault(result.session_key, []).append(result)
+        return sessions, drivers, results_by_session
+
     def _sync_meeting(
         self,
         api: OpenF1Client,
@@ -807,6 +852,9 @@ class OpenF1SyncService:
         stats: dict,
         round_number: int,
         options: SyncOptions | None = None,
+        prefetched: Future[
+            tuple[list[OpenF1Session], list[OpenF1Driver], dict[int, list[OpenF1SessionResult]]]
+        ] | None = None,
     ) -> None:
         """Sync a single meeting (race weekend).
         
@@ -819,6 +867,7 @@ class OpenF1SyncService:
             stats: Statistics dictionary to update
             round_number: Round number in the season
             options: SyncOptions controlling entity update behavior
+            prefetched: Pending (sessions, drivers, results) fetch started by sync_year
         """
         options = options or SyncOptions()
         
@@ -845,17 +894,24 @@ class OpenF1SyncService:
         )
         round_id = repo.upsert_round(round_)
 
-        # Fetch sessions for this meeting
-        sessions = api.get_sessions_for_meeting(meeting.meeting_key)
+        # Fetch sessions (and drivers and results) for this meeting
+        if prefetched is None:
+            sessions, drivers, results_by_session = self._fetch_meeting_entities(
+                api, meeting.meeting_key, include_results
+            )
+        else:
+            sessions, drivers, results_by_session = prefetched.result()
         print(f"      📅 Sessions: {len(sessions)}")
 
         # Track entrants for this round (driver_number -> entrant_id)
         entrant_map: dict[int, UUID] = {}
 
-        # First, sync drivers and teams from first session with driver data
+        # First, sync drivers and teams from first session with driver data.
+        # Drivers and teams are resolved one by one (the service caches make
+        # repeats free); their entrants are written in one batch per meeting.
         if sessions:
-            drivers = api.get_drivers_for_meeting(meeting.meeting_key)
-            driver_count = 0
+            entrants: list[Entrant] = []
+            entrant_numbers: list[int] = []
             for driver_data in drivers:
                 # Skip drivers without teams (reserve/test drivers not competing)
                 if not driver_data.team_name:
@@ -873,18 +929,21 @@ class OpenF1SyncService:
                 assert team_id is not None
 
                 # Create entrant linking driver to team for this round
-                entrant = Entrant(
-                    round_id=round_id,
-                    driver_id=driver_id,
-                    team_id=team_id,
+                entrants.append(
+                    Entrant(
+                        round_id=round_id,
+                        driver_id=driver_id,
+                        team_id=team_id,
+                    )
                 )
-                entrant_id = repo.upsert_entrant(entrant)
-                entrant_map[driver_data.driver_number] = entrant_id
-                stats["drivers_synced"] += 1
-                driver_count += 1
+                entrant_numbers.append(driver_data.driver_number)
 
+            entrant_map.update(
+                zip(entrant_numbers, repo.bulk_upsert_entrants(entrants), strict=True)
+            )
+            stats["drivers_synced"] += len(entrants)
             stats["teams_synced"] = len(self._team_cache)
-            print(f"      👥 Drivers: {driver_count}")
+            print(f"      👥 Drivers: {len(entrants)}")
 
         # Sync sessions
         session_names = []
@@ -905,10 +964,13 @@ class OpenF1SyncService:
             if include_results and session.status == SessionStatus.COMPLETED:
                 prev_results = stats["results_synced"]
                 self._sync_session_results(
-                    api, repo, openf1_session, session_id, round_id, entrant_map, stats
+                    api, repo, openf1_session, session_id, round_id, entrant_map, stats,
+                    session_results=results_by_session.get(openf1_session.session_key),
                 )
                 results_count += stats["results_synced"] - prev_results
         
+        self._flush_results(repo, stats)
+
         # Print session summary on one line
         print(f"      🏁 Sessions synced: {', '.join(session_names)}")
         if include_results and results_count > 0:
@@ -923,17 +985,20 @@ class OpenF1SyncService:
         round_id: UUID,
         entrant_map: dict[int, UUID],
         stats: dict,
+        session_results: list[OpenF1SessionResult] | None = None,
     ) -> None:
         """Sync results for a completed session.
 
         ⚠️ SPOILER DATA - This fetches and stores race results.
         
         Uses the session_result endpoint (beta) for comprehensive data,
-        falls back to position endpoint if unavailable.
+        falls back to position endpoint if unavailable. session_results
+        that were already fetched with the meeting skip the request.
         """
         try:
             # Try the session_result endpoint first (has DNF/DNS/DSQ data)
-            session_results = api.get_session_results(openf1_session.session_key)
+            if not session_results:
+                session_results = api.get_session_results(openf1_session.session_key)
             
             if session_results:
                 results = self._process_session_results(
@@ -946,13 +1011,15 @@ class OpenF1SyncService:
                 )
 
             if results:
-                repo.bulk_upsert_results(results)
+                self._pending_results.extend(results)
                 stats["results_synced"] += len(results)
                 logger.debug(
-                    "Synced results",
+                    "Queued results",
                     session=openf1_session.session_name,
                     count=len(results),
                 )
+                if len(self._pending_results) >= self.RESULTS_FLUSH_SIZE:
+                    self._flush_results(repo, stats)
 
         except Exception as e:
             logger.warning(
@@ -961,6 +1028,25 @@ class OpenF1SyncService:
                 error=str(e),
             )
 
+    def _flush_results(self, repo: RacingRepository, stats: dict | None = None) -> None:
+        """Write all queued results in one bulk upsert.
+
+        ⚠️ SPOILER DATA - This stores race results.
+
+        On failure the results are dropped from results_synced and the
+        error is recorded, as results were counted when they were queued.
+        """
+        if not self._pending_results:
+            return
+        results, self._pending_results = self._pending_results, []
+        try:
+            repo.bulk_upsert_results(results)
+        except Exception as e:
+            logger.warning("Failed to write results", count=len(results), error=str(e))
+            if stats is not None:
+                stats["results_synced"] -= len(results)
+                stats["errors"].append(f"Writing {len(results)} results: {e}")
+
     def _process_session_results(
         self,
         session_results: list[OpenF1SessionResult],
@@ -1088,24 +1174,12 @@ class OpenF1SyncService:
                         )
                         continue
             
-            # Handle duration - can be a single value or array for qualifying
-            time_ms = None
-            if sr.duration is not None:
-                if isinstance(sr.duration, list):
-                    # For qualifying, take the best time (last non-None Q time)
-                    for t in reversed(sr.duration):
-                        if t is not None:
-                            time_ms = int(t * 1000)
-                            break
-                else:
-                    time_ms = int(sr.duration * 1000)
-            
             result = Result(
                 session_id=session_id,
                 entrant_id=entrant_id,
                 position=sr.position,
                 status=status,
-                time_milliseconds=time_ms,
+                time_milliseconds=sr.best_time_ms,
                 laps=sr.number_of_laps,
                 fastest_lap=False,  # Will be updated below if applicable
                 car_number=str(sr.driver_number) if sr.driver_number else None,
@@ -1372,6 +1446,8 @@ class OpenF1SyncService:
                 logger.warning("Failed to sync results for session", error=error_msg)
                 stats["errors"].append(error_msg)
         
+        self._flush_results(repo, stats)
+        
         print(f"\n  ✅ Results sync complete:")
         print(f"      Sessions checked: {stats['sessions_checked']}")
         print(f"      Already had results: {stats['sessions_with_existing_results']}")
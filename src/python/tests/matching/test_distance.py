@@ -13,6 +13,7 @@ from ingestion.matching.distance import (
     geo_distance_km,
     coordinate_proximity_score,
     containment_score,
+    LevenshteinTrie,
 )
 
 
@@ -201,3 +202,35 @@ class TestContainmentScore:
     
     def test_empty_string(self) -> None:
         assert containment_score("", "Hello") == 0.0
+
+
+class TestLevenshteinTrie:
+    """Tests for bounded Levenshtein search over a trie."""
+    
+    @pytest.fixture
+    def trie(self) -> LevenshteinTrie:
+        trie = LevenshteinTrie()
+        for i, name in enumerate(["nico hulkenberg", "nico rosberg", "keke rosberg", "max verstappen"]):
+            trie.insert(name, i)
+        return trie
+    
+    def test_exact_match(self, trie: LevenshteinTrie) -> None:
+        assert trie.search("nico rosberg", max_distance=0) == [("nico rosberg", 1, 0)]
+    
+    def test_within_bound(self, trie: LevenshteinTrie) -> None:
+        assert trie.search("nico hulkenburg", max_distance=2) == [("nico hulkenberg", 0, 1)]
+    
+    def test_outside_bound(self, trie: LevenshteinTrie) -> None:
+        assert trie.search("lewis hamilton", max_distance=2) == []
+    
+    def test_sorted_by_distance(self, trie: LevenshteinTrie) -> None:
+        matches = trie.search("nico rosberg", max_distance=4)
+        assert [m[0] for m in matches] == ["nico rosberg", "keke rosberg"]
+    
+    def test_agrees_with_levenshtein_distance(self, trie: LevenshteinTrie) -> None:
+        for key, _, distance in trie.search("mick verstappen", max_distance=5):
+            assert distance == levenshtein_distance("mick verstappen", key)
+    
+    def test_len(self, trie: LevenshteinTrie) -> None:
+        trie.insert("max verstappen", 9)
+        assert len(trie) == 4
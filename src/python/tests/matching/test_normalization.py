@@ -6,6 +6,8 @@ import pytest
 
 from ingestion.matching.normalization import (
     normalize_name,
+    normalize_name_variants,
+    normalize_names,
     normalize_for_slug,
     strip_sponsor_text,
     normalize_grand_prix,
@@ -56,6 +58,46 @@ class TestNormalizeName:
     def test_already_normalized(self) -> None:
         """Already ASCII should be unchanged."""
         assert normalize_name("max verstappen") == "max verstappen"
+    
+    def test_letters_without_decomposition(self) -> None:
+        """ß and ø have no NFD decomposition and are mapped explicitly."""
+        assert normalize_name("Tom Kristensen Ørsted") == "tom kristensen orsted"
+        assert normalize_name("Großer Preis") == "grosser preis"
+    
+    def test_precomposed_and_combining_forms_match(self) -> None:
+        """Combining-mark input falls back to NFD and matches precomposed input."""
+        assert normalize_name("Pe\u0301rez") == normalize_name("Pérez") == "perez"
+
+
+class TestNormalizeNames:
+    """Tests for batch normalization."""
+    
+    def test_matches_per_name_normalization(self) -> None:
+        names = ["Nico Hülkenberg", "  Max Verstappen ", "Pe\u0301rez", "Großer", ""]
+        assert normalize_names(names) == [normalize_name(n) for n in names]
+    
+    def test_empty_batch(self) -> None:
+        assert normalize_names([]) == []
+
+
+class TestNormalizeNameVariants:
+    """Tests for spelling-variant normalization."""
+    
+    def test_wladimir_ustinow(self) -> None:
+        assert normalize_name_variants("Wladimir Ustinow") == "vladimir ustinov"
+        assert normalize_name_variants("Vladimir Ustinov") == "vladimir ustinov"
+    
+    def test_ph_and_f(self) -> None:
+        assert normalize_name_variants("Ralph") == normalize_name_variants("Ralf")
+    
+    def test_doubled_consonants(self) -> None:
+        assert normalize_name_variants("Kimi Räikkönen") == "kimi raikonen"
+    
+    def test_ck_and_k(self) -> None:
+        assert normalize_name_variants("Jacky Ickx") == normalize_name_variants("Jaky Ikx")
+    
+    def test_ou_and_u(self) -> None:
+        assert normalize_name_variants("Stroud") == normalize_name_variants("Strud")
 
 
 class TestNormalizeForSlug:
@@ -791,6 +791,38 @@ class TestCircuitResolution:
         assert not result.is_new
         assert result.existing_id == existing.id
 
+    def test_resolve_circuit_fuzzy_match_typo(self, mock_repository):
+        """Should fuzzy match a slug within the edit-distance threshold."""
+        other = Circuit(
+            id=uuid4(),
+            name="Circuit Zandvoort",
+            slug="circuit-zandvoort",
+            location="Zandvoort",
+            country="Netherlands",
+        )
+        existing = Circuit(
+            id=uuid4(),
+            name="Suzuka Circuit",
+            slug="suzuka-circuit",
+            location="Suzuka",
+            country="Japan",
+        )
+
+        mock_repository.get_all_circuits.return_value = [other, existing]
+        mock_repository.get_all_circuit_aliases.return_value = []
+
+        resolver = EntityResolver(repository=mock_repository)
+
+        # "Suzuka Circiut" is two edits from "Suzuka Circuit"
+        result = resolver.resolve_circuit(
+            name="Suzuka Circiut",
+            location="Suzuka",
+            country="Japan",
+        )
+
+        assert not result.is_new
+        assert result.existing_id == existing.id
+
     def test_resolve_circuit_adds_alias_for_variant(self, resolver_with_circuits):
         """Should add alias when incoming name differs from canonical."""
         resolver, circuits = resolver_with_circuits
@@ -853,6 +885,46 @@ class TestLevenshteinDistance:
         assert EntityResolver._levenshtein_distance("kitten", "sitting") == 3
 
 
+class TestPrime:
+    """Tests for priming the resolver's in-memory indexes."""
+
+    def test_prime_loads_once(self, mock_repository):
+        """Priming twice should only query the database once."""
+        resolver = EntityResolver(repository=mock_repository)
+        resolver.prime()
+        resolver.prime()
+        resolver.resolve_team(name="Ferrari")
+
+        mock_repository.get_all_drivers.assert_called_once()
+        mock_repository.get_all_teams.assert_called_once()
+
+    def test_matches_team_by_normalized_name(self, mock_repository):
+        """Accented names slugify differently but should still match."""
+        ligier = Team(id=uuid4(), name="Équipe Ligier", slug=slugify("Équipe Ligier"))
+        mock_repository.get_all_teams.return_value = [ligier]
+        resolver = EntityResolver(repository=mock_repository)
+        resolver.prime()
+
+        result = resolver.resolve_team(name="Equipe Ligier")
+
+        assert not result.is_new
+        assert result.existing_id == ligier.id
+
+    def test_matches_driver_by_normalized_alias(self, resolver_with_drivers):
+        """Alias names are indexed by normalized name too."""
+        resolver, drivers = resolver_with_drivers
+
+        result = resolver.resolve_driver(
+            full_name="Kimi Antonélli",
+            first_name=None,
+            last_name=None,
+            driver_number=None,
+        )
+
+        assert not result.is_new
+        assert result.existing_id == drivers["antonelli"].id
+
+
 class TestCacheManagement:
     """Tests for cache management in EntityResolver."""
 
@@ -1,13 +1,18 @@
 """Tests for the OpenF1 API client."""
 
+import json
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
+
 from ingestion.clients.openf1 import (
     OpenF1Client,
     OpenF1Driver,
     OpenF1Meeting,
     OpenF1Session,
+    OpenF1SessionResult,
 )
 
 # Sample API responses for mocking
@@ -124,6 +129,20 @@ MOCK_POSITIONS_RESPONSE = [
 ]
 
 
+def _etag_transport(
+    body: list[dict], etag: str, requests: list[httpx.Request]
+) -> httpx.MockTransport:
+    """Transport serving body with an ETag, answering 304 when the client sends it back."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        return httpx.Response(200, json=body, headers={"ETag": etag})
+
+    return httpx.MockTransport(handler)
+
+
 class TestOpenF1Client:
     """Tests for OpenF1Client."""
 
@@ -132,7 +151,7 @@ class TestOpenF1Client:
         """Test fetching meetings for a year."""
         mock_client = MagicMock()
         mock_response = MagicMock()
-        mock_response.json.return_value = MOCK_MEETINGS_RESPONSE
+        mock_response.content = json.dumps(MOCK_MEETINGS_RESPONSE).encode()
         mock_response.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_response
         mock_client_class.return_value = mock_client
@@ -151,7 +170,7 @@ class TestOpenF1Client:
         """Test fetching sessions for a year."""
         mock_client = MagicMock()
         mock_response = MagicMock()
-        mock_response.json.return_value = MOCK_SESSIONS_RESPONSE
+        mock_response.content = json.dumps(MOCK_SESSIONS_RESPONSE).encode()
         mock_response.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_response
         mock_client_class.return_value = mock_client
@@ -169,7 +188,7 @@ class TestOpenF1Client:
         """Test fetching sessions filtered by type."""
         mock_client = MagicMock()
         mock_response = MagicMock()
-        mock_response.json.return_value = [MOCK_SESSIONS_RESPONSE[0]]  # Only race
+        mock_response.content = json.dumps([MOCK_SESSIONS_RESPONSE[0]]).encode()  # Only race
         mock_response.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_response
         mock_client_class.return_value = mock_client
@@ -188,7 +207,7 @@ class TestOpenF1Client:
         """Test fetching drivers for a session."""
         mock_client = MagicMock()
         mock_response = MagicMock()
-        mock_response.json.return_value = MOCK_DRIVERS_RESPONSE
+        mock_response.content = json.dumps(MOCK_DRIVERS_RESPONSE).encode()
         mock_response.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_response
         mock_client_class.return_value = mock_client
@@ -208,7 +227,7 @@ class TestOpenF1Client:
         """Test getting final positions from position data."""
         mock_client = MagicMock()
         mock_response = MagicMock()
-        mock_response.json.return_value = MOCK_POSITIONS_RESPONSE
+        mock_response.content = json.dumps(MOCK_POSITIONS_RESPONSE).encode()
         mock_response.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_response
         mock_client_class.return_value = mock_client
@@ -227,7 +246,7 @@ class TestOpenF1Client:
         mock_client = MagicMock()
         mock_response = MagicMock()
         duplicate_drivers = MOCK_DRIVERS_RESPONSE + [MOCK_DRIVERS_RESPONSE[0]]
-        mock_response.json.return_value = duplicate_drivers
+        mock_response.content = json.dumps(duplicate_drivers).encode()
         mock_response.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_response
         mock_client_class.return_value = mock_client
@@ -238,6 +257,87 @@ class TestOpenF1Client:
         # Should deduplicate - only 2 unique drivers
         assert len(drivers) == 2
 
+    @patch("ingestion.clients.openf1.httpx.Client")
+    def test_get_session_results_for_meeting(self, mock_client_class: MagicMock) -> None:
+        """Test fetching every session's results for a meeting in one request."""
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.content = json.dumps([
+            {"session_key": 9472, "meeting_key": 1229, "driver_number": 1, "position": 1},
+            {"session_key": 9471, "meeting_key": 1229, "driver_number": 1, "position": 1},
+        ]).encode()
+        mock_response.raise_for_status = MagicMock()
+        mock_client.get.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        with OpenF1Client() as client:
+            results = client.get_session_results_for_meeting(1229)
+
+        mock_client.get.assert_called_once_with("/session_result", params={"meeting_key": 1229})
+        assert [r.session_key for r in results] == [9472, 9471]
+
+    @patch("ingestion.clients.openf1.httpx.Client")
+    def test_cache_serves_past_seasons_from_disk(
+        self, mock_client_class: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that a past season's response is only fetched once."""
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.content = json.dumps(MOCK_MEETINGS_RESPONSE).encode()
+        mock_response.headers = httpx.Headers()
+        mock_client.get.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        with OpenF1Client(cache_dir=tmp_path) as client:
+            first = client.get_meetings(2020)
+        with OpenF1Client(cache_dir=tmp_path) as client:
+            second = client.get_meetings(2020)
+
+        assert mock_client.get.call_count == 1
+        assert first == second
+
+    def test_cache_revalidates_stale_entries(self, tmp_path: Path) -> None:
+        """Test that a stale entry is revalidated with its ETag and reused on 304."""
+        requests: list[httpx.Request] = []
+        transport = _etag_transport(MOCK_DRIVERS_RESPONSE, '"v1"', requests)
+
+        with patch("ingestion.clients.openf1.httpx.HTTPTransport", return_value=transport):
+            with OpenF1Client(cache_dir=tmp_path) as client:
+                client._cache.ttl_seconds = 0  # Every entry is immediately stale
+                first = client.get_drivers(9472)
+                second = client.get_drivers(9472)
+
+        assert [r.headers.get("If-None-Match") for r in requests] == [None, '"v1"']
+        assert first == second
+
+    def test_conditional_get_without_cache_dir(self) -> None:
+        """Test that repeat requests are revalidated in memory when no cache dir is set."""
+        requests: list[httpx.Request] = []
+        transport = _etag_transport(MOCK_MEETINGS_RESPONSE, '"m1"', requests)
+
+        with patch("ingestion.clients.openf1.httpx.HTTPTransport", return_value=transport):
+            with OpenF1Client() as client:
+                first = client.get_meetings(9999)
+                second = client.get_meetings(9999)
+
+        assert [r.headers.get("If-None-Match") for r in requests] == [None, '"m1"']
+        assert first == second
+
+    def test_session_results_survive_revalidation_without_cache_dir(self) -> None:
+        """Test that a 304 on the beta results endpoint reuses the results, not []."""
+        body = [{"session_key": 9472, "meeting_key": 1229, "driver_number": 1, "position": 1}]
+        requests: list[httpx.Request] = []
+        transport = _etag_transport(body, '"r1"', requests)
+
+        with patch("ingestion.clients.openf1.httpx.HTTPTransport", return_value=transport):
+            with OpenF1Client() as client:
+                first = client.get_session_results(9472)
+                second = client.get_session_results(9472)
+
+        assert len(requests) == 2
+        assert [r.driver_number for r in second] == [1]
+        assert first == second
+
 
 class TestOpenF1Models:
     """Tests for OpenF1 Pydantic models."""
@@ -282,3 +382,13 @@ class TestOpenF1Models:
         assert driver.first_name is None
         assert driver.last_name is None
         assert driver.headshot_url is None
+
+    def test_session_result_best_time(self) -> None:
+        """Test OpenF1SessionResult resolves scalar and qualifying durations."""
+        base = {"session_key": 9472, "meeting_key": 1229, "driver_number": 1}
+        race = OpenF1SessionResult(**base, duration=5504.742)
+        quali = OpenF1SessionResult(**base, duration=[90.1, 89.5, None])
+        no_time = OpenF1SessionResult(**base, duration=[None, None, None])
+        assert race.best_time_ms == 5504742
+        assert quali.best_time_ms == 89500
+        assert no_time.best_time_ms is None
@@ -11,6 +11,7 @@ from ingestion.clients.openf1 import (
     OpenF1Driver,
     OpenF1Meeting,
     OpenF1Session,
+    OpenF1SessionResult,
 )
 from ingestion.models import (
     Series,
@@ -369,7 +370,7 @@ class TestSyncServiceIntegration:
         repo.upsert_team.return_value = uuid4()
         repo.upsert_round.return_value = uuid4()
         repo.upsert_session.return_value = uuid4()
-        repo.upsert_entrant.return_value = uuid4()
+        repo.bulk_upsert_entrants.side_effect = lambda entrants: [uuid4() for _ in entrants]
         repo.get_entrant_by_driver_number.return_value = None
         repo.bulk_upsert_results.return_value = []
 
@@ -394,6 +395,51 @@ class TestSyncServiceIntegration:
         # Verify API was called correctly
         api.get_meetings.assert_called_once_with(2024)
         api.get_sessions_for_meeting.assert_called_once_with(mock_meeting.meeting_key)
+        repo.bulk_upsert_entrants.assert_called_once()
+
+    def test_sync_year_prefetches_meeting_results(
+        self,
+        mock_meeting: OpenF1Meeting,
+        mock_sessions: list[OpenF1Session],
+        mock_drivers: list[OpenF1Driver],
+    ) -> None:
+        """Test results come from one meeting-level request, with per-session fallback."""
+        repo = MagicMock(spec=RacingRepository)
+        repo.get_series_by_slug.return_value = None
+        repo.get_season.return_value = None
+        repo.get_circuit_by_slug.return_value = None
+        repo.get_driver_by_slug.return_value = None
+        repo.get_team_by_slug.return_value = None
+        repo.get_entrant_by_driver_number.return_value = None
+        for method in (
+            "upsert_series", "upsert_season", "upsert_circuit", "upsert_driver",
+            "upsert_team", "upsert_round", "upsert_session",
+        ):
+            getattr(repo, method).return_value = uuid4()
+        repo.bulk_upsert_entrants.side_effect = lambda entrants: [uuid4() for _ in entrants]
+
+        api = MagicMock(spec=OpenF1Client)
+        api.get_meetings.return_value = [mock_meeting]
+        api.get_sessions_for_meeting.return_value = mock_sessions
+        api.get_drivers_for_meeting.return_value = mock_drivers
+        api.get_session_results_for_meeting.return_value = [
+            OpenF1SessionResult(
+                session_key=9472, meeting_key=mock_meeting.meeting_key,
+                driver_number=1, position=1, duration=5504.742,
+            ),
+        ]
+        api.get_session_results.return_value = []
+        api.get_final_positions.return_value = {}
+
+        service = OpenF1SyncService(api_client=api, repository=repo)
+        service.sync_year(2024, include_results=True)
+
+        api.get_session_results_for_meeting.assert_called_once_with(mock_meeting.meeting_key)
+        fetched = {call.args[0] for call in api.get_session_results.call_args_list}
+        assert fetched == {9470, 9471}
+        # Results of every session are written in one bulk upsert per meeting
+        repo.bulk_upsert_results.assert_called_once()
+        assert service._pending_results == []
 
 
 class TestCalculateRoundNumbers: